@@ -1,11 +1,121 @@
 import contextlib
 import re
 
-from playwright.sync_api import Locator, expect
+from playwright.sync_api import Locator
+from utils.bridge import expect
 from utils.strings import matches
+from utils.timing import record_retry
+
+# Finds an option in the open dropdown of `root` and clicks it, scrolling
+# through virtualized lists (only the rows in view are in the DOM) a page at a
+# time. Options are compared to `label` exactly, or else matched against the
+# pattern from their start. Resolves with the selection once the click is
+# handled, or with every label seen when nothing matched. An empty list is
+# waited on for up to `timeout` ms, in case the options are still loading.
+PICK_SCRIPT = """async (root, { label, source, ignoreCase, timeout }) => {
+    const frame = () => new Promise(
+        r => requestAnimationFrame(() => requestAnimationFrame(r))
+    );
+    const text = (option) => (
+        option.querySelector(".ant-select-item-option-content") ?? option
+    ).textContent.trim();
+
+    let test = (t) => t === label;
+    if (label === null) {
+        try {
+            const re = new RegExp(`^(?:${source})`, ignoreCase ? "i" : "");
+            test = (t) => re.test(t);
+        } catch {
+            // python-only syntax, the caller matches the labels itself
+            test = () => false;
+        }
+    }
+
+    const input = root.querySelector("input");
+    const listbox = input
+        && document.getElementById(input.getAttribute("aria-controls"));
+    const dropdown = () => listbox?.closest(".ant-select-dropdown") ?? Array.from(
+        document.querySelectorAll(".ant-select-dropdown:not(.ant-select-dropdown-hidden)")
+    ).find(d => d.getClientRects().length);
+
+    const start = performance.now();
+
+    while (true) {
+        const list = dropdown();
+        const holder = list?.querySelector(".rc-virtual-list-holder");
+        const seen = new Set();
+
+        if (holder) {
+            holder.scrollTop = 0;
+            await frame();
+        }
+
+        while (list) {
+            for (const option of list.querySelectorAll(".ant-select-item-option")) {
+                const t = text(option);
+
+                const disabled = option.classList.contains(
+                    "ant-select-item-option-disabled"
+                );
+
+                if (test(t) && !disabled) {
+                    option.scrollIntoView({ block: "nearest" });
+                    for (const type of ["mousedown", "mouseup", "click"]) {
+                        option.dispatchEvent(new MouseEvent(
+                            type, { bubbles: true, cancelable: true, view: window }
+                        ));
+                    }
+                    await frame();
+
+                    const selector = root.querySelector(".ant-select-selector");
+                    return { selected: selector.textContent.trim() };
+                }
+
+                seen.add(t);
+            }
+
+            const end = holder?.scrollHeight - holder?.clientHeight;
+            if (!holder || holder.scrollTop >= end) break;
+
+            holder.scrollTop += holder.clientHeight;
+            await frame();
+        }
+
+        if (seen.size || performance.now() - start >= timeout) {
+            return { labels: Array.from(seen) };
+        }
+
+        await frame();
+    }
+}"""
+
+# characters that keep a pattern from being typed into the search as is
+PATTERN_SYNTAX = re.compile(r"[\\|()\[\]{}]")
+PATTERN_SPLIT = re.compile(r".[?*]|[.^$+]")
+
+
+def _search_text(option: str | re.Pattern) -> str:
+    """The longest run of literal text every match of `option` contains."""
+    if isinstance(option, str):
+        return option
+
+    if PATTERN_SYNTAX.search(option.pattern):
+        return ""
+
+    return max(PATTERN_SPLIT.split(option.pattern), key=len)
+
+
+def _is_option(text: str, option: str | re.Pattern) -> bool:
+    """Strings are labels, only patterns are matched as regexes."""
+    if isinstance(option, str):
+        return text == option
+
+    return matches(text, option)
 
 
 class Dropdown:
+    TIMEOUT_MS = 3000
+
     def __init__(self, element: Locator):
         self.element = element
         self.page = element.page
@@ -28,30 +138,93 @@ class Dropdown:
         ):
             self.selector.click(force=True)
 
-    def select(self, option: str | re.Pattern, retry: int = 10):
-        for attempt in range(retry):
-            try:
-                if matches(self.selected(), option):
-                    return
+    def search(self, text: str) -> bool:
+        """Narrows the options down, if the dropdown has a search box.
+
+        Returns whether anything was typed.
+        """
+        if text and self.input.get_attribute("readonly") is None:
+            self.input.fill(text)
+            return True
+
+        return False
+
+    def clear_search(self):
+        self.input.fill("")
+
+    def _pick(self, option: str | re.Pattern, label: str | None = None) -> str:
+        if isinstance(option, str):
+            label = option
+            pattern = re.compile(re.escape(option))
+        else:
+            pattern = option
 
-                with contextlib.suppress(AssertionError):
-                    expect(self.input).to_be_enabled(timeout=10000)
+        result = self.element.evaluate(
+            PICK_SCRIPT,
+            {
+                "label": label,
+                "source": pattern.pattern,
+                "ignoreCase": bool(pattern.flags & re.IGNORECASE),
+                "timeout": self.TIMEOUT_MS,
+            },
+        )
 
-                self.open()
+        if "selected" in result:
+            return result["selected"]
 
-                matched_option = self.options.get_by_text(option).first
-                expect(matched_option).to_be_visible(timeout=3000)
-                matched_option.click()
+        # the JS regex can differ from python's, the labels decide
+        if label is None:
+            for candidate in result["labels"]:
+                if _is_option(candidate, option):
+                    return self._pick(option, candidate)
 
-                if matches(self.selected(), option):
+        self.close()
+        raise LookupError(
+            f"No option matching {option!r} among {len(result['labels'])}: "
+            f"{result['labels'][:20]}"
+        )
+
+    def _search_and_pick(self, option: str | re.Pattern) -> str:
+        self.open()
+
+        if not self.search(_search_text(option)):
+            return self._pick(option)
+
+        try:
+            return self._pick(option)
+        except LookupError:
+            # the search may filter on the option values rather than the labels,
+            # the whole list is scanned once before giving up
+            self.open()
+            self.clear_search()
+            return self._pick(option)
+
+    def select(self, option: str | re.Pattern, retry: int = 2):
+        if _is_option(self.selected(), option):
+            return
+
+        with contextlib.suppress(AssertionError):
+            expect(self.input).to_be_enabled(timeout=10000)
+
+        for attempt in range(retry + 1):
+            try:
+                selected = self._search_and_pick(option)
+
+                if _is_option(selected, option):
                     return
 
+                raise AssertionError(f"Selected {selected!r} instead of {option!r}")
+
+            # a missing option won't turn up by trying again
+            except LookupError:
+                raise
+
             except Exception as e:
                 if attempt < retry:
+                    record_retry()
                     self.close()
-                    self.page.wait_for_timeout(300)  # short delay before retry
                     continue
-                raise RuntimeError(f"Failed after {retry} attempts: {e}") from e
+                raise RuntimeError(f"Failed after {retry + 1} attempts: {e}") from e
 
     def visible(self) -> bool:
         return self.element.is_visible()
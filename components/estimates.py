@@ -0,0 +1,111 @@
+from playwright.sync_api import Locator, Page
+
+# Resolves in the page once the estimate cells have stopped changing for
+# `quiet` ms. With `expectChange` it also waits (up to `changeTimeout`) for the
+# values to differ from `baseline` or for a loading skeleton to show up first.
+SETTLE_SCRIPT = """(
+    table, { baseline, expectChange, quiet, changeTimeout, timeout }
+) => {
+    const read = () => Array.from(
+        table.querySelectorAll("td"), td => td.textContent.trim()
+    ).slice(0, 4);
+    const loading = () => document.querySelector(".ant-skeleton-button") !== null;
+
+    return new Promise((resolve, reject) => {
+        const start = performance.now();
+        const initial = baseline ?? read();
+        let previous = read();
+        let last = start;
+        let sawLoading = false;
+
+        const observer = new MutationObserver(() => { last = performance.now(); });
+        observer.observe(
+            table, { subtree: true, childList: true, characterData: true }
+        );
+
+        const finish = (result) => {
+            clearInterval(interval);
+            observer.disconnect();
+            result instanceof Error ? reject(result) : resolve(result);
+        };
+
+        const interval = setInterval(() => {
+            const now = performance.now();
+            const values = read();
+
+            if (loading()) {
+                sawLoading = true;
+                last = now;
+            }
+
+            if (values.some((v, i) => v !== previous[i])) {
+                last = now;
+                previous = values;
+            }
+
+            const changed = sawLoading || values.some((v, i) => v !== initial[i]);
+            const quietFor = now - last;
+
+            const quietLongEnough = quietFor >= quiet && now - start >= quiet;
+            const waitForChange = expectChange && now - start < changeTimeout;
+
+            if ((changed || !waitForChange) && quietLongEnough) {
+                return finish({ values, changed });
+            }
+
+            if (now - start >= timeout) {
+                // nothing changed at all, the parameter didn't affect the estimates
+                if (!changed && quietFor >= quiet) {
+                    return finish({ values, changed });
+                }
+
+                finish(new Error(`Estimates did not settle within ${timeout}ms`));
+            }
+        }, 50);
+    });
+}"""
+
+
+class Estimates:
+    QUIET_MS = 300
+    TIMEOUT_MS = 10_000
+
+    def __init__(self, element: Locator):
+        self.element = element
+        self.page = element.page
+        self.cells = self.element.locator("td")
+
+    @classmethod
+    def for_page(cls, page: Page):
+        return cls(page.locator("table").last)
+
+    def values(self) -> list[str]:
+        return [v.strip() for v in self.cells.all_text_contents()[:4]]
+
+    def wait_for_settled(
+        self,
+        baseline: list[str] | None = None,
+        expect_change: bool = False,
+        quiet: int | None = None,
+        timeout: int | None = None,
+        change_timeout: int | None = None,
+    ) -> list[str]:
+        """Waits for the estimates to stop changing, returns their values.
+
+        With `expect_change`, values equal to `baseline` only count as settled
+        once `change_timeout` ms (by default all of `timeout`) went by without
+        the estimates starting to change.
+        """
+        timeout = self.TIMEOUT_MS if timeout is None else timeout
+        result = self.element.evaluate(
+            SETTLE_SCRIPT,
+            {
+                "baseline": baseline,
+                "expectChange": expect_change,
+                "quiet": self.QUIET_MS if quiet is None else quiet,
+                "changeTimeout": timeout if change_timeout is None else change_timeout,
+                "timeout": timeout,
+            },
+        )
+
+        return result["values"]
@@ -0,0 +1,129 @@
+from playwright.sync_api import CDPSession, Page
+from utils.timing import percentile
+
+# a frame taking longer than two vsyncs at 60Hz was visibly dropped
+JANK_MS = 1000 / 60 * 2
+
+# `Performance.getMetrics` durations (seconds) and counters worth diffing
+CDP_DURATIONS = [
+    "TaskDuration",
+    "ScriptDuration",
+    "LayoutDuration",
+    "RecalcStyleDuration",
+]
+CDP_COUNTS = ["LayoutCount", "RecalcStyleCount"]
+
+START_SCRIPT = """() => {
+    const recorder = { times: [], longTasks: [], running: true };
+    window.__frameRecorder = recorder;
+    const tick = (time) => {
+        if (!recorder.running) return;
+        recorder.times.push(time);
+        requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+
+    if (PerformanceObserver.supportedEntryTypes.includes("longtask")) {
+        recorder.observer = new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                recorder.longTasks.push(entry.duration);
+            }
+        });
+        recorder.observer.observe({ type: "longtask" });
+    }
+}"""
+
+STOP_SCRIPT = """() => {
+    const recorder = window.__frameRecorder;
+    if (!recorder) return { intervals: [], longTasks: [] };
+
+    recorder.running = false;
+    for (const entry of recorder.observer?.takeRecords() ?? []) {
+        recorder.longTasks.push(entry.duration);
+    }
+    recorder.observer?.disconnect();
+    delete window.__frameRecorder;
+
+    return {
+        intervals: recorder.times.slice(1).map((time, i) => time - recorder.times[i]),
+        longTasks: recorder.longTasks,
+    };
+}"""
+
+
+def frame_summary(intervals: list[float], long_tasks: list[float] = ()) -> dict:
+    summary = {
+        "frames": len(intervals),
+        "p50_ms": 0.0,
+        "p95_ms": 0.0,
+        "p99_ms": 0.0,
+        "max_ms": 0.0,
+        "jank": sum(interval > JANK_MS for interval in intervals),
+        "long_tasks": len(long_tasks),
+        "long_task_ms": round(sum(long_tasks), 2),
+    }
+
+    if intervals:
+        summary.update(
+            p50_ms=round(percentile(intervals, 50), 2),
+            p95_ms=round(percentile(intervals, 95), 2),
+            p99_ms=round(percentile(intervals, 99), 2),
+            max_ms=round(max(intervals), 2),
+        )
+
+    return summary
+
+
+def _metrics(cdp: CDPSession) -> dict[str, float]:
+    return {
+        m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]
+    }
+
+
+class FrameRecorder:
+    """Records frame times and long tasks while the block runs.
+
+    Given a CDP session (Chromium) it also diffs the renderer's
+    `Performance.getMetrics` over the block.
+
+        with FrameRecorder(page) as frames:
+            ...
+        frames.summary()
+    """
+
+    def __init__(self, page: Page, cdp: CDPSession | None = None):
+        self.page = page
+        self.cdp = cdp
+        self.intervals: list[float] = []
+        self.long_tasks: list[float] = []
+        self.metrics: dict[str, float] = {}
+        self._metrics_before = None
+
+    def __enter__(self):
+        if self.cdp is not None:
+            self.cdp.send("Performance.enable")
+            self._metrics_before = _metrics(self.cdp)
+
+        self.page.evaluate(START_SCRIPT)
+        return self
+
+    def __exit__(self, *_):
+        recorded = self.page.evaluate(STOP_SCRIPT)
+        self.intervals = recorded["intervals"]
+        self.long_tasks = recorded["longTasks"]
+
+        if self.cdp is not None:
+            before, after = self._metrics_before, _metrics(self.cdp)
+            self.cdp.send("Performance.disable")
+
+            self.metrics = {
+                **{
+                    f"{name}_ms": round((after[name] - before[name]) * 1000, 2)
+                    for name in CDP_DURATIONS
+                },
+                **{name: after[name] - before[name] for name in CDP_COUNTS},
+                "JSHeapUsedSize_mb": round(after["JSHeapUsedSize"] / 2**20, 2),
+            }
+
+    def summary(self) -> dict:
+        return {**frame_summary(self.intervals, self.long_tasks), **self.metrics}
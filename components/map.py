@@ -1,16 +1,206 @@
-import time
+import contextlib
 from contextlib import contextmanager
+from functools import wraps
 
+from playwright.sync_api import CDPSession, JSHandle, Page
 from playwright.sync_api import Error as PlaywriteError
-from playwright.sync_api import Page
-from utils.points import pair_by_angle
+from playwright.sync_api import TimeoutError as PlaywriteTimeoutError
+from utils.batch import Batch
+from utils.points import midpoint, pair_by_assignment
+
+from .frames import FrameRecorder
+from .scene import CHANGED_SCRIPT, SNAPSHOT_SCRIPT, SceneSnapshot
+
+BOUNDS_SCRIPT = "map => map.getBounds()"
+OBJECT_COUNT_SCRIPT = "three => three.internal.interaction.length"
+HAS_POINTS_SCRIPT = """three => three.internal.interaction.some(
+    element => element.name === "EditableVertexSprite"
+)"""
+PROJECT_SCRIPT = "([map, location]) => map.project(location)"
+CAMERA_SCRIPT = """map => {
+    const { lng, lat } = map.getCenter();
+    return {
+        center: [lng, lat],
+        zoom: map.getZoom(),
+        bearing: map.getBearing(),
+        pitch: map.getPitch(),
+    };
+}"""
+JUMP_TO_SCRIPT = "([map, camera]) => map.jumpTo(camera)"
+
+# Listens for the map starting to move from before the action that moves it.
+# `idle` resolves on the first mapbox `idle` after a move started.
+WATCH_MOVE_SCRIPT = """map => {
+    const watch = { moved: false };
+
+    watch.idle = new Promise(resolve => {
+        const onIdle = () => {
+            map.off("idle", onIdle);
+            resolve();
+        };
+        const onStart = () => {
+            watch.moved = true;
+            map.off("movestart", onStart);
+            map.on("idle", onIdle);
+        };
+
+        map.on("movestart", onStart);
+        watch.stop = () => {
+            map.off("movestart", onStart);
+            map.off("idle", onIdle);
+        };
+    });
+
+    return watch;
+}"""
+
+# Resolves on the next mapbox `idle` once the map is (or starts) moving. If the
+# map is at rest and no move starts within `grace` ms it resolves right away,
+# unless a move is expected. With a `watch` from before the action, a move that
+# already started (or finished) counts too.
+WAIT_FOR_IDLE_SCRIPT = """([map, watch, expectMove, grace, timeout]) => new Promise(
+    (resolve, reject) => {
+        let graceTimer;
+        let timeoutTimer;
+
+        const finish = (error) => {
+            clearTimeout(graceTimer);
+            clearTimeout(timeoutTimer);
+            map.off("movestart", onStart);
+            map.off("idle", onIdle);
+            error ? reject(error) : resolve();
+        };
+        const onIdle = () => finish();
+        const onStart = () => {
+            clearTimeout(graceTimer);
+            map.off("movestart", onStart);
+            map.on("idle", onIdle);
+        };
+
+        timeoutTimer = setTimeout(
+            () => finish(new Error(`Map did not become idle within ${timeout}ms`)),
+            timeout,
+        );
+
+        if (watch?.moved) {
+            watch.idle.then(onIdle);
+            return;
+        }
+
+        if (map.isMoving() || map.isZooming() || map.isRotating()) {
+            map.on("idle", onIdle);
+            return;
+        }
+
+        map.on("movestart", onStart);
+        watch?.idle.then(onIdle);
+
+        if (!expectMove) {
+            graceTimer = setTimeout(() => finish(), grace);
+        }
+    }
+)"""
+
+# Same as `Vector3.project(camera)` on each sprite's world position, written out
+# against the matrices on the three state so THREE itself never has to be loaded
+MAP_POINTS_SCRIPT = """three => {
+    const apply = (m, [x, y, z]) => {
+        const e = m.elements;
+        const w = 1 / (e[3] * x + e[7] * y + e[11] * z + e[15]);
+
+        return [
+            (e[0] * x + e[4] * y + e[8] * z + e[12]) * w,
+            (e[1] * x + e[5] * y + e[9] * z + e[13]) * w,
+            (e[2] * x + e[6] * y + e[10] * z + e[14]) * w,
+        ];
+    };
+
+    const sprites = three.internal.interaction.filter(
+        element => element.name === "EditableVertexSprite"
+    );
+    const camera = three.camera;
+    const widthHalf = three.gl.domElement.width / 2;
+    const heightHalf = three.gl.domElement.height / 2;
+
+    return sprites.map(sprite => {
+        sprite.updateWorldMatrix(true, false);
+        const e = sprite.matrixWorld.elements;
+
+        const view = apply(camera.matrixWorldInverse, [e[12], e[13], e[14]]);
+        const [x, y] = apply(camera.projectionMatrix, view);
+
+        return { x: x * widthHalf + widthHalf, y: -(y * heightHalf) + heightHalf };
+    });
+}"""
+
+# Whether boundary vertices are rendered and every one of them is on the canvas
+POINTS_ON_CANVAS_SCRIPT = f"""three => {{
+    const points = ({MAP_POINTS_SCRIPT})(three);
+    const {{ width, height }} = three.gl.domElement;
+
+    return points.length > 0 && points.every(
+        ({{ x, y }}) => x >= 0 && y >= 0 && x <= width && y <= height
+    );
+}}"""
+
+# Vertex positions once the app has re-rendered after the last input event
+DRAGGED_POINTS_SCRIPT = f"""three => new Promise(
+    r => requestAnimationFrame(() => requestAnimationFrame(r))
+).then(() => ({MAP_POINTS_SCRIPT})(three))"""
+
+
+def _reacquiring(method):
+    """Runs `method` once more with fresh handles if the cached ones failed.
+
+    Staleness is only found out when a call on the cached handles errors (their
+    context was destroyed, the map was torn down), so a read costs no extra
+    round trip to check them first. Timeouts are passed on as they are.
+    """
+
+    @wraps(method)
+    def wrapper(self: "Map", *args, **kwargs):
+        cached = bool(self._handles)
+
+        try:
+            return method(self, *args, **kwargs)
+        except PlaywriteTimeoutError:
+            raise
+        except PlaywriteError:
+            if not cached:
+                raise
+
+            self.invalidate()
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _near(point, points, tolerance: float) -> bool:
+    return any(
+        abs(point["x"] - p["x"]) <= tolerance and abs(point["y"] - p["y"]) <= tolerance
+        for p in points
+    )
 
 
 class Map:
+    REF_TIMEOUT = 20_000
+    # how far (canvas px) a dragged vertex may end up from where it was dropped
+    DRAG_TOLERANCE = 5
+
     def __init__(self, page: Page):
         self.page = page
         self.canvas = page.locator("canvas").first
-        self.three_loaded = False
+        self._handles: dict[str, JSHandle] = {}
+        self._stale: list[JSHandle] = []
+        self._cdp: CDPSession | None = None
+
+        self.page.on("framenavigated", self._on_navigated)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.dispose()
 
     @property
     def mapbox(self):
@@ -25,39 +215,111 @@ class Map:
         return self._get_store()
 
     def _get_store(self):
-        for _ in range(10):
-            try:
-                return self.page.evaluate_handle(
-                    "window.__DEV_GET_ZUSTAND_STORE_MAP().getState()"
-                )
-            except PlaywriteError:
-                time.sleep(2)
+        self._dispose_stale()
 
-        raise PlaywriteError("Failed to get map store")
+        if "store" not in self._handles:
+            self.page.wait_for_function(
+                "() => !!window.__DEV_GET_ZUSTAND_STORE_MAP",
+                timeout=self.REF_TIMEOUT,
+            )
+            self._handles["store"] = self.page.evaluate_handle(
+                "window.__DEV_GET_ZUSTAND_STORE_MAP()"
+            )
+
+        return self._handles["store"]
 
     def _get_ref(self, ref: str):
-        for _ in range(10):
+        self._dispose_stale()
+
+        if ref not in self._handles:
+            store = self._get_store()
+            self.page.wait_for_function(
+                "([store, ref]) => !!store.getState()[ref]?.current",
+                arg=[store, ref],
+                timeout=self.REF_TIMEOUT,
+            )
+            self._handles[ref] = store.evaluate_handle(
+                "(store, ref) => store.getState()[ref].current", ref
+            )
+
+        return self._handles[ref]
+
+    def _on_navigated(self, frame):
+        # no protocol calls from inside the event handler, the handles are
+        # only disposed on the next access
+        if frame == self.page.main_frame:
+            self.invalidate()
+
+    def invalidate(self):
+        self._stale.extend(self._handles.values())
+        self._handles.clear()
+
+    def _dispose_stale(self):
+        while self._stale:
+            with contextlib.suppress(PlaywriteError):
+                self._stale.pop().dispose()
+
+    def dispose(self):
+        self.page.remove_listener("framenavigated", self._on_navigated)
+        self.invalidate()
+        self._dispose_stale()
+
+        if self._cdp:
+            with contextlib.suppress(PlaywriteError):
+                self._cdp.detach()
+            self._cdp = None
+
+    def _get_cdp(self) -> CDPSession | None:
+        # chromium only, frame recording does without the CDP metrics elsewhere
+        if self._cdp is None:
             try:
-                out = self.handle.evaluate_handle(f"handle => handle.{ref}.current")
-
-                if out != "null":
-                    return out
+                self._cdp = self.page.context.new_cdp_session(self.page)
             except PlaywriteError:
-                ...
-            time.sleep(2)
+                self._cdp = False
 
-        raise PlaywriteError(f"Failed to get ref {ref}")
+        return self._cdp or None
 
-    def wait_for_not_zooming(self):
-        while self.is_zooming():
-            time.sleep(0.2)
+    @_reacquiring
+    def wait_for_idle(self, timeout=30_000, expect_move=False, grace=250, watch=None):
+        self.page.evaluate(
+            WAIT_FOR_IDLE_SCRIPT, [self.mapbox, watch, expect_move, grace, timeout]
+        )
 
+    @contextmanager
+    def expect_move(self, timeout=30_000):
+        """Waits for the map to come to rest after a move the block starts.
+
+        The listener goes in before the block runs, so a fly-to that's already
+        over by the time the block returns isn't missed.
+        """
+        watch = self.page.evaluate_handle(WATCH_MOVE_SCRIPT, self.mapbox)
+
+        try:
+            yield
+            self.wait_for_idle(timeout=timeout, expect_move=True, watch=watch)
+        finally:
+            with contextlib.suppress(PlaywriteError):
+                watch.evaluate("watch => watch.stop()")
+                watch.dispose()
+
+    @_reacquiring
+    def camera(self) -> dict:
+        """Center (`[lng, lat]`), zoom, bearing and pitch, as `jump_to` takes."""
+        return self.page.evaluate(CAMERA_SCRIPT, self.mapbox)
+
+    def jump_to(self, camera: dict):
+        self.page.evaluate(JUMP_TO_SCRIPT, [self.mapbox, camera])
+        self.wait_for_idle()
+
+    @_reacquiring
     def is_zooming(self):
         return self.page.evaluate("map => map.isZooming()", self.mapbox)
 
+    @_reacquiring
     def get_bounds(self):
-        return self.page.evaluate("map => map.getBounds()", self.mapbox)
+        return self.page.evaluate(BOUNDS_SCRIPT, self.mapbox)
 
+    @_reacquiring
     def contains_location(self, location: tuple[float, float]) -> bool:
         location = f"lat: {location[0]}, lon: {location[1]}"
         location = "{" + location + "}"
@@ -65,146 +327,194 @@ class Map:
             f"map => map.getBounds().contains({location})", self.mapbox
         )
 
+    @_reacquiring
     def project_lat_lng(self, location: tuple[float, float]):
         return self.page.evaluate(
             f"map => map.project([{location[0]}, {location[1]}])", self.mapbox
         )
 
-    def convert_scan_to_px(self, scan: list[list[float]]):
-        out = []
+    @_reacquiring
+    def convert_scan_to_px(self, scan: list[list[float]], batch: Batch | None = None):
+        run = batch is None
+        batch = batch or Batch(self.page)
+        mapbox = self.mapbox
+
+        out = [batch.evaluate(PROJECT_SCRIPT, [mapbox, point]) for point in scan]
 
-        for point in scan:
-            out.append(self.project_lat_lng(point))
+        if run:
+            batch.run()
+            return [batch[i] for i in out]
 
         return out
 
+    @_reacquiring
     def get_rendered_object_count(self):
-        elements = self.page.evaluate(
-            "three => three.internal.interaction", self.threejs
-        )
+        return self.page.evaluate(OBJECT_COUNT_SCRIPT, self.threejs)
+
+    def poll_for_map_ref(self):
+        try:
+            self._get_ref("mapboxMapRef")
+            return True
+        except PlaywriteError:
+            return False
+
+    @_reacquiring
+    def wait_for_points(self, timeout=5_000, on_canvas=False) -> bool:
+        """Whether boundary vertices are rendered within `timeout` ms.
+
+        With `on_canvas` they also all have to be in view, where they can be
+        clicked and dragged.
+        """
+        script = POINTS_ON_CANVAS_SCRIPT if on_canvas else HAS_POINTS_SCRIPT
+
+        try:
+            self.page.wait_for_function(script, arg=self.threejs, timeout=timeout)
+            return True
+        except PlaywriteTimeoutError:
+            return False
+
+    @_reacquiring
+    def get_current_map_points(self):
+        return self.page.evaluate(MAP_POINTS_SCRIPT, self.threejs)
 
-        return len(elements)
+    def drag_bounds_to_coords(self, mouse, corners, steps=3):
+        # projections are only valid once any fly-to (e.g. site selection) is over
+        self.wait_for_idle()
 
-    def poll_for_map_ref(self, attempts=50):
-        for _ in range(attempts):
-            try:
-                self.get_bounds()
-                return True
-            except PlaywriteError:
-                time.sleep(0.2)
+        batch = Batch(self.page)
 
-        return False
+        desired = self.convert_scan_to_px(corners, batch=batch)
+        current = batch.evaluate(MAP_POINTS_SCRIPT, self.threejs)
+        frame = batch.bounding_box(self.canvas)
 
-    def get_current_map_points(self):
-        if not self.three_loaded:
-            self.load_three_js()
-            self.three_loaded = True
-
-        script = """three => {
-            const sprites = three.internal.interaction.filter(element => element.name === "EditableVertexSprite");
-            const camera = three.camera;
-            const renderer = three.gl;
-
-            const screenPositions = [];
-
-            sprites.forEach(sprite => {
-                const worldPosition = new THREE.Vector3();
-                sprite.getWorldPosition(worldPosition);
-                const ndc = worldPosition.clone().project(camera);
-                const widthHalf = renderer.domElement.width / 2;
-                const heightHalf = renderer.domElement.height / 2;
-                const screenX = (ndc.x * widthHalf) + widthHalf;
-                const screenY = -(ndc.y * heightHalf) + heightHalf;
-
-                screenPositions.push({ x: screenX, y: screenY });
-            });
-
-            console.log(screenPositions);
-
-            return screenPositions;
-        }"""  # noqa: E501
-
-        return self.page.evaluate(script, self.threejs)
-
-    def load_three_js(self):
-        script = """() => {
-            const src = 'https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js';
-            return new Promise((resolve, reject) => {
-                const script = document.createElement('script');
-                script.src = src;
-                script.onload = () => {
-                console.log(`${src} loaded`);
-                resolve();
-                };
-                script.onerror = () => {
-                reject(new Error(`Failed to load script: ${src}`));
-                };
-                document.head.appendChild(script);
-            });
-        }"""
-
-        self.page.wait_for_timeout(500)
-
-        self.page.evaluate(script)
+        batch.run()
 
-    def drag_bounds_to_coords(self, mouse, corners, steps=3):
-        desired_corners = self.convert_scan_to_px(corners)
-        actual_corners = self.get_current_map_points()
-
-        pairs = pair_by_angle(desired_corners, actual_corners)
+        desired_corners = [batch[i] for i in desired]
+        pairs = pair_by_assignment(desired_corners, batch[current])
 
         for actual, goal in pairs:
-            self.drag_point(mouse, actual, goal, steps=steps)
+            self.drag_point(mouse, actual, goal, steps=steps, frame=batch[frame])
+
+        final = self.page.evaluate(DRAGGED_POINTS_SCRIPT, self.threejs)
+        missed = [
+            goal for _, goal in pairs if not _near(goal, final, self.DRAG_TOLERANCE)
+        ]
+
+        if missed:
+            raise AssertionError(
+                f"Vertices did not reach {missed}, they are at {final}"
+            )
+
+    def insert_vertex(self, mouse, a, b, goal, steps=3, frame=None):
+        """Adds a vertex on the edge from canvas point `a` to `b`, dragged to `goal`.
 
-    def drag_point(self, mouse, actual, goal, steps=3):
-        self.canvas.bounding_box()
-        actual = self.correct_frame(actual)
-        goal = self.correct_frame(goal)
+        Like a user would: a click on the edge's midpoint handle, then a drag.
+        """
+        frame = frame or self.canvas.bounding_box()
+        handle = midpoint(a, b)
+
+        mouse.click(**self.correct_frame(handle, frame))
+        self.drag_point(mouse, handle, goal, steps=steps, frame=frame)
+
+    def drag_point(self, mouse, actual, goal, steps=3, frame=None):
+        frame = frame or self.canvas.bounding_box()
+        actual = self.correct_frame(actual, frame)
+        goal = self.correct_frame(goal, frame)
 
         mouse.move(actual["x"], actual["y"], steps=steps)
         mouse.down()
         mouse.move(goal["x"], goal["y"], steps=steps)
         mouse.up()
 
-    def correct_frame(self, point):
-        bounding = self.canvas.bounding_box()
+    def _center(self) -> tuple[float, float]:
+        box = self.canvas.bounding_box()
+        return box["x"] + box["width"] / 2, box["y"] + box["height"] / 2
+
+    def pan(self, dx: float, dy: float, steps=20):
+        """Drags the map from the middle of the canvas by `dx`, `dy` px."""
+        x, y = self._center()
+        mouse = self.page.mouse
+
+        mouse.move(x, y)
+        mouse.down()
+        mouse.move(x + dx, y + dy, steps=steps)
+        mouse.up()
+
+    def zoom(self, delta_y: float, steps=5):
+        """Scrolls the wheel over the middle of the canvas, negative zooms in."""
+        x, y = self._center()
+        mouse = self.page.mouse
+
+        mouse.move(x, y)
+        for _ in range(steps):
+            mouse.wheel(0, delta_y / steps)
+
+    def record_frames(self) -> FrameRecorder:
+        return FrameRecorder(self.page, self._get_cdp())
+
+    def correct_frame(self, point, frame=None):
+        bounding = frame or self.canvas.bounding_box()
 
         return {"x": point["x"] + bounding["x"], "y": point["y"] + bounding["y"]}
 
-    def map_change(self):
+    @_reacquiring
+    def scene_snapshot(self) -> SceneSnapshot:
+        return SceneSnapshot.from_dict(
+            self.page.evaluate(SNAPSHOT_SCRIPT, self.threejs)
+        )
+
+    @_reacquiring
+    def wait_for_scene_change(self, before: SceneSnapshot, timeout=2_000):
+        self.page.wait_for_function(
+            CHANGED_SCRIPT, arg=[self.threejs, before.hash], timeout=timeout
+        )
+
+    @_reacquiring
+    def _read_bounds_and_scene(self) -> tuple[dict, SceneSnapshot]:
+        batch = Batch(self.page)
+        batch.evaluate(BOUNDS_SCRIPT, self.mapbox)
+        batch.evaluate(SNAPSHOT_SCRIPT, self.threejs)
+        bounds, snapshot = batch.run()
+
+        return bounds, SceneSnapshot.from_dict(snapshot)
+
+    def map_change(self, expect_move=False):
         class MapChange:
             def __init__(self, map: Map):
                 self.map = map
+                self.expect_move = expect_move
                 self.bounds_changed = None
                 self.rendered_changed = None
+                self.scene = None
 
             def __enter__(self):
-                self.bounds = self.map.get_bounds()
-                self.rendered = self.map.get_rendered_object_count()
+                self.bounds, self.snapshot = self.read()
+                self.rendered = self.snapshot.total
 
-            def __exit__(self, *_):
-                self.map.wait_for_not_zooming()
-                self.bounds_changed = self.bounds != self.map.get_bounds()
-                self.rendered_changed = (
-                    self.map.get_rendered_object_count() - self.rendered
-                )
+                if self.expect_move:
+                    self.moving = self.map.expect_move()
+                    self.moving.__enter__()
 
-        return MapChange(self)
+            def __exit__(self, *exc):
+                if self.expect_move:
+                    self.moving.__exit__(*exc)
+                else:
+                    self.map.wait_for_idle()
 
-    @contextmanager
-    def poll_for_map_change(self, attempts=10, func=None):
-        if func is None:
-            func = self.get_rendered_object_count
+                bounds, snapshot = self.read()
+                self.bounds_changed = self.bounds != bounds
+                self.scene = self.snapshot.diff(snapshot)
+                self.rendered_changed = self.scene.total
 
-        points = func()
+            def read(self):
+                return self.map._read_bounds_and_scene()
 
-        yield
+        return MapChange(self)
 
-        for _ in range(attempts):
-            new_points = func()
-            if points != new_points:
-                return True
+    @contextmanager
+    def poll_for_map_change(self, timeout=2_000):
+        before = self.scene_snapshot()
 
-            self.page.wait_for_timeout(200)
+        yield
 
-        raise TimeoutError
+        self.wait_for_scene_change(before, timeout=timeout)
@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+
+VERTEX_NAME = "EditableVertexSprite"
+
+# Everything below is computed in the page so a snapshot is a single call.
+# The hash is FNV-1a over every object's key and world position (10 significant
+# digits, world units can be mercator coordinates).
+SNAPSHOT_SCRIPT = """three => {
+    const objects = three.internal.interaction;
+    const counts = {};
+    const vertices = [];
+    let hash = 0x811c9dc5;
+
+    const feed = (str) => {
+        for (let i = 0; i < str.length; i++) {
+            hash ^= str.charCodeAt(i);
+            hash = Math.imul(hash, 0x01000193);
+        }
+    };
+
+    for (const object of objects) {
+        const key = object.name || object.type;
+        counts[key] = (counts[key] || 0) + 1;
+
+        object.updateWorldMatrix(true, false);
+        const e = object.matrixWorld.elements;
+        const position = [e[12], e[13], e[14]];
+
+        if (object.name === "EditableVertexSprite") vertices.push(position);
+        feed(`${key}:${position.map(v => v.toPrecision(10)).join(",")};`);
+    }
+
+    return { total: objects.length, counts, vertices, hash: (hash >>> 0).toString(16) };
+}"""
+
+# `before` is the hash of an earlier snapshot
+CHANGED_SCRIPT = f"([three, before]) => ({SNAPSHOT_SCRIPT})(three).hash !== before"
+
+
+def _round(position):
+    # same precision the page hashes with
+    return tuple(float(f"{v:.10g}") for v in position)
+
+
+@dataclass(frozen=True)
+class SceneSnapshot:
+    total: int
+    counts: dict[str, int]
+    vertices: list[list[float]]
+    hash: str
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["total"], data["counts"], data["vertices"], data["hash"])
+
+    def count(self, key: str) -> int:
+        return self.counts.get(key, 0)
+
+    def diff(self, after: "SceneSnapshot") -> "SceneDiff":
+        keys = self.counts.keys() | after.counts.keys()
+        counts = {k: after.count(k) - self.count(k) for k in keys}
+
+        before_vertices = {_round(v) for v in self.vertices}
+        after_vertices = {_round(v) for v in after.vertices}
+
+        return SceneDiff(
+            changed=self.hash != after.hash,
+            total=after.total - self.total,
+            counts={k: v for k, v in counts.items() if v},
+            added_vertices=sorted(after_vertices - before_vertices),
+            removed_vertices=sorted(before_vertices - after_vertices),
+        )
+
+
+@dataclass(frozen=True)
+class SceneDiff:
+    changed: bool
+    total: int
+    counts: dict[str, int] = field(default_factory=dict)
+    added_vertices: list[tuple] = field(default_factory=list)
+    removed_vertices: list[tuple] = field(default_factory=list)
+
+    def count(self, key: str) -> int:
+        return self.counts.get(key, 0)
+
+    @property
+    def vertices(self) -> int:
+        return self.count(VERTEX_NAME)
+
+    @property
+    def vertices_moved(self) -> bool:
+        return bool(self.added_vertices or self.removed_vertices)
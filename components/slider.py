@@ -1,38 +1,136 @@
+from dataclasses import dataclass
+
 from playwright.sync_api import Locator
 
+from .estimates import Estimates
+
+CALIBRATE_SCRIPT = """root => {
+    const handle = root.querySelector(".ant-slider-handle");
+    const input = root.querySelector(".ant-input-number input")
+        ?? root.querySelector("input");
+
+    return {
+        min: parseFloat(handle.getAttribute("aria-valuemin")),
+        max: parseFloat(handle.getAttribute("aria-valuemax")),
+        step: parseFloat(input?.getAttribute("step")) || 1,
+    };
+}"""
+
+# Presses the rail where `value` is, then walks the remaining steps with the
+# arrow keys when the rail is too short for every value to have its own pixel.
+# Resolves with the value the handle reports once it's done.
+SET_SCRIPT = """async (root, { value, min, max, step }) => {
+    const frame = () => new Promise(r => requestAnimationFrame(r));
+    const rail = root.querySelector(".ant-slider-rail");
+    const handle = root.querySelector(".ant-slider-handle");
+    const now = () => parseFloat(handle.getAttribute("aria-valuenow"));
+    const off = () => Math.round((value - now()) / step);
+
+    const rect = rail.getBoundingClientRect();
+    const clientX = rect.left + (rect.width * (value - min)) / (max - min);
+    const clientY = rect.top + rect.height / 2;
+
+    if (off() !== 0) {
+        for (const type of ["mousedown", "mousemove", "mouseup"]) {
+            rail.dispatchEvent(new MouseEvent(type, {
+                bubbles: true,
+                cancelable: true,
+                view: window,
+                clientX,
+                clientY,
+                buttons: type === "mouseup" ? 0 : 1,
+            }));
+        }
+        await frame();
+    }
+
+    const keys = Math.ceil((max - min) / step / Math.max(1, rect.width)) + 1;
+    for (let i = 0; i < keys && off() !== 0; i++) {
+        const key = off() > 0 ? "ArrowRight" : "ArrowLeft";
+        for (const type of ["keydown", "keyup"]) {
+            handle.dispatchEvent(
+                new KeyboardEvent(type, { key, bubbles: true, cancelable: true })
+            );
+        }
+        await frame();
+    }
+
+    return now();
+}"""
+
+
+@dataclass(frozen=True)
+class SliderRange:
+    min: float
+    max: float
+    step: float
+
+    def snap(self, value: float) -> float:
+        """Closest value the slider can take."""
+        steps = round((value - self.min) / self.step)
+        return round(max(self.min, min(self.min + steps * self.step, self.max)), 10)
+
 
 class Slider:
-    def __init__(self, element: Locator):
+    # an edit that doesn't move the estimates shouldn't wait out the whole timeout
+    CHANGE_MS = 1000
+
+    def __init__(self, element: Locator, estimates: Estimates | None = None):
         self.element = element
+        self.estimates = estimates or Estimates.for_page(element.page)
         self.rail = self.element.locator(".ant-slider-rail")
         self.handle = self.element.locator(".ant-slider-handle")
         self.input = self.element.locator("input")
+        self._calibration = None
 
-    def slide(self, percentage: float):
-        width = self.rail.bounding_box()["width"]
-        click_position = max(0, min(width * percentage, width))
+    def calibration(self) -> SliderRange:
+        if self._calibration is None:
+            self._calibration = SliderRange(**self.element.evaluate(CALIBRATE_SCRIPT))
+
+        return self._calibration
 
-        # use a negative offset to make sure we get all the way to the end
-        if click_position == 0:
-            click_position = -10
+    def set(self, value: float) -> float:
+        """Moves the handle to `value` (snapped to the slider's steps).
 
-        rail_position = self.rail.bounding_box()
-        handle_position = self.handle.bounding_box()
+        Doesn't wait for the estimates, see `slide`.
+        """
+        slider_range = self.calibration()
+        target = slider_range.snap(value)
 
-        self.rail.page.mouse.move(x=handle_position["x"], y=handle_position["y"])
-        self.rail.page.mouse.down()
-        self.rail.page.wait_for_timeout(100)
-        self.rail.page.mouse.move(
-            rail_position["x"] + click_position, rail_position["y"]
+        actual = self.element.evaluate(
+            SET_SCRIPT,
+            {
+                "value": target,
+                "min": slider_range.min,
+                "max": slider_range.max,
+                "step": slider_range.step,
+            },
+        )
+
+        if not abs(actual - target) <= slider_range.step / 2:
+            raise AssertionError(f"Slider is at {actual} instead of {target}")
+
+        return actual
+
+    def slide(self, percentage: float):
+        slider_range = self.calibration()
+        percentage = max(0, min(percentage, 1))
+        before = self.estimates.values()
+
+        self.set(slider_range.min + (slider_range.max - slider_range.min) * percentage)
+        self.estimates.wait_for_settled(
+            before, expect_change=True, change_timeout=self.CHANGE_MS
         )
-        self.rail.page.mouse.up()
-        self.rail.page.wait_for_timeout(500)
 
     def fill_box(self, value: str):
+        before = self.estimates.values()
+
         self.input.fill(str(value))
         self.input.press("Enter")
         self.input.page.locator("body").click()
-        self.input.page.wait_for_timeout(1500)  # TODO: FLAKY
+        self.estimates.wait_for_settled(
+            before, expect_change=True, change_timeout=self.CHANGE_MS
+        )
 
     def get_value(self):
         return self.input.input_value()
@@ -9,19 +9,6 @@ def _convert_lat_lng(inp):
     return tuple(coords)
 
 
-# Address for map search testing
-ADDRESS_QUERY = os.environ["ADDRESS_QUERY"]
-ADDRESS_LOCATION = _convert_lat_lng(os.environ["ADDRESS_LOCATION"])
-
-# Mission name and regex
-DEFAULT_MISSION_NAME_RE = re.compile(os.environ["DEFAULT_MISSION_NAME_RE"])
-MISSION_NAME = os.environ["MISSION_NAME"]
-
-# Site/Dock location
-SITE_NAME = os.environ["SITE_NAME"]
-SITE_LOCATION = _convert_lat_lng(os.environ["SITE_LOCATION"])
-DOCK_NAME = os.environ["DOCK_NAME"]
-
 SCAN_CORNERS = [
     [-122.33145073709481, 37.53443411899255],
     [-122.33209049443792, 37.53376102376943],
@@ -29,9 +16,54 @@ SCAN_CORNERS = [
     [-122.33064006334622, 37.533942581363306],
 ]
 
-TESTRAIL_KEY = os.environ["TESTRAIL_KEY"]
-TESTRAIL_URL = os.environ["TESTRAIL_URL"]
-TESTRAIL_EMAIL = os.environ["TESTRAIL_EMAIL"]
-TESTRAIL_RUN_ID = int(os.environ["TESTRAIL_RUN_ID"])
+# Environment for `--env local` where nothing else sets it. The stand-in
+# serves whatever these end up being, the cloud login and TestRail aren't used
+LOCAL_DEFAULTS = {
+    "CLOUD_ORG": "stand-in",
+    "CLOUD_EMAIL": "playwright@stand-in.local",
+    "DEFAULT_MISSION_NAME_RE": r"^Map Mission \d{2}\/\d{2}\/\d{4} \d{2}:\d{2}:\d{2}$",
+    "ADDRESS_QUERY": "2537 woodvalley ct",
+    "ADDRESS_LOCATION": "40.580533889684595, -105.12436978652654",
+    "MISSION_NAME": "Ep!c M!s$0n n@me",
+    "SITE_NAME": "Stand-in Site",
+    "SITE_LOCATION": "37.53449527213899, -122.33145358394066",
+    "DOCK_NAME": "stand-in-dock",
+    # playwright's own chromium
+    "CHROME_EXEC": "",
+}
+
+
+def use_local_defaults():
+    for key, value in LOCAL_DEFAULTS.items():
+        os.environ.setdefault(key, value)
+
+
+# Read from the environment on first use rather than on import, so
+# `use_local_defaults` can still fill them in once the options are parsed
+_SETTINGS = {
+    # Address for map search testing
+    "ADDRESS_QUERY": lambda: os.environ["ADDRESS_QUERY"],
+    "ADDRESS_LOCATION": lambda: _convert_lat_lng(os.environ["ADDRESS_LOCATION"]),
+    # Mission name and regex
+    "DEFAULT_MISSION_NAME_RE": lambda: re.compile(
+        os.environ["DEFAULT_MISSION_NAME_RE"]
+    ),
+    "MISSION_NAME": lambda: os.environ["MISSION_NAME"],
+    # Site/Dock location
+    "SITE_NAME": lambda: os.environ["SITE_NAME"],
+    "SITE_LOCATION": lambda: _convert_lat_lng(os.environ["SITE_LOCATION"]),
+    "DOCK_NAME": lambda: os.environ["DOCK_NAME"],
+    "TESTRAIL_KEY": lambda: os.environ["TESTRAIL_KEY"],
+    "TESTRAIL_URL": lambda: os.environ["TESTRAIL_URL"],
+    "TESTRAIL_EMAIL": lambda: os.environ["TESTRAIL_EMAIL"],
+    "TESTRAIL_RUN_ID": lambda: int(os.environ["TESTRAIL_RUN_ID"]),
+    "CHROME_EXEC": lambda: os.environ["CHROME_EXEC"],
+}
+
+
+def __getattr__(name: str):
+    if name not in _SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-CHROME_EXEC = os.environ["CHROME_EXEC"]
+    value = globals()[name] = _SETTINGS[name]()
+    return value
@@ -150,3 +150,26 @@ TEST_813393 = "813393 - Set Mission name is reflected in Scans Tab"
 TEST_813418 = "813418 - Selected thermal file type is reflected in output files after the mission (Ex. RJPG present if enabled)"
 TEST_856089 = "856089 - User is able to download individual images (EO-JPG, RJPG,IR-JPG)"
 TEST_856090 = "856090 - User is able to download a scan within Scans Tab"
+# fmt: on
+
+# Cases not listed above resolve from the index synced from TestRail
+# (`just sync-cases`), only opened on the first lookup.
+_index = None
+
+
+def __getattr__(name: str) -> str:
+    global _index
+
+    if not name.startswith("TEST_") or not name[5:].isdigit():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if _index is None:
+        from utils.case_index import CaseIndex
+
+        _index = CaseIndex()
+
+    if (title := _index.title(int(name[5:]))) is None:
+        raise AttributeError(f"{name} is not in the case index, run `just sync-cases`")
+
+    globals()[name] = title
+    return title
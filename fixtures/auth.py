@@ -1,47 +1,240 @@
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import pytest
 
 import data.config as cfg
 from pages.login_page import Login
+from playwright.sync_api import Browser, BrowserContext, Page
 
 AUTH_FILE = Path("playwright/.auth/state.json")
+CONTEXT_ARGS = {"permissions": [], "viewport": {"width": 1920, "height": 1080}}
+
+# page served while resetting storage so the app itself never has to load
+_BLANK_PAGE = "<html><head></head><body></body></html>"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-context-pool",
+        action="store_true",
+        default=False,
+        help="Create a fresh browser context (and log in) for every test",
+    )
+
+
+def _login(page: Page, cloud_email: str):
+    page.goto("/")
+
+    login = Login(page)
+
+    try:
+        page.wait_for_url("**/fleet", timeout=60_000)
+    except Exception:
+        print("WAITING FOR USER TO LOGIN")
+        login.goto()
+        login.fill(cloud_email, None)
+        AUTH_FILE.parent.mkdir(exist_ok=True, parents=True)
+        page.wait_for_url("**/fleet", timeout=120_000)
+        page.context.storage_state(path=AUTH_FILE)
+
+
+class ContextPool:
+    """Per-worker pool of authenticated contexts that tests lease and return.
+
+    Only the first context of a worker goes through the login redirect; its
+    storage state is captured and every released context is reset back to it.
+    """
+
+    def __init__(
+        self, browser: Browser, context_args: dict, cloud_email: str, login=True
+    ):
+        self.browser = browser
+        self.context_args = context_args
+        self.cloud_email = cloud_email
+        self.login = login
+        self.state = None
+        self.idle: list[BrowserContext] = []
+        self.leased: set[BrowserContext] = set()
+
+    def _new_context(self) -> BrowserContext:
+        if self.state is not None:
+            return self.browser.new_context(
+                storage_state=self.state, **self.context_args
+            )
+
+        if AUTH_FILE.exists():
+            context = self.browser.new_context(
+                storage_state=AUTH_FILE, **self.context_args
+            )
+        else:
+            context = self.browser.new_context(**self.context_args)
+
+        if self.login:
+            _login(context.new_page(), self.cloud_email)
+
+        self.state = context.storage_state()
+
+        return context
+
+    def lease(self) -> Page:
+        context = self.idle.pop() if self.idle else self._new_context()
+        self.leased.add(context)
+
+        # Set default timeout to be a bit longer
+        context.set_default_timeout(60_000)
+
+        if context.pages:
+            return context.pages[0]
+
+        return context.new_page()
+
+    def release(self, page: Page):
+        context = page.context
+        self.leased.discard(context)
+
+        try:
+            self.reset(context)
+        except Exception:
+            # anything we can't reset (crashed page, closed context) is dropped
+            context.close()
+            return
+
+        self.idle.append(context)
+
+    def reset(self, context: BrowserContext):
+        for extra in context.pages[1:]:
+            extra.close()
+
+        page = context.pages[0] if context.pages else context.new_page()
+        page.goto("about:blank")
+
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_permissions()
+        context.clear_cookies()
+        context.add_cookies(self.state["cookies"])
+
+        self._reset_storage(page)
+
+    def _reset_storage(self, page: Page):
+        origins = {o["origin"]: o["localStorage"] for o in self.state["origins"]}
+
+        if base_url := self.context_args.get("base_url"):
+            url = urlsplit(base_url)
+            origins.setdefault(f"{url.scheme}://{url.netloc}", [])
+
+        script = """items => {
+            localStorage.clear();
+            sessionStorage.clear();
+            for (const { name, value } of items) localStorage.setItem(name, value);
+        }"""
+
+        for origin, items in origins.items():
+            page.route(
+                f"{origin}/**",
+                lambda route: route.fulfill(content_type="text/html", body=_BLANK_PAGE),
+            )
+            page.goto(f"{origin}/")
+            page.evaluate(script, items)
+            page.unroute_all(behavior="ignoreErrors")
+
+        page.goto("about:blank")
+
+    def close(self):
+        for context in [*self.idle, *self.leased]:
+            context.close()
+
+        self.idle.clear()
+        self.leased.clear()
 
 
 @pytest.fixture(scope="session")
 def browser_type_launch_args(is_chromium, browser_type_launch_args):
     options = browser_type_launch_args.copy()
-    if is_chromium:
+    # empty with `--env local`, playwright's own chromium is used
+    if is_chromium and cfg.CHROME_EXEC:
         options["executable_path"] = cfg.CHROME_EXEC
 
     return options
 
 
+@pytest.fixture(scope="session")
+def use_context_pool(pytestconfig) -> bool:
+    # artifacts are recorded per context by pytest-playwright's `new_context`
+    recording = any(
+        pytestconfig.getoption(option, "off") not in ("off", None)
+        for option in ("--tracing", "--video", "--screenshot")
+    )
+
+    return not (pytestconfig.getoption("--no-context-pool") or recording)
+
+
+@pytest.fixture(scope="session")
+def context_args(har_mode) -> dict:
+    if har_mode is None:
+        return CONTEXT_ARGS
+
+    # service workers would fetch around the HAR routes
+    return {**CONTEXT_ARGS, "service_workers": "block"}
+
+
+@pytest.fixture(scope="session")
+def context_pool(
+    browser, browser_context_args, context_args, cloud_email, use_context_pool, har_mode
+):
+    if not use_context_pool:
+        yield None
+        return
+
+    pool = ContextPool(
+        browser,
+        {**browser_context_args, **context_args},
+        cloud_email,
+        # a replayed session never reaches the server, the saved state is enough
+        login=har_mode != "replay",
+    )
+
+    yield pool
+
+    pool.close()
+
+
 @pytest.fixture
-def auth_page(new_context, cloud_email: str):
-    context_args = {"permissions": [], "viewport": {"width": 1920, "height": 1080}}
+def auth_page(
+    request,
+    cloud_email: str,
+    context_args: dict,
+    context_pool: ContextPool | None,
+    har_router,
+):
+    # per-test context args are only applied by pytest-playwright's `new_context`
+    custom_context = request.node.get_closest_marker("browser_context_args")
+
+    if context_pool is not None and custom_context is None:
+        page = context_pool.lease()
+
+        if har_router:
+            har_router.attach(page.context)
+
+        yield page
+
+        context_pool.release(page)
+        return
+
+    new_context = request.getfixturevalue("new_context")
 
     if AUTH_FILE.exists():
-        context = new_context(
-            storage_state="playwright/.auth/state.json", **context_args
-        )
+        context = new_context(storage_state=AUTH_FILE, **context_args)
     else:
         context = new_context(**context_args)
 
-    page = context.new_page()
-    page.goto("/")
+    if har_router:
+        har_router.attach(context)
 
-    login = Login(page)
+    page = context.new_page()
 
-    try:
-        page.wait_for_url("**/fleet", timeout=60_000)
-    except Exception:
-        print("WAITING FOR USER TO LOGIN")
-        login.goto()
-        login.fill(cloud_email, None)
-        AUTH_FILE.mkdir(exist_ok=True, parents=True)
-        page.wait_for_url("**/fleet", timeout=120_000)
-        context.storage_state(path=AUTH_FILE)
+    if not (har_router and har_router.mode == "replay"):
+        _login(page, cloud_email)
 
     # Set default timeout to be a bit longer
     context.set_default_timeout(60_000)
@@ -0,0 +1,38 @@
+import pytest
+
+from utils.batch import STATS
+
+ROUNDTRIPS_SAVED = "roundtrips_saved"
+
+saved_per_test = {}
+
+
+@pytest.fixture(autouse=True)
+def batch_stats(record_property):
+    STATS.reset()
+
+    yield STATS
+
+    record_property(ROUNDTRIPS_SAVED, STATS.saved)
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+
+    for name, value in report.user_properties:
+        if name == ROUNDTRIPS_SAVED and value:
+            saved_per_test[report.nodeid] = value
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not saved_per_test:
+        return
+
+    terminalreporter.section("batched browser round trips")
+
+    for nodeid, saved in sorted(saved_per_test.items(), key=lambda x: -x[1]):
+        terminalreporter.write_line(f"{saved:>5} saved  {nodeid}")
+
+    total = sum(saved_per_test.values())
+    terminalreporter.write_line(f"{total:>5} saved in total")
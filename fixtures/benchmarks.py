@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.benchmarks import (
+    DEFAULT_THRESHOLD,
+    PERF_THRESHOLDS,
+    BenchmarkHistory,
+    PerfBaseline,
+)
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--benchmark-history",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Benchmark results per app release (default "
+        ".pytest_cache/benchmarks.json)",
+    )
+    parser.addoption(
+        "--app-release",
+        action="store",
+        default=os.environ.get("APP_RELEASE", "unreleased"),
+        help="App release the benchmarks are recorded for (default $APP_RELEASE)",
+    )
+    parser.addoption(
+        "--scaling-tolerance",
+        action="store",
+        type=float,
+        default=0.2,
+        help="How much a scaling exponent may grow over the previous release, or "
+        "exceed linear without one, before the benchmark fails",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Rendering metrics per scenario to compare against (default "
+        "perf-baseline.json)",
+    )
+    parser.addoption(
+        "--update-perf-baseline",
+        action="store_true",
+        default=False,
+        help="Store this run's rendering metrics as the baseline",
+    )
+    parser.addoption(
+        "--perf-threshold",
+        action="append",
+        default=[],
+        metavar="[METRIC=]RATIO",
+        help="Allowed ratio over the baseline for METRIC, or for every metric "
+        "without one, e.g. --perf-threshold p95_ms=1.5",
+    )
+
+
+@pytest.fixture(scope="session")
+def benchmarks(pytestconfig) -> BenchmarkHistory:
+    path = pytestconfig.getoption("--benchmark-history")
+    path = (
+        Path(path) if path else pytestconfig.rootpath / ".pytest_cache/benchmarks.json"
+    )
+
+    return BenchmarkHistory(path, pytestconfig.getoption("--app-release"))
+
+
+@pytest.fixture(scope="session")
+def scaling_tolerance(pytestconfig) -> float:
+    return pytestconfig.getoption("--scaling-tolerance")
+
+
+@pytest.fixture(scope="session")
+def perf_baseline(pytestconfig) -> PerfBaseline:
+    path = pytestconfig.getoption("--perf-baseline")
+    return PerfBaseline(
+        Path(path) if path else pytestconfig.rootpath / "perf-baseline.json"
+    )
+
+
+@pytest.fixture(scope="session")
+def perf_thresholds(pytestconfig) -> dict[str, float]:
+    thresholds = dict(PERF_THRESHOLDS)
+
+    for option in pytestconfig.getoption("--perf-threshold"):
+        metric, _, ratio = option.rpartition("=")
+
+        try:
+            thresholds[metric or DEFAULT_THRESHOLD] = float(ratio)
+        except ValueError:
+            raise pytest.UsageError(f"Invalid --perf-threshold {option!r}") from None
+
+    return thresholds
+
+
+@pytest.fixture(scope="session")
+def update_perf_baseline(pytestconfig) -> bool:
+    return pytestconfig.getoption("--update-perf-baseline")
@@ -0,0 +1,155 @@
+import json
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+DEFAULT_ESTIMATE = 60.0
+# weight of the latest run in the stored moving average
+SMOOTHING = 0.5
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--duration-history",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Per-test duration history (default .pytest_cache/durations.json)",
+    )
+    parser.addoption(
+        "--no-duration-schedule",
+        action="store_true",
+        default=False,
+        help="Use xdist's default load scheduling instead of longest-first",
+    )
+
+
+class DurationHistory:
+    def __init__(self, path: Path):
+        self.path = path
+        self.durations: dict[str, float] = {}
+        self.measured: dict[str, float] = defaultdict(float)
+
+        if path.exists():
+            self.durations = json.loads(path.read_text())
+
+    def estimate(self, nodeid: str) -> float:
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+
+        # new tests are assumed to be typical
+        if self.durations:
+            return statistics.median(self.durations.values())
+
+        return DEFAULT_ESTIMATE
+
+    # registered as a plugin on the controller, which sees the reports of
+    # every worker too
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        self.measured[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, exitstatus):
+        if self.measured and exitstatus != pytest.ExitCode.INTERRUPTED:
+            self.save()
+
+    def save(self):
+        for nodeid, seconds in self.measured.items():
+            previous = self.durations.get(nodeid, seconds)
+            self.durations[nodeid] = round(
+                SMOOTHING * seconds + (1 - SMOOTHING) * previous, 3
+            )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.durations, indent=2, sort_keys=True))
+
+
+class DurationScheduling(LoadScheduling):
+    """Longest expected test first, to whichever worker frees up first.
+
+    Every worker is kept at two pending tests (xdist holds back a worker's last
+    test until it knows what comes next), so a worker asking for more is the
+    least loaded one and gets the longest test that's left.
+    """
+
+    PENDING_PER_NODE = 2
+
+    def __init__(self, config, log=None, history: DurationHistory | None = None):
+        super().__init__(config, log)
+        self.history = history
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = [self.history.estimate(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(
+            range(len(self.collection)), key=lambda i: -estimates[i]
+        )
+
+        # initial round: greedily give the next longest test to the node with
+        # the least expected work
+        load = dict.fromkeys(self.nodes, 0.0)
+        while self.pending:
+            open_nodes = [
+                node
+                for node in self.nodes
+                if len(self.node2pending[node]) < self.PENDING_PER_NODE
+            ]
+            if not open_nodes:
+                break
+
+            node = min(open_nodes, key=load.get)
+            load[node] += estimates[self.pending[0]]
+            self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0):
+        if node.shutting_down:
+            return
+
+        if not self.pending:
+            node.shutdown()
+            return
+
+        missing = self.PENDING_PER_NODE - len(self.node2pending[node])
+        if missing > 0:
+            self._send_tests(node, missing)
+
+        self.log("num items waiting for node:", len(self.pending))
+
+
+HISTORY = pytest.StashKey[DurationHistory]()
+
+
+def pytest_configure(config: pytest.Config):
+    if hasattr(config, "workerinput"):
+        return
+
+    path = config.getoption("--duration-history")
+    path = Path(path) if path else config.rootpath / ".pytest_cache/durations.json"
+    config.stash[HISTORY] = DurationHistory(path)
+    config.pluginmanager.register(config.stash[HISTORY], "duration-history")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    if config.getoption("--no-duration-schedule") or config.getoption("dist") != "load":
+        return None
+
+    return DurationScheduling(config, log, history=config.stash[HISTORY])
@@ -0,0 +1,100 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from utils.har import HarArchive, HarRecorder, HarReplayer
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record-har",
+        action="store_true",
+        default=False,
+        help="Record each test's network traffic to a per-test HAR archive",
+    )
+    parser.addoption(
+        "--replay-har",
+        action="store_true",
+        default=False,
+        help="Serve each test's network traffic from its recorded HAR archive",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default="har",
+        help="Directory the HAR archives are recorded to and replayed from",
+    )
+    parser.addoption(
+        "--har-fallback",
+        action="store_true",
+        default=False,
+        help="When replaying, send requests missing from the archive to the network",
+    )
+
+
+@pytest.fixture(scope="session")
+def har_mode(pytestconfig) -> str | None:
+    record = pytestconfig.getoption("--record-har")
+    replay = pytestconfig.getoption("--replay-har")
+
+    if record and replay:
+        raise pytest.UsageError("--record-har and --replay-har are exclusive")
+
+    if record:
+        return "record"
+
+    if replay:
+        return "replay"
+
+    return None
+
+
+class HarRouter:
+    def __init__(self, mode: str, archive: HarArchive, fallback: bool):
+        self.mode = mode
+        self.archive = archive
+
+        if mode == "record":
+            self.handler = HarRecorder(archive)
+        else:
+            self.handler = HarReplayer(archive, fallback=fallback)
+
+    def attach(self, context):
+        context.route("**/*", self.handler)
+
+    def finish(self):
+        if self.mode == "record":
+            self.archive.save()
+        elif self.archive.missed:
+            print(
+                f"{len(self.archive.missed)} requests missing from {self.archive.path}"
+            )
+
+
+def _archive_path(request, har_dir: str) -> Path:
+    name = re.sub(r"[^\w.-]+", "_", request.node.name)
+
+    return Path(har_dir) / request.node.path.stem / f"{name}.har"
+
+
+@pytest.fixture
+def har_router(request, pytestconfig, har_mode):
+    if har_mode is None:
+        yield None
+        return
+
+    path = _archive_path(request, pytestconfig.getoption("--har-dir"))
+
+    if har_mode == "record":
+        archive = HarArchive(path)
+    elif path.exists():
+        archive = HarArchive.load(path)
+    else:
+        pytest.skip(f"No HAR archive recorded at {path}")
+
+    router = HarRouter(har_mode, archive, pytestconfig.getoption("--har-fallback"))
+
+    yield router
+
+    router.finish()
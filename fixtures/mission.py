@@ -6,6 +6,17 @@ from pytest import FixtureRequest as Request
 import data.config as cfg
 from pages.missions_page import MissionEditor, Missions, MissionsLibrary
 from playwright.sync_api import Page
+from utils.strings import matches
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-editor-snapshots",
+        action="store_true",
+        default=False,
+        help="Build the mission through the UI for every test instead of "
+        "restoring a snapshot of the editor state",
+    )
 
 
 @pytest.fixture
@@ -15,7 +26,9 @@ def open_mission_from_cloud(auth_page: Page):
 
     mission = mission_page.create_map_capture()
     auth_page.wait_for_load_state()
-    return mission
+
+    with mission.map:
+        yield mission
 
 
 @pytest.fixture
@@ -24,7 +37,9 @@ def mission_editor(auth_page: Page):
     mission_editor.goto()
 
     auth_page.wait_for_load_state()
-    return mission_editor
+
+    with mission_editor.map:
+        yield mission_editor
 
 
 @pytest.fixture
@@ -55,11 +70,15 @@ def boundary(request: Request):
     return boundary
 
 
-@pytest.fixture
-def mission(mission_editor: MissionEditor, name, site, dock, boundary):
-    if dock and (site is None):
-        pytest.skip("Cannot run test with no site but a dock")
+@pytest.fixture(scope="session")
+def editor_snapshots(pytestconfig):
+    if pytestconfig.getoption("--no-editor-snapshots"):
+        return None
+
+    return {}
+
 
+def _build_mission(mission_editor: MissionEditor, name, site, dock, boundary):
     if name:
         mission_editor.mission_details.name.fill(name)
 
@@ -77,9 +96,53 @@ def mission(mission_editor: MissionEditor, name, site, dock, boundary):
             mission_editor.page.mouse, cfg.SCAN_CORNERS
         )
 
+
+def _is_built(mission_editor: MissionEditor, name, site, dock, boundary) -> bool:
+    details = mission_editor.mission_details
+
+    # the restore is synchronous, the map renders the boundary on a later frame.
+    # Tests click and drag the vertices, they have to be in view too
+    if boundary and not mission_editor.map.wait_for_points(on_canvas=True):
+        return False
+
+    if name and details.name.input_value() != name:
+        return False
+
+    if site and details.site.selected() != site:
+        return False
+
+    return not dock or matches(details.dock.selected(), re.compile(dock + ".*"))
+
+
+@pytest.fixture
+def mission(
+    mission_editor: MissionEditor, name, site, dock, boundary, editor_snapshots
+):
+    if dock and (site is None):
+        pytest.skip("Cannot run test with no site but a dock")
+
+    key = (name, site, dock, boundary)
+
+    if editor_snapshots is None or not any(key):
+        _build_mission(mission_editor, *key)
+    elif key in editor_snapshots:
+        mission_editor.restore_state(editor_snapshots[key])
+
+        if not _is_built(mission_editor, *key):
+            # the restored state didn't take, don't trust the snapshot again
+            del editor_snapshots[key]
+            mission_editor.goto()
+            _build_mission(mission_editor, *key)
+    else:
+        _build_mission(mission_editor, *key)
+        # requests the build set off can still be filling in the stores
+        mission_editor.page.wait_for_load_state("networkidle")
+        editor_snapshots[key] = mission_editor.snapshot_state()
+
     mission_editor.page.wait_for_load_state("networkidle")
     return mission_editor
 
+
 @pytest.fixture
 def mission_library(auth_page: Page):
     mission_library = MissionsLibrary(auth_page)
@@ -0,0 +1,78 @@
+import pytest
+
+from utils.roundtrips import PROFILER
+
+WORKER_OUTPUT = "roundtrips"
+PROFILED_PACKAGES = ["pages", "components"]
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--profile-roundtrips",
+        action="store_true",
+        default=False,
+        help="Count and time Playwright calls made from pages/ and components/ "
+        "and report the top call sites per test",
+    )
+    parser.addoption(
+        "--profile-roundtrips-top",
+        action="store",
+        type=int,
+        default=5,
+        help="Number of call sites to report per test",
+    )
+
+
+# patch after (and restore before) any other plugin wrapping the same methods
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config):
+    if config.getoption("--profile-roundtrips"):
+        PROFILER.install(config.rootpath, PROFILED_PACKAGES)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_unconfigure(config: pytest.Config):
+    PROFILER.uninstall()
+
+
+def pytest_runtest_logstart(nodeid):
+    PROFILER.start_test(nodeid)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    if exported := getattr(node, "workeroutput", {}).get(WORKER_OUTPUT):
+        PROFILER.merge(exported)
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    config = session.config
+
+    if hasattr(config, "workerinput") and config.getoption("--profile-roundtrips"):
+        config.workeroutput[WORKER_OUTPUT] = PROFILER.export()
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    if not PROFILER.sites:
+        return
+
+    terminalreporter.section("browser round trips")
+    n = config.getoption("--profile-roundtrips-top")
+
+    for test in sorted(PROFILER.sites):
+        sites = PROFILER.sites[test]
+        calls = sum(s.calls for s in sites.values())
+        seconds = sum(s.seconds for s in sites.values())
+
+        terminalreporter.write_line(
+            f"{test or '(outside tests)'}: {calls} calls, {seconds:.2f}s"
+        )
+
+        for site, stats in PROFILER.top(test, n):
+            methods = ", ".join(
+                f"{method} x{count}"
+                for method, count in sorted(stats.methods.items(), key=lambda m: -m[1])
+            )
+            terminalreporter.write_line(
+                f"  {stats.calls:>5} calls {stats.seconds:>7.2f}s  {site}  [{methods}]"
+            )
@@ -0,0 +1,152 @@
+"""Share one Chromium between several xdist workers.
+
+With `-n 8 --tabs-per-browser 4` the controller starts two browsers and every
+worker connects to one of them over CDP, running its tests in its own contexts
+(tabs) instead of launching a full browser of its own. Tests still run and
+report as normal pytest items on their worker.
+"""
+
+import json
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+import urllib.request
+
+import pytest
+
+import data.config as cfg
+from playwright.sync_api import Browser
+
+ENDPOINT = "shared_browser_endpoint"
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--tabs-per-browser",
+        action="store",
+        type=int,
+        default=1,
+        help="Number of xdist workers sharing one browser process (Chromium only)",
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class BrowserServer:
+    def __init__(self, executable: str, headless: bool = True):
+        self.executable = executable
+        self.headless = headless
+        self.process = None
+        self.user_data_dir = None
+        self.endpoint = None
+
+    def start(self, timeout: float = 30):
+        port = _free_port()
+        self.user_data_dir = tempfile.mkdtemp(prefix="shared-browser-")
+        self.endpoint = f"http://127.0.0.1:{port}"
+
+        args = [
+            self.executable,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={self.user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "about:blank",
+        ]
+        if self.headless:
+            args.insert(1, "--headless=new")
+
+        self.process = subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Browser exited with {self.process.returncode}")
+
+            try:
+                with urllib.request.urlopen(f"{self.endpoint}/json/version") as r:
+                    json.load(r)
+                return self
+            except OSError:
+                time.sleep(0.1)
+
+        self.stop()
+        raise TimeoutError(f"Browser did not open {self.endpoint} within {timeout}s")
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+        if self.user_data_dir is not None:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+def _tabs_per_browser(config: pytest.Config) -> int:
+    return config.getoption("--tabs-per-browser")
+
+
+SERVERS = pytest.StashKey[dict[int, BrowserServer]]()
+
+
+def pytest_configure(config: pytest.Config):
+    config.stash[SERVERS] = {}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    config = node.config
+    tabs = _tabs_per_browser(config)
+
+    if tabs <= 1:
+        return
+
+    if config.getoption("--browser", None) not in (None, [], ["chromium"]):
+        raise pytest.UsageError("--tabs-per-browser only supports chromium")
+
+    if not cfg.CHROME_EXEC:
+        raise pytest.UsageError("--tabs-per-browser needs CHROME_EXEC set")
+
+    servers = config.stash[SERVERS]
+    group = int(node.gateway.id.removeprefix("gw")) // tabs
+
+    if group not in servers:
+        servers[group] = BrowserServer(
+            cfg.CHROME_EXEC, headless=not config.getoption("--headed")
+        ).start()
+
+    node.workerinput[ENDPOINT] = servers[group].endpoint
+
+
+def pytest_unconfigure(config: pytest.Config):
+    for server in config.stash.get(SERVERS, {}).values():
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def shared_browser_endpoint(pytestconfig) -> str | None:
+    return getattr(pytestconfig, "workerinput", {}).get(ENDPOINT)
+
+
+@pytest.fixture(scope="session")
+def browser(launch_browser, browser_type, shared_browser_endpoint) -> Browser:
+    if shared_browser_endpoint is None:
+        browser = launch_browser()
+        yield browser
+        browser.close()
+        return
+
+    # the browser belongs to the controller, contexts are closed by whoever
+    # created them and the connection goes with the playwright fixture
+    yield browser_type.connect_over_cdp(shared_browser_endpoint)
@@ -0,0 +1,10 @@
+import pytest
+
+from stand_in.server import StandInServer
+
+
+@pytest.fixture(scope="session")
+def stand_in():
+    server = StandInServer().start()
+    yield server
+    server.stop()
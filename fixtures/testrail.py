@@ -1,8 +1,21 @@
+import logging
+import queue
+import threading
+import time
+
 import pytest
 
 import data.config as cfg
 from utils.testrail import TestRail
 
+# user property carrying a test's TestRail results from the worker that ran it
+# to the controller, which is the only process uploading
+TESTRAIL_RESULTS = "testrail_results"
+
+_CLOSE = object()
+
+logger = logging.getLogger(__name__)
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -13,6 +26,102 @@ def pytest_addoption(parser):
     )
 
 
+class ResultStreamer:
+    """Uploads results from a background thread while the suite runs.
+
+    A batch goes out once it has `batch_size` results or its oldest result has
+    waited `interval` seconds, whichever comes first.
+    """
+
+    def __init__(self, tr: TestRail, run_id, batch_size=50, interval=10.0):
+        self.tr = tr
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue()
+        self.uploaded = 0
+        self.failed = []
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def add(self, result: dict):
+        self.queue.put(result)
+
+    def _upload(self, batch: list[dict]):
+        try:
+            self.tr.add_results_for_cases(self.run_id, {"results": batch})
+            self.uploaded += len(batch)
+        except Exception as e:
+            logger.warning("Failed to upload %d TestRail results: %s", len(batch), e)
+            self.failed.extend(batch)
+
+    def _run(self):
+        batch = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+
+            try:
+                result = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                result = None
+
+            if result is _CLOSE:
+                break
+
+            if result is not None:
+                batch.append(result)
+                deadline = deadline or time.monotonic() + self.interval
+
+            if batch and (
+                len(batch) >= self.batch_size or time.monotonic() >= deadline
+            ):
+                self._upload(batch)
+                batch = []
+                deadline = None
+
+        if batch:
+            self._upload(batch)
+
+    # registered as a plugin on the controller
+
+    def pytest_runtest_logreport(self, report):
+        for name, value in report.user_properties:
+            if name == TESTRAIL_RESULTS:
+                for result in value:
+                    self.add(result)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        self.close()
+
+        if self.uploaded:
+            print(f"{self.uploaded} test results have been reported to TestRail.")
+        else:
+            print("No TestRail results to report.")
+
+        if self.failed:
+            print(f"{len(self.failed)} test results could not be reported to TestRail.")
+
+    def close(self, timeout: float = 120):
+        self.queue.put(_CLOSE)
+        self.thread.join(timeout)
+
+        if self.thread.is_alive():
+            # still uploading, `failed` is its to touch until it's done
+            logger.warning(
+                "TestRail uploads still running after %ss, not retrying failures",
+                timeout,
+            )
+            return
+
+        # one more go for batches that failed while the suite was running
+        if self.failed:
+            failed, self.failed = self.failed, []
+            self._upload(failed)
+
+
 def pytest_configure(config):
     if config.getoption("--report-to-testrail"):
         config.testrails = TestRail(
@@ -21,8 +130,11 @@ def pytest_configure(config):
     else:
         config.testrails = None
 
-
-test_results = {}
+    # xdist workers only attach results to their reports
+    if config.testrails is not None and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            ResultStreamer(config.testrails, cfg.TESTRAIL_RUN_ID), "testrail-streamer"
+        )
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -41,33 +153,14 @@ def pytest_runtest_makereport(item, call):
             comment = report.longreprtext if report.failed else "Test passed"
             duration = report.duration  # in seconds
 
-            for case_id in case_ids:
-                test_results[case_id] = (status, comment, duration)
-
-
-@pytest.hookimpl(trylast=True)
-def pytest_sessionfinish(session, exitstatus):
-    tr: TestRail = session.config.testrails
-
-    if tr is None:
-        return
-
-    results = []
-    for case_id, (status, comment, duration) in test_results.items():
-        if not isinstance(case_id, int):
-            continue
-
-        results.append(
-            {
-                "case_id": case_id,
-                "status_id": status,
-                "comment": comment,
-                "elapsed": f"{duration:.2f}s",
-            }
-        )
-
-    if results:
-        tr.add_results_for_cases(cfg.TESTRAIL_RUN_ID, {"results": results})
-        print("Test results have been reported to TestRail.")
-    else:
-        print("No TestRail results to report.")
+            results = [
+                {
+                    "case_id": case_id,
+                    "status_id": status,
+                    "comment": comment,
+                    "elapsed": f"{duration:.2f}s",
+                }
+                for case_id in case_ids
+                if isinstance(case_id, int)
+            ]
+            report.user_properties.append((TESTRAIL_RESULTS, results))
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pytest
+
+from utils.timing import TIMER, from_dicts, to_dicts, write_report
+
+WORKER_OUTPUT = "action_timing"
+TIMING_RECORDS = pytest.StashKey[list]()
+TIMING_SUMMARY = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--action-timing",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Time every page object/component method and write JSON and HTML "
+        "histograms to DIR",
+    )
+
+
+def _is_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_configure(config: pytest.Config):
+    if config.getoption("--action-timing"):
+        config.stash[TIMING_RECORDS] = []
+        TIMER.instrument()
+
+
+def pytest_unconfigure(config: pytest.Config):
+    TIMER.restore()
+
+
+def pytest_runtest_logstart(nodeid):
+    TIMER.reset(nodeid)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    records = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT)
+
+    if records:
+        node.config.stash[TIMING_RECORDS].extend(from_dicts(records))
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    config = session.config
+
+    if not (directory := config.getoption("--action-timing")):
+        return
+
+    if _is_worker(config):
+        config.workeroutput[WORKER_OUTPUT] = to_dicts(TIMER.records)
+        return
+
+    records = config.stash[TIMING_RECORDS] + TIMER.records
+    config.stash[TIMING_SUMMARY] = write_report(records, Path(directory))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    if (summary := config.stash.get(TIMING_SUMMARY, None)) is None:
+        return
+
+    terminalreporter.section("action timing")
+
+    actions = sorted(summary["actions"].items(), key=lambda x: -x[1]["own_ms"])
+    for action, stats in actions[:10]:
+        terminalreporter.write_line(
+            f"{stats['own_ms']:>10.1f} ms own  {stats['p50_ms']:>8.1f} p50  "
+            f"{stats['p95_ms']:>8.1f} p95  {stats['retries']:>3} retries  "
+            f"{stats['sleep_ms']:>8.1f} ms sleep  {action}"
+        )
+
+    directory = config.getoption("--action-timing")
+    terminalreporter.write_line(
+        f"full report in {directory}/action-timing.json and .html"
+    )
@@ -0,0 +1,21 @@
+"""Async versions of the page objects, see `utils.bridge`.
+
+Constructors, methods and properties are awaited; context managers are used
+with `async with`.
+"""
+
+from components.dropdown import Dropdown as _Dropdown
+from components.map import Map as _Map
+from components.slider import Slider as _Slider
+from components.tab_list import TabList as _TabList
+from utils.bridge import async_class
+
+from .missions_page import MissionEditor as _MissionEditor
+from .missions_page import MissionsLibrary as _MissionsLibrary
+
+Dropdown = async_class(_Dropdown)
+Map = async_class(_Map)
+MissionEditor = async_class(_MissionEditor)
+MissionsLibrary = async_class(_MissionsLibrary)
+Slider = async_class(_Slider)
+TabList = async_class(_TabList)
@@ -1,9 +1,9 @@
-import contextlib
 import re
 from collections import namedtuple
 from functools import wraps
 
 from components.dropdown import Dropdown
+from components.estimates import Estimates
 from components.map import Map
 from components.slider import Slider
 from components.tab_list import TabList
@@ -12,6 +12,37 @@ from playwright.sync_api import Locator, Page
 from .base_page import BasePage
 from .rfd_page import RFD
 
+STORE_PREFIX = "__DEV_GET_ZUSTAND_STORE_"
+
+# Copies the serializable part of every dev-exposed zustand store. Actions and
+# refs (`{ current }`, e.g. the mapbox instance) belong to the live page.
+SNAPSHOT_STATE_SCRIPT = """prefix => {
+    const snapshot = {};
+
+    for (const key of Object.keys(window).filter(k => k.startsWith(prefix))) {
+        const values = {};
+
+        for (const [name, value] of Object.entries(window[key]().getState())) {
+            if (typeof value === "function") continue;
+            if (value && typeof value === "object" && "current" in value) continue;
+
+            try {
+                values[name] = JSON.parse(JSON.stringify(value));
+            } catch {}
+        }
+
+        snapshot[key] = values;
+    }
+
+    return snapshot;
+}"""
+
+RESTORE_STATE_SCRIPT = """snapshot => {
+    for (const [key, values] of Object.entries(snapshot)) {
+        window[key]().setState(values);
+    }
+}"""
+
 
 class Missions(BasePage):
     def __init__(self, page):
@@ -45,7 +76,9 @@ class MissionsLibrary(Missions):
         self.page.goto("missions/library")
 
     def missions(self):
-        return [LibraryMission(e) for e in self.page.get_by_test_id("list-container").all()]
+        return [
+            LibraryMission(e) for e in self.page.get_by_test_id("list-container").all()
+        ]
 
     def mission(self, name: str):
         return LibraryMission(
@@ -116,26 +149,34 @@ class MissionEditor(BasePage):
 
         self.discard = self.page.get_by_role("button", name="Discard")
         self.save = self.page.get_by_role("button", name="Save Mission Plan")
-        self.table = self.page.locator("table").last
+        self.estimates = Estimates.for_page(self.page)
+        self.table = self.estimates.element
         self.time_e = self.table.locator("td").nth(0)
         self.photos_e = self.table.locator("td").nth(1)
         self.color_gsd_e = self.table.locator("td").nth(2)
         self.thermal_gsd_e = self.table.locator("td").nth(3)
 
     def color_gsd(self):
-        v = self.color_gsd_e.text_content()
-        amount, unit = v.split(" ")
-
-        return float(amount)
+        return self._parse_gsd(self.color_gsd_e.text_content())
 
     def thermal_gsd(self):
-        v = self.thermal_gsd_e.text_content()
-        amount, unit = v.split(" ")
+        return self._parse_gsd(self.thermal_gsd_e.text_content())
+
+    def time(self):
+        return self._parse_time(self.time_e.text_content())
+
+    def photos(self):
+        return self._parse_photos(self.photos_e.text_content())
+
+    @staticmethod
+    def _parse_gsd(v: str):
+        amount, unit = v.strip().split(" ")
 
         return float(amount)
 
-    def time(self):
-        v = self.time_e.text_content()
+    @staticmethod
+    def _parse_time(v: str):
+        v = v.strip()
 
         if "Too large" in v:
             return float("inf")
@@ -153,34 +194,55 @@ class MissionEditor(BasePage):
 
         raise ValueError(f"Unknown time unit: {unit}")
 
-    def photos(self):
-        v = self.photos_e.text_content()
+    @staticmethod
+    def _parse_photos(v: str):
+        v = v.strip()
 
         if v == "-":
             return float("inf")
 
         return float(v)
 
+    def parse_estimates(self, values: list[str]) -> dict[str, float]:
+        time, photos, color_gsd, thermal_gsd = values
+
+        return {
+            "time": self._parse_time(time),
+            "photos": self._parse_photos(photos),
+            "color_gsd": self._parse_gsd(color_gsd),
+            "thermal_gsd": self._parse_gsd(thermal_gsd),
+        }
+
     def param_change(self):
         return ParamChange(self)
 
-    def _wait_for_loading(self, expected=False):
-        loading = self.page.locator(".ant-skeleton-button").first
-        if expected:
-            with contextlib.suppress(Exception):
-                loading.wait_for(state="visible", timeout=10000)
+    def _wait_for_loading(self, expected=False, baseline=None) -> list[str]:
+        return self.estimates.wait_for_settled(baseline, expect_change=expected)
 
-        loading.wait_for(state="detached")
-        
-        # just make sure that the values are updated
-        self.page.wait_for_timeout(1500)
+    def snapshot_state(self) -> dict:
+        """The editor's store state, and the map camera the refs don't carry."""
+        return {
+            "stores": self.page.evaluate(SNAPSHOT_STATE_SCRIPT, STORE_PREFIX),
+            "camera": self.map.camera(),
+        }
+
+    def restore_state(self, state: dict):
+        stores = state["stores"]
+
+        self.page.wait_for_function(
+            "keys => keys.every(key => !!window[key])", arg=list(stores)
+        )
+        self.page.evaluate(RESTORE_STATE_SCRIPT, stores)
+        self.map.jump_to(state["camera"])
 
     def goto(self):
         self.page.goto("missions/editor/3d-scan/unsaved")
 
     def search_in_map(self, query: str):
         self.map_search.press_sequentially(query, delay=200)
-        self.map_search.press("Enter")
+
+        with self.map.expect_move():
+            self.map_search.press("Enter")
 
 
 class ParamChange:
@@ -188,20 +250,20 @@ class ParamChange:
         self.instance = instance
 
     def __enter__(self):
-        self.instance._wait_for_loading()
-        self.before_photos = self.instance.photos()
-        self.before_time = self.instance.time()
-        self.before_color_gsd = self.instance.color_gsd()
-        self.before_thermal_gsd = self.instance.thermal_gsd()
+        self.before = self.instance._wait_for_loading()
+
+        for name, value in self.instance.parse_estimates(self.before).items():
+            setattr(self, f"before_{name}", value)
 
         return self
 
     def __exit__(self, *_):
-        self.instance._wait_for_loading(expected=True)
-        self.after_photos = self.instance.photos()
-        self.after_time = self.instance.time()
-        self.after_color_gsd = self.instance.color_gsd()
-        self.after_thermal_gsd = self.instance.thermal_gsd()
+        self.after = self.instance._wait_for_loading(
+            expected=True, baseline=self.before
+        )
+
+        for name, value in self.instance.parse_estimates(self.after).items():
+            setattr(self, f"after_{name}", value)
 
     def change(self, attribute):
         before = getattr(self, f"before_{attribute}")
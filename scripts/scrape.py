@@ -1,31 +1,215 @@
 # /// script
 # requires-python = ">=3.13"
-# dependencies = [
-#     "bs4",
-# ]
 # ///
+"""Turn a TestRail HTML export into `data/test_cases.py` constants.
+
+The export is streamed through the parser a chunk at a time and every case row
+is handed on as soon as it closes, so memory stays flat for whole-project
+exports. Only cases that are new or whose title changed compared with the
+catalog are emitted. With `-o data/test_cases.py` the constants between its
+`# fmt: off` and `# fmt: on` markers are updated in place instead: changed
+titles are rewritten on their own line and new cases are added to the end.
+"""
+
+import argparse
+import ast
+import re
 import sys
+from collections.abc import Iterable, Iterator
+from html.parser import HTMLParser
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+CATALOG = Path(__file__).parent.parent / "data" / "test_cases.py"
+CHUNK_SIZE = 1 << 16
+
+CONSTANT = re.compile(r"^TEST_(\d+) = (.+)$")
+
+BLOCK_START = "# fmt: off\n"
+BLOCK_END = "# fmt: on\n"
+
+
+class CaseRowParser(HTMLParser):
+    """Collects `(id, title)` from `tr.caseRow` rows as they are closed.
+
+    The title is the first cell without a class, like the export lays it out.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.cases: list[tuple[str, str]] = []
+        self._row = None
+        self._cell = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        classes = (dict(attrs).get("class") or "").split()
+
+        if tag == "tr" and "caseRow" in classes:
+            self._row = {}
+        elif tag == "td" and self._row is not None and self._cell is None:
+            if "id" in classes:
+                self._cell = "id"
+            elif not classes and "title" not in self._row:
+                self._cell = "title"
+
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag == "td" and self._cell is not None:
+            self._row[self._cell] = " ".join("".join(self._text).split())
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            if "id" in self._row and "title" in self._row:
+                self.cases.append(
+                    (self._row["id"].lstrip("C"), self._row["title"].strip())
+                )
+            self._row = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._text.append(data)
+
+
+def parse(path: Path) -> Iterator[tuple[str, str]]:
+    parser = CaseRowParser()
+
+    with open(path, encoding="utf-8", errors="replace") as r:
+        while chunk := r.read(CHUNK_SIZE):
+            parser.feed(chunk)
+            yield from parser.cases
+            parser.cases.clear()
+
+    parser.close()
+    yield from parser.cases
+
+
+def load_catalog(path: Path) -> dict[str, str]:
+    """Case titles by id, the last assignment wins like it does on import."""
+    catalog = {}
+
+    if not path.exists():
+        return catalog
+
+    with open(path) as r:
+        for line in r:
+            if match := CONSTANT.match(line.strip()):
+                id, value = match.groups()
+                catalog[id] = _title(value)
+
+    return catalog
+
+
+def _title(value: str) -> str:
+    return " ".join(ast.literal_eval(value).split())
 
-TARGET = Path(sys.argv[1])
+
+def literal(text: str) -> str:
+    text = text.replace("\\", "\\\\")
+
+    # same quotes ruff format picks
+    if '"' in text and "'" not in text:
+        return f"'{text}'"
+
+    return '"{}"'.format(text.replace('"', '\\"'))
+
+
+def update(path: Path, cases: Iterable[tuple[str, str]]) -> tuple[int, int]:
+    """Rewrite the constants block of `path` in place, returns (new, changed)."""
+    lines = path.read_text().splitlines(keepends=True) if path.exists() else []
+
+    if not lines:
+        lines = ["# ruff: noqa: E501\n", BLOCK_START, BLOCK_END]
+
+    try:
+        start = lines.index(BLOCK_START) + 1
+        end = lines.index(BLOCK_END, start)
+    except ValueError:
+        sys.exit(f"{path} has no `# fmt: off` ... `# fmt: on` block to update")
+
+    block = lines[start:end]
+    titles = {}
+    positions = {}
+
+    for i, line in enumerate(block):
+        if match := CONSTANT.match(line.strip()):
+            id, value = match.groups()
+            titles[id] = _title(value)
+            positions[id] = i
+
+    new = changed = 0
+
+    for id, text in cases:
+        title = f"{id} - {text}"
+        line = f"TEST_{id} = {literal(title)}\n"
+
+        if titles.get(id) == title:
+            continue
+
+        if id in positions:
+            block[positions[id]] = line
+            changed += 1
+        else:
+            positions[id] = len(block)
+            block.append(line)
+            new += 1
+
+        titles[id] = title
+
+    if new or changed:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text("".join(lines[:start] + block + lines[end:]))
+        tmp.replace(path)
+
+    return new, changed
 
 
 if __name__ == "__main__":
-    with open(TARGET) as r:
-        soup = BeautifulSoup(r.read())
-
-        for row in soup.find_all("tr", class_="caseRow"):
-            id_elem = row.find("td", class_="id")
-            text_elem = row.find("td", class_=None)
-
-            id = id_elem.text.strip().lstrip("C")
-            text = (
-                text_elem.text.strip()
-                .replace("\n", " ")
-                .replace("  ", " ")
-                .replace('"', '\\"')
-            )
-
-            print(f'TEST_{id} = "{id} - {text}"')
+    parser = argparse.ArgumentParser()
+    parser.add_argument("export", type=Path, help="TestRail HTML export")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Update the constants in this file in place instead of printing "
+        "new and changed cases",
+    )
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=CATALOG,
+        help="Existing constants to compare against when printing "
+        "(default data/test_cases.py)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        default=False,
+        help="Print every case, not just new and changed ones",
+    )
+    args = parser.parse_args()
+
+    if args.output:
+        new, changed = update(args.output, parse(args.export))
+        print(f"{new} new, {changed} changed cases", file=sys.stderr)
+        sys.exit()
+
+    catalog = {} if args.all else load_catalog(args.catalog)
+    new = changed = 0
+
+    for id, text in parse(args.export):
+        title = f"{id} - {text}"
+
+        if catalog.get(id) == title:
+            continue
+
+        if id in catalog:
+            changed += 1
+        else:
+            new += 1
+
+        catalog[id] = title
+        sys.stdout.write(f"TEST_{id} = {literal(title)}\n")
+        sys.stdout.flush()
+
+    print(f"{new} new, {changed} changed cases", file=sys.stderr)
@@ -0,0 +1,28 @@
+"""Pull TestRail cases changed since the last sync into data/test_cases.sqlite.
+
+uv run python -m scripts.sync_cases --project 1 [--suite 2]
+"""
+
+import argparse
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import data.config as cfg  # noqa: E402
+from utils.case_index import CaseIndex  # noqa: E402
+from utils.testrail import TestRail  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project", type=int, required=True)
+    parser.add_argument("--suite", type=int, default=None)
+    args = parser.parse_args()
+
+    index = CaseIndex()
+
+    with TestRail(cfg.TESTRAIL_URL, cfg.TESTRAIL_EMAIL, cfg.TESTRAIL_KEY) as tr:
+        changed = index.sync(tr, args.project, args.suite)
+
+    index.close()
+    print(f"{changed} cases added or updated in {index.path}")
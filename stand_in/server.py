@@ -0,0 +1,132 @@
+"""Local stand-in for the Skydio Cloud pages the page objects drive.
+
+The static pages under `static/` copy the DOM contracts `pages/` and
+`components/` rely on (ant-design selects and sliders, tab lists, the
+AccordionForm sections, the estimates table) and expose a fake mapbox map and
+three.js state through `window.__DEV_GET_ZUSTAND_STORE_MAP`, so the framework
+can be exercised and benchmarked without a cloud org.
+
+    uv run python -m stand_in.server
+"""
+
+import json
+import mimetypes
+import os
+import re
+import threading
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+STATIC = Path(__file__).parent / "static"
+
+# app route (below /o/<org>/) -> page
+ROUTES = [
+    (re.compile(r"^missions/editor/"), "editor.html"),
+    (re.compile(r"^missions"), "missions.html"),
+    (re.compile(r"^(fleet|login)?$"), "fleet.html"),
+]
+
+
+def _lat_lng(value: str) -> list[float]:
+    return [float(v) for v in value.replace(" ", "").split(",")]
+
+
+def stand_in_config() -> dict:
+    env = os.environ
+
+    return {
+        "addressQuery": env.get("ADDRESS_QUERY", ""),
+        "addressLocation": _lat_lng(env.get("ADDRESS_LOCATION", "0, 0")),
+        "siteName": env.get("SITE_NAME", "Stand-in Site"),
+        "siteLocation": _lat_lng(env.get("SITE_LOCATION", "0, 0")),
+        "dockName": env.get("DOCK_NAME", "stand-in-dock"),
+        "fillerSites": int(env.get("STAND_IN_SITES", 20)),
+    }
+
+
+class StandInHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *_):
+        pass
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location: str):
+        self.send_response(HTTPStatus.FOUND)
+        self.send_header("Location", location)
+        self.end_headers()
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+
+        if path == "/stand-in/config.js":
+            config = json.dumps(stand_in_config())
+            return self._send(
+                f"window.STAND_IN = {config};".encode(), "text/javascript"
+            )
+
+        if path.startswith("/stand-in/"):
+            file = (STATIC / path.removeprefix("/stand-in/")).resolve()
+
+            if file.parent != STATIC.resolve() or not file.is_file():
+                return self.send_error(HTTPStatus.NOT_FOUND)
+
+            content_type = mimetypes.guess_type(file.name)[0] or "text/plain"
+            return self._send(file.read_bytes(), content_type)
+
+        if path == "/":
+            org = os.environ.get("CLOUD_ORG", "local")
+            return self._redirect(f"/o/{org}/fleet")
+
+        match = re.match(r"^/o/[^/]+/(.*)$", path)
+        if match is None:
+            return self.send_error(HTTPStatus.NOT_FOUND)
+
+        route = match.group(1).rstrip("/")
+
+        if route == "":
+            return self._redirect("fleet")
+
+        for pattern, page in ROUTES:
+            if pattern.match(route):
+                return self._send((STATIC / page).read_bytes(), "text/html")
+
+        self.send_error(HTTPStatus.NOT_FOUND)
+
+
+class StandInServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, org: str) -> str:
+        return f"{self.url}/o/{org}/"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    server = StandInServer(port=int(os.environ.get("STAND_IN_PORT", 8765)))
+    print(f"Serving stand-in app at {server.base_url('local')}")
+    server.httpd.serve_forever()
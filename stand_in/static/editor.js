@@ -0,0 +1,858 @@
+// Stand-in mission editor. All form state lives in the MISSION store and the
+// DOM is synced from it, so restoring a store snapshot restores the editor.
+(() => {
+  const config = window.STAND_IN;
+  const { FakeMap, createThreeState, makeObject } = window.StandInMap;
+
+  const SLIDERS = {
+    height: { min: 3, max: 400, step: 1, value: 66 },
+    gimbalAngle: { min: 55, max: 90, step: 1, value: 90 },
+    overlap: { min: 1, max: 95, step: 1, value: 70 },
+    sidelap: { min: 1, max: 95, step: 1, value: 70 },
+    perimeterOverlap: { min: 1, max: 95, step: 1, value: 80 },
+    perimeterAngle: { min: 10, max: 80, step: 1, value: 60 },
+    maxSpeed: { min: 1, max: 36, step: 1, value: 11 },
+    flightDirection: { min: 0, max: 360, step: 1, value: 90 },
+  };
+  const CAPTURE = {
+    "White Balance": { min: 2000, max: 10000, step: 100, value: 5500 },
+    "Shutter Speed": { min: 1, max: 8000, step: 1, value: 500 },
+    ISO: { min: 100, max: 6400, step: 100, value: 100 },
+    "Brightness (EV)": { min: -3, max: 3, step: 1, value: 0 },
+  };
+  const TABLISTS = {
+    Resolution: ["Full", "1/4"],
+    "Camera Mode": ["Photo", "Burst"],
+    "Camera Sensor": ["X10 Wide", "X10 Narrow"],
+    "Image File Type": ["JPG", "DNG"],
+    "Capture Thermal": ["Off", "On"],
+    "Thermal File Type": ["JPG", "RJPG"],
+  };
+  const VEHICLES = ["Skydio X10 VT300L", "Skydio X10 VT300Z", "Skydio X10 V100L"];
+
+  const fillerSites = Array.from(
+    { length: config.fillerSites ?? 20 },
+    (_, i) => `Site ${String(i + 1).padStart(3, "0")}`,
+  );
+  const SITES = [
+    { name: config.siteName, location: config.siteLocation, docks: [config.dockName, "stand-in-dock-2"] },
+    ...fillerSites.map((name, i) => ({
+      name,
+      location: [config.siteLocation[0] + (i + 1) * 0.01, config.siteLocation[1]],
+      docks: [`${name.toLowerCase().replace(" ", "-")}-dock`],
+    })),
+  ].sort((a, b) => a.name.localeCompare(b.name));
+
+  const pad = (n) => String(n).padStart(2, "0");
+  const now = new Date();
+  const defaultName =
+    `Map Mission ${pad(now.getMonth() + 1)}/${pad(now.getDate())}/${now.getFullYear()} ` +
+    `${pad(now.getHours())}:${pad(now.getMinutes())}:${pad(now.getSeconds())}`;
+
+  const missionStore = window.createStore({
+    name: "",
+    site: null,
+    dock: null,
+    boundary: null,
+    section: "details",
+    params: {
+      ...Object.fromEntries(Object.entries(SLIDERS).map(([k, s]) => [k, s.value])),
+      crosshatch: false,
+      perimeter: false,
+      stopForPhoto: false,
+      strictBoundaries: false,
+      customFlightDirection: false,
+      perpendicularHeading: false,
+    },
+    camera: {
+      vehicle: VEHICLES[0],
+      Resolution: "Full",
+      "Camera Mode": "Photo",
+      "Camera Sensor": "X10 Wide",
+      "Image File Type": "JPG",
+      "Capture Thermal": "Off",
+      "Thermal File Type": "JPG",
+      capture: Object.fromEntries(Object.entries(CAPTURE).map(([k, s]) => [k, s.value])),
+    },
+  });
+  window.__DEV_GET_ZUSTAND_STORE_MISSION = () => missionStore;
+
+  const mission = () => missionStore.getState();
+  const update = (partial) => missionStore.setState(partial);
+  const setParam = (key, value) => update({ params: { ...mission().params, [key]: value } });
+  const setCamera = (key, value) => update({ camera: { ...mission().camera, [key]: value } });
+
+  // ---- map -----------------------------------------------------------------
+
+  const canvas = document.querySelector("canvas");
+  const resize = () => {
+    canvas.width = canvas.clientWidth;
+    canvas.height = canvas.clientHeight;
+  };
+  resize();
+
+  const map = new FakeMap(canvas, { center: [-98.5, 39.8], zoom: 4 });
+  const three = createThreeState(map);
+
+  const mapStore = window.createStore({
+    mapboxMapRef: { current: map },
+    threeStateRef: { current: three },
+    viewport: { center: map.getCenter(), zoom: map.getZoom() },
+  });
+  window.__DEV_GET_ZUSTAND_STORE_MAP = () => mapStore;
+
+  map.on("moveend", () => {
+    mapStore.setState({ viewport: { center: map.getCenter(), zoom: map.getZoom() } });
+  });
+  mapStore.subscribe((state, previous) => {
+    const { center, zoom } = state.viewport;
+    const current = map.getCenter();
+    if (
+      state.viewport !== previous.viewport &&
+      (center.lng !== current.lng || center.lat !== current.lat || zoom !== map.getZoom())
+    ) {
+      map.jumpTo({ center, zoom });
+    }
+  });
+
+  window.addEventListener("resize", () => {
+    resize();
+    map.fire("move");
+    draw();
+  });
+
+  let selectedVertex = null;
+  let dragging = null;
+
+  const boundaryPoints = () => dragging?.points ?? mission().boundary ?? [];
+
+  const syncScene = () => {
+    const state = mission();
+    const objects = [];
+    const site = SITES.find((s) => s.name === state.site);
+
+    if (site) {
+      const [lat, lng] = site.location;
+      objects.push(makeObject("KeepInZone", "Mesh", [lng, lat]));
+      objects.push(makeObject("KeepOutZone", "Mesh", [lng + 0.0005, lat + 0.0005]));
+    }
+
+    if (site && state.dock) {
+      const [lat, lng] = site.location;
+      objects.push(makeObject("DockMarker", "Sprite", [lng - 0.0002, lat - 0.0002]));
+    }
+
+    const points = boundaryPoints();
+    if (points.length) {
+      objects.push(makeObject("BoundaryLine", "Line", points[0]));
+      for (const point of points) {
+        objects.push(makeObject("EditableVertexSprite", "Sprite", point));
+      }
+    }
+
+    three.internal.interaction = objects;
+  };
+
+  let frame = null;
+  const draw = () => {
+    if (frame) return;
+    frame = requestAnimationFrame(() => {
+      frame = null;
+      render();
+    });
+  };
+
+  const render = () => {
+    const ctx = canvas.getContext("2d");
+    const { width, height } = canvas;
+
+    ctx.fillStyle = "#e8eef3";
+    ctx.fillRect(0, 0, width, height);
+
+    // a grid that pans and zooms with the map
+    const spacing = 64;
+    const { x: ox, y: oy } = map.project([0, 0]);
+    ctx.strokeStyle = "#d0d8e0";
+    ctx.beginPath();
+    for (let x = ((ox % spacing) + spacing) % spacing; x < width; x += spacing) {
+      ctx.moveTo(x, 0);
+      ctx.lineTo(x, height);
+    }
+    for (let y = ((oy % spacing) + spacing) % spacing; y < height; y += spacing) {
+      ctx.moveTo(0, y);
+      ctx.lineTo(width, y);
+    }
+    ctx.stroke();
+
+    for (const object of three.internal.interaction) {
+      const { x, y } = map.project(object.lngLat);
+      if (object.name === "KeepInZone") {
+        ctx.strokeStyle = "#2a9d8f";
+        ctx.strokeRect(x - 120, y - 120, 240, 240);
+      } else if (object.name === "DockMarker") {
+        ctx.fillStyle = "#264653";
+        ctx.fillRect(x - 6, y - 6, 12, 12);
+      }
+    }
+
+    const points = boundaryPoints().map((p) => map.project(p));
+    if (points.length) {
+      ctx.fillStyle = "rgba(22, 119, 255, 0.15)";
+      ctx.strokeStyle = "#1677ff";
+      ctx.beginPath();
+      points.forEach(({ x, y }, i) => (i ? ctx.lineTo(x, y) : ctx.moveTo(x, y)));
+      ctx.closePath();
+      ctx.fill();
+      ctx.stroke();
+
+      points.forEach(({ x, y }, i) => {
+        ctx.fillStyle = i === selectedVertex ? "#ff4d4f" : "white";
+        ctx.beginPath();
+        ctx.arc(x, y, 7, 0, Math.PI * 2);
+        ctx.fill();
+        ctx.stroke();
+      });
+    }
+  };
+
+  map.on("render", draw);
+
+  const toLngLatArray = ({ lng, lat }) => [lng, lat];
+
+  const canvasPoint = (event) => {
+    const rect = canvas.getBoundingClientRect();
+    return { x: event.clientX - rect.left, y: event.clientY - rect.top };
+  };
+
+  const hitVertex = (point) => {
+    const points = (mission().boundary ?? []).map((p) => map.project(p));
+    const index = points.findIndex((p) => Math.hypot(p.x - point.x, p.y - point.y) <= 12);
+    return index === -1 ? null : index;
+  };
+
+  const hitMidpoint = (point) => {
+    const points = (mission().boundary ?? []).map((p) => map.project(p));
+    for (let i = 0; i < points.length; i++) {
+      const a = points[i];
+      const b = points[(i + 1) % points.length];
+      const mid = { x: (a.x + b.x) / 2, y: (a.y + b.y) / 2 };
+      if (Math.hypot(mid.x - point.x, mid.y - point.y) <= 10) return i + 1;
+    }
+    return null;
+  };
+
+  canvas.addEventListener("mousedown", (event) => {
+    const point = canvasPoint(event);
+    const boundary = mission().boundary;
+    let index = hitVertex(point);
+
+    if (index === null && boundary) {
+      const insert = hitMidpoint(point);
+      if (insert !== null) {
+        const points = [...boundary];
+        points.splice(insert, 0, toLngLatArray(map.unproject(point)));
+        update({ boundary: points });
+        index = insert;
+      }
+    }
+
+    if (index !== null) {
+      dragging = { kind: "vertex", index, start: point, moved: false, points: [...mission().boundary] };
+    } else {
+      dragging = { kind: "pan", start: point, last: point, moved: false };
+      map.startInteraction();
+    }
+  });
+
+  document.addEventListener("mousemove", (event) => {
+    if (!dragging) return;
+    const point = canvasPoint(event);
+
+    if (Math.hypot(point.x - dragging.start.x, point.y - dragging.start.y) > 2) {
+      dragging.moved = true;
+    }
+
+    if (dragging.kind === "vertex" && dragging.moved) {
+      dragging.points[dragging.index] = toLngLatArray(map.unproject(point));
+      syncScene();
+      draw();
+    } else if (dragging.kind === "pan") {
+      map.panBy([dragging.last.x - point.x, dragging.last.y - point.y]);
+      dragging.last = point;
+    }
+  });
+
+  document.addEventListener("mouseup", () => {
+    if (!dragging) return;
+    const finished = dragging;
+    dragging = null;
+
+    if (finished.kind === "vertex") {
+      if (finished.moved) {
+        update({ boundary: finished.points });
+      } else {
+        selectedVertex = finished.index;
+        draw();
+      }
+    } else {
+      map.endInteraction();
+    }
+  });
+
+  canvas.addEventListener("wheel", (event) => {
+    event.preventDefault();
+    map.easeTo({ zoom: map.getZoom() + (event.deltaY < 0 ? 0.5 : -0.5) });
+  });
+
+  document.addEventListener("keydown", (event) => {
+    if (event.target.tagName === "INPUT") return;
+    if (!["Delete", "Backspace"].includes(event.key) || selectedVertex === null) return;
+
+    const boundary = mission().boundary ?? [];
+    if (boundary.length > 3) {
+      update({ boundary: boundary.filter((_, i) => i !== selectedVertex) });
+    }
+    selectedVertex = null;
+    draw();
+  });
+
+  const search = document.querySelector(".map-search");
+  search.addEventListener("keydown", (event) => {
+    if (event.key !== "Enter") return;
+    if (search.value.trim().toLowerCase() === config.addressQuery.toLowerCase()) {
+      const [lat, lng] = config.addressLocation;
+      map.flyTo({ center: [lng, lat], zoom: 17 });
+    }
+  });
+
+  // ---- ant-design select ---------------------------------------------------
+
+  const ITEM_HEIGHT = 32;
+  const VISIBLE_ITEMS = 8;
+
+  const createSelect = (root, { placeholder, options, onSelect }) => {
+    root.className = "ant-select ant-select-single ant-select-show-search";
+    root.setAttribute("aria-expanded", "false");
+    root.innerHTML = `
+      <div class="ant-select-selector">
+        <span class="ant-select-selection-search">
+          <input class="ant-select-selection-search-input" role="combobox" autocomplete="off" />
+        </span>
+        <span class="ant-select-selection-item"></span>
+      </div>`;
+
+    const selector = root.querySelector(".ant-select-selector");
+    const input = root.querySelector("input");
+    const item = root.querySelector(".ant-select-selection-item");
+    const dropdown = document.createElement("div");
+    dropdown.className = "ant-select-dropdown";
+    dropdown.hidden = true;
+    dropdown.innerHTML = `
+      <div class="rc-virtual-list">
+        <div class="rc-virtual-list-holder">
+          <div class="rc-virtual-list-holder-inner"></div>
+        </div>
+      </div>`;
+    document.body.appendChild(dropdown);
+
+    const holder = dropdown.querySelector(".rc-virtual-list-holder");
+    const inner = dropdown.querySelector(".rc-virtual-list-holder-inner");
+    let value = null;
+    let filtered = [];
+
+    // only the options in view are in the DOM, like rc-virtual-list
+    const renderOptions = () => {
+      const first = Math.max(0, Math.floor(holder.scrollTop / ITEM_HEIGHT) - 1);
+      const visible = filtered.slice(first, first + VISIBLE_ITEMS + 2);
+
+      inner.style.height = `${filtered.length * ITEM_HEIGHT}px`;
+      inner.style.position = "relative";
+      inner.innerHTML = "";
+
+      visible.forEach((option, i) => {
+        const element = document.createElement("div");
+        element.className = "ant-select-item ant-select-item-option";
+        if (option === value) element.classList.add("ant-select-item-option-selected");
+        element.title = option;
+        element.setAttribute("aria-selected", String(option === value));
+        element.style.position = "absolute";
+        element.style.top = `${(first + i) * ITEM_HEIGHT}px`;
+        element.style.left = "0";
+        element.style.right = "0";
+        element.innerHTML = `<div class="ant-select-item-option-content"></div>`;
+        element.firstChild.textContent = option;
+        element.addEventListener("mousedown", (event) => {
+          event.preventDefault();
+          close();
+          onSelect(option);
+        });
+        inner.appendChild(element);
+      });
+    };
+
+    const filter = () => {
+      const query = input.value.trim().toLowerCase();
+      filtered = options().filter((o) => o.toLowerCase().includes(query));
+      holder.scrollTop = 0;
+      renderOptions();
+    };
+
+    const open = () => {
+      const rect = root.getBoundingClientRect();
+      dropdown.style.top = `${rect.bottom + window.scrollY + 2}px`;
+      dropdown.style.left = `${rect.left + window.scrollX}px`;
+      dropdown.style.width = `${rect.width}px`;
+      dropdown.hidden = false;
+      root.setAttribute("aria-expanded", "true");
+      root.classList.add("ant-select-open");
+      input.value = "";
+      filter();
+      input.focus();
+    };
+
+    const close = () => {
+      dropdown.hidden = true;
+      root.setAttribute("aria-expanded", "false");
+      root.classList.remove("ant-select-open");
+      input.value = "";
+      item.hidden = false;
+    };
+
+    holder.addEventListener("scroll", renderOptions);
+    input.addEventListener("input", () => {
+      item.hidden = input.value !== "";
+      filter();
+    });
+    input.addEventListener("keydown", (event) => {
+      if (event.key === "Enter" && filtered.length) {
+        event.preventDefault();
+        const option = filtered[0];
+        close();
+        onSelect(option);
+      } else if (event.key === "Escape") {
+        close();
+      }
+    });
+    selector.addEventListener("mousedown", (event) => {
+      if (root.classList.contains("ant-select-disabled")) return;
+      event.preventDefault();
+      dropdown.hidden ? open() : close();
+    });
+    document.addEventListener("mousedown", (event) => {
+      if (!dropdown.hidden && !root.contains(event.target) && !dropdown.contains(event.target)) {
+        close();
+      }
+    });
+
+    return {
+      sync(selected, disabled) {
+        value = selected;
+        item.textContent = selected ?? placeholder;
+        root.classList.toggle("ant-select-disabled", disabled);
+        input.disabled = disabled;
+        if (disabled) close();
+      },
+    };
+  };
+
+  const siteSelect = createSelect(document.querySelector("[data-select=site]"), {
+    placeholder: "No Site",
+    options: () => ["No Site", ...SITES.map((s) => s.name)],
+    onSelect: (option) => {
+      const site = SITES.find((s) => s.name === option);
+      update({ site: site ? site.name : null, dock: null });
+      if (site) {
+        const [lat, lng] = site.location;
+        map.flyTo({ center: [lng, lat], zoom: 17 });
+      }
+    },
+  });
+
+  const dockLabel = (dock, i) => `${dock} - ${i === 0 ? "online" : "offline"}`;
+  const dockSelect = createSelect(document.querySelector("[data-select=dock]"), {
+    placeholder: "No Dock",
+    options: () => (SITES.find((s) => s.name === mission().site)?.docks ?? []).map(dockLabel),
+    onSelect: (option) => update({ dock: option }),
+  });
+
+  // ---- ant-design slider ---------------------------------------------------
+
+  const clamp = (value, { min, max, step }) =>
+    Math.min(max, Math.max(min, Math.round(value / step) * step));
+
+  const createSlider = (root, spec, { onCommit, icon = false }) => {
+    root.className = "slider-row";
+    root.innerHTML = `
+      <div class="ant-slider ant-slider-horizontal">
+        <div class="ant-slider-rail"></div>
+        <div class="ant-slider-track"></div>
+        <div class="ant-slider-handle" role="slider" tabindex="0"
+          aria-valuemin="${spec.min}" aria-valuemax="${spec.max}" aria-orientation="horizontal"></div>
+      </div>
+      <div class="ant-input-number"><input class="ant-input-number-input" role="spinbutton" step="${spec.step}" /></div>
+      ${icon ? '<img class="gimbal-icon" alt="" src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" />' : ""}`;
+
+    const slider = root.querySelector(".ant-slider");
+    const rail = root.querySelector(".ant-slider-rail");
+    const track = root.querySelector(".ant-slider-track");
+    const handle = root.querySelector(".ant-slider-handle");
+    const input = root.querySelector("input");
+    const img = root.querySelector("img");
+    let value = spec.value;
+    let active = false;
+
+    const show = (v) => {
+      const percent = ((v - spec.min) / (spec.max - spec.min)) * 100;
+      handle.style.left = `${percent}%`;
+      track.style.width = `${percent}%`;
+      handle.setAttribute("aria-valuenow", String(v));
+      input.value = String(v);
+      if (img) img.style.transform = `rotate(${v}deg)`;
+    };
+
+    const fromX = (clientX) => {
+      const rect = rail.getBoundingClientRect();
+      const ratio = Math.min(1, Math.max(0, (clientX - rect.left) / rect.width));
+      return clamp(spec.min + ratio * (spec.max - spec.min), spec);
+    };
+
+    const commit = (v) => {
+      value = clamp(v, spec);
+      show(value);
+      onCommit(value);
+    };
+
+    slider.addEventListener("mousedown", (event) => {
+      event.preventDefault();
+      active = true;
+      handle.focus();
+      show(fromX(event.clientX));
+    });
+    document.addEventListener("mousemove", (event) => {
+      if (active) show(fromX(event.clientX));
+    });
+    document.addEventListener("mouseup", (event) => {
+      if (!active) return;
+      active = false;
+      commit(fromX(event.clientX));
+    });
+    handle.addEventListener("keydown", (event) => {
+      const keys = {
+        ArrowRight: value + spec.step,
+        ArrowUp: value + spec.step,
+        ArrowLeft: value - spec.step,
+        ArrowDown: value - spec.step,
+        Home: spec.min,
+        End: spec.max,
+      };
+      if (!(event.key in keys)) return;
+      event.preventDefault();
+      commit(keys[event.key]);
+    });
+
+    const commitInput = () => {
+      const parsed = parseFloat(input.value);
+      commit(Number.isNaN(parsed) ? value : parsed);
+    };
+    input.addEventListener("keydown", (event) => {
+      if (event.key === "Enter") commitInput();
+    });
+    input.addEventListener("blur", commitInput);
+
+    show(value);
+
+    return {
+      sync(v) {
+        if (!active && v !== value) {
+          value = v;
+          show(v);
+        }
+      },
+    };
+  };
+
+  const sliders = Object.fromEntries(
+    Object.entries(SLIDERS).map(([key, spec]) => [
+      key,
+      createSlider(document.querySelector(`[data-slider=${key}]`), spec, {
+        icon: key === "gimbalAngle",
+        onCommit: (v) => setParam(key, v),
+      }),
+    ]),
+  );
+
+  // ---- accordion and form --------------------------------------------------
+
+  const sections = [...document.querySelectorAll("[data-section]")];
+  sections.forEach((section) => {
+    section.querySelector(".AccordionForm_sectionHeading__yykmm").addEventListener("click", () => {
+      const name = section.dataset.section;
+      update({ section: mission().section === name ? null : name });
+    });
+  });
+
+  const nameInput = document.querySelector("[data-field=name]");
+  nameInput.placeholder = defaultName;
+  nameInput.addEventListener("input", () => update({ name: nameInput.value }));
+
+  const addBoundary = document.querySelector("[data-action=add-boundary]");
+  addBoundary.addEventListener("click", () => {
+    const { x, y } = { x: canvas.clientWidth / 2, y: canvas.clientHeight / 2 };
+    const offsets = [[-100, -100], [100, -100], [100, 100], [-100, 100]];
+    update({
+      boundary: offsets.map(([dx, dy]) => toLngLatArray(map.unproject({ x: x + dx, y: y + dy }))),
+    });
+  });
+
+  document.querySelectorAll("[data-switch]").forEach((button) => {
+    button.addEventListener("click", () => {
+      const key = button.dataset.switch;
+      setParam(key, !mission().params[key]);
+    });
+  });
+
+  // ---- camera settings -----------------------------------------------------
+
+  const modal = document.querySelector(".CameraActionEditor");
+  const settingsPane = modal.querySelector("[data-pane=Settings]");
+  const capturePane = modal.querySelector("[data-pane=Capture]");
+  const sensorButton = modal.querySelector("[data-action=sensor-menu]");
+  let tooltip = null;
+
+  const warnings = (camera) => ({
+    "Camera Sensor":
+      camera.vehicle === "Skydio X10 VT300Z" && camera["Camera Sensor"] === "X10 Wide",
+    "Capture Thermal": camera.vehicle === "Skydio X10 V100L" && camera["Capture Thermal"] === "On",
+    "Thermal File Type":
+      camera.vehicle === "Skydio X10 V100L" && camera["Capture Thermal"] === "On",
+  });
+
+  const disabled = (camera) => ({
+    "Camera Mode": camera.Resolution !== "1/4",
+    "Thermal File Type": camera["Capture Thermal"] !== "On",
+  });
+
+  const tablists = Object.fromEntries(
+    Object.entries(TABLISTS).map(([label, options]) => {
+      const row = document.createElement("div");
+      row.className = "tablist-row";
+      row.innerHTML = `
+        <span>${label}</span>
+        <svg width="12" height="12" hidden><circle cx="6" cy="6" r="6" fill="orange" /></svg>
+        <div data-slot="tabList" role="tablist">
+          ${options.map((o) => `<button type="button" role="tab">${o}</button>`).join("")}
+        </div>
+        <span class="notice"></span>`;
+
+      const svg = row.querySelector("svg");
+      svg.addEventListener("mouseenter", () => {
+        tooltip?.remove();
+        tooltip = document.createElement("div");
+        tooltip.className = "tooltip";
+        tooltip.dataset.slot = "content";
+        tooltip.dataset.open = "true";
+        tooltip.textContent = `Setting not available on ${mission().camera.vehicle}`;
+        const rect = svg.getBoundingClientRect();
+        tooltip.style.top = `${rect.bottom + 4}px`;
+        tooltip.style.left = `${rect.left}px`;
+        document.body.appendChild(tooltip);
+      });
+      svg.addEventListener("mouseleave", () => {
+        if (tooltip) tooltip.dataset.open = "false";
+      });
+
+      row.querySelectorAll("button").forEach((button) => {
+        button.addEventListener("click", () => setCamera(label, button.textContent));
+      });
+
+      settingsPane.appendChild(row);
+      return [label, row];
+    }),
+  );
+
+  const captureSliders = Object.fromEntries(
+    Object.entries(CAPTURE).map(([label, spec]) => {
+      const row = document.createElement("div");
+      row.className = "exposureCompRow";
+      row.innerHTML = `<span>${label}</span><div></div><button type="button">Auto On</button>`;
+      capturePane.appendChild(row);
+
+      const slider = createSlider(row.querySelector("div"), spec, {
+        onCommit: (v) => setCamera("capture", { ...mission().camera.capture, [label]: v }),
+      });
+      return [label, slider];
+    }),
+  );
+
+  modal.querySelector("#rc-tabs-0-tab-Settings").addEventListener("click", () => {
+    settingsPane.hidden = false;
+    capturePane.hidden = true;
+  });
+  modal.querySelector("#rc-tabs-0-tab-Capture").addEventListener("click", () => {
+    settingsPane.hidden = true;
+    capturePane.hidden = false;
+  });
+  modal.querySelector("[data-action=close-camera]").addEventListener("click", () => {
+    modal.hidden = true;
+  });
+  document.querySelector("[data-action=camera-settings]").addEventListener("click", () => {
+    modal.hidden = false;
+  });
+
+  sensorButton.addEventListener("click", () => {
+    const menu = document.createElement("div");
+    menu.className = "sensor-menu";
+    menu.innerHTML = VEHICLES.map((v) => `<span>${v}</span>`).join("");
+    const rect = sensorButton.getBoundingClientRect();
+    menu.style.top = `${rect.bottom}px`;
+    menu.style.left = `${rect.left}px`;
+    menu.style.position = "fixed";
+    menu.querySelectorAll("span").forEach((span) => {
+      span.addEventListener("click", () => {
+        setCamera("vehicle", span.textContent);
+        menu.remove();
+      });
+    });
+    document.body.appendChild(menu);
+  });
+
+  // ---- estimates -----------------------------------------------------------
+
+  const areaM2 = (points) => {
+    const lat0 = (points.reduce((s, p) => s + p[1], 0) / points.length) * (Math.PI / 180);
+    const xy = points.map(([lng, lat]) => [lng * 111320 * Math.cos(lat0), lat * 110540]);
+    let area = 0;
+    for (let i = 0; i < xy.length; i++) {
+      const [x1, y1] = xy[i];
+      const [x2, y2] = xy[(i + 1) % xy.length];
+      area += x1 * y2 - x2 * y1;
+    }
+    return Math.abs(area) / 2;
+  };
+
+  const estimate = (state) => {
+    const { params, camera } = state;
+    const heightM = params.height * 0.3048;
+    const sensor = camera["Camera Sensor"] === "X10 Narrow" ? 0.5 : 1;
+    const footprint = Math.max(1, heightM * 1.2 * sensor);
+    const colorGsd = heightM * 0.04 * sensor * (camera.Resolution === "1/4" ? 2 : 1);
+    const thermalGsd = heightM * 0.25;
+    const gsd = [`${colorGsd.toFixed(2)} cm/px`, `${thermalGsd.toFixed(2)} cm/px`];
+
+    if (!state.boundary) return ["0 min", "-", ...gsd];
+
+    const side = Math.sqrt(areaM2(state.boundary));
+    const passes = params.crosshatch ? 2 : 1;
+    const lineSpacing = Math.max(0.5, footprint * (1 - params.sidelap / 100));
+    const photoSpacing = Math.max(0.5, footprint * 0.75 * (1 - params.overlap / 100));
+    const lines = Math.ceil(side / lineSpacing) + 1;
+    const perLine = Math.ceil(side / photoSpacing) + 1;
+
+    let photos = passes * lines * perLine;
+    let distance = passes * (lines * side + (lines - 1) * lineSpacing);
+
+    if (params.perimeter) {
+      const perimeter = 4 * side;
+      const spacing = Math.max(0.5, footprint * 0.75 * (1 - params.perimeterOverlap / 100));
+      photos += Math.ceil(perimeter / spacing);
+      distance += perimeter;
+    }
+
+    const seconds = distance / (params.maxSpeed * 0.44704) + (params.stopForPhoto ? photos * 2 : 0);
+    const minutes = seconds / 60;
+    let time = `${minutes.toFixed(1)} min`;
+    if (minutes > 600) time = "Too large";
+    else if (minutes >= 60) time = `${(minutes / 60).toFixed(1)} hr`;
+
+    return [time, String(photos), ...gsd];
+  };
+
+  const cells = [...document.querySelectorAll("table td")];
+  let pending = null;
+  let lastKey = null;
+
+  // debounced like a request to the estimates endpoint, with a skeleton
+  // while it's in flight
+  const recompute = () => {
+    const state = mission();
+    const key = JSON.stringify([state.boundary, state.params, state.camera]);
+    if (key === lastKey) return;
+    lastKey = key;
+
+    clearTimeout(pending);
+    pending = setTimeout(() => {
+      cells.forEach((cell) => {
+        cell.innerHTML = '<span class="ant-skeleton-button"></span>';
+      });
+      pending = setTimeout(() => {
+        estimate(mission()).forEach((value, i) => {
+          cells[i].textContent = value;
+        });
+      }, 250);
+    }, 100);
+  };
+
+  // ---- sync ----------------------------------------------------------------
+
+  const sync = () => {
+    const state = mission();
+    const hasBoundary = !!state.boundary;
+
+    sections.forEach((section) => {
+      const open = section.dataset.section === state.section;
+      section.querySelector(".anticon").className = `anticon ${open ? "anticon-down" : "anticon-right"}`;
+      section.querySelector(".section-body").hidden = !open;
+    });
+
+    if (document.activeElement !== nameInput) nameInput.value = state.name;
+
+    siteSelect.sync(state.site, hasBoundary);
+    dockSelect.sync(state.dock, hasBoundary || !state.site);
+    addBoundary.hidden = hasBoundary;
+    addBoundary.disabled = !!state.site && !state.dock;
+
+    document.querySelectorAll("[data-when]").forEach((element) => {
+      const when = element.dataset.when;
+      element.hidden = !{
+        boundary: hasBoundary,
+        "no-boundary": !hasBoundary,
+        perimeter: state.params.perimeter,
+        customFlightDirection: state.params.customFlightDirection,
+      }[when];
+    });
+
+    Object.entries(sliders).forEach(([key, slider]) => slider.sync(state.params[key]));
+    document.querySelectorAll("[data-switch]").forEach((button) => {
+      button.setAttribute("aria-checked", String(!!state.params[button.dataset.switch]));
+    });
+
+    const camera = state.camera;
+    const warn = warnings(camera);
+    const off = disabled(camera);
+    sensorButton.textContent = camera.vehicle;
+    Object.entries(tablists).forEach(([label, row]) => {
+      row.querySelectorAll("button").forEach((button) => {
+        button.setAttribute("aria-selected", String(button.textContent === camera[label]));
+        button.disabled = !!off[label];
+      });
+      row.querySelector("svg").toggleAttribute("hidden", !warn[label]);
+      row.querySelector(".notice").textContent =
+        label === "Camera Mode" && off[label] ? "Burst mode only available in 1/4 resolution" : "";
+    });
+    Object.entries(captureSliders).forEach(([label, slider]) => slider.sync(camera.capture[label]));
+
+    document.querySelector("[data-field=json]").textContent = JSON.stringify(
+      { name: state.name || defaultName, site: state.site, boundary: state.boundary, ...state.params },
+      null,
+      2,
+    );
+
+    if (!dragging) selectedVertex = hasBoundary ? selectedVertex : null;
+    syncScene();
+    draw();
+    recompute();
+  };
+
+  missionStore.subscribe(sync);
+  sync();
+})();
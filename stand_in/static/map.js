@@ -0,0 +1,248 @@
+// Fake mapbox map and three.js state drawn on a 2D canvas.
+//
+// World coordinates are web mercator pixels at zoom 0 (a 512px world), the
+// three "camera" projection matrix maps them onto the canvas the same way
+// `FakeMap.project` does, so vertex projection in the page objects lines up.
+(() => {
+  const TILE = 512;
+  const IDENTITY = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1];
+
+  const toLngLat = (value) => {
+    if (Array.isArray(value)) return { lng: value[0], lat: value[1] };
+    return { lng: value.lng ?? value.lon, lat: value.lat };
+  };
+
+  const toWorld = (lngLat) => {
+    const { lng, lat } = toLngLat(lngLat);
+    const sin = Math.sin((lat * Math.PI) / 180);
+    return [
+      ((lng + 180) / 360) * TILE,
+      (0.5 - Math.log((1 + sin) / (1 - sin)) / (4 * Math.PI)) * TILE,
+    ];
+  };
+
+  const fromWorld = ([x, y]) => {
+    const n = Math.PI - (2 * Math.PI * y) / TILE;
+    return {
+      lng: (x / TILE) * 360 - 180,
+      lat: (180 / Math.PI) * Math.atan(0.5 * (Math.exp(n) - Math.exp(-n))),
+    };
+  };
+
+  class Bounds {
+    constructor(sw, ne) {
+      this._sw = sw;
+      this._ne = ne;
+    }
+
+    contains(value) {
+      const { lng, lat } = toLngLat(value);
+      return (
+        lng >= this._sw.lng && lng <= this._ne.lng &&
+        lat >= this._sw.lat && lat <= this._ne.lat
+      );
+    }
+  }
+
+  class FakeMap {
+    constructor(canvas, { center, zoom }) {
+      this.canvas = canvas;
+      this.center = toLngLat(center);
+      this.zoom = zoom;
+      this.listeners = {};
+      this.moving = false;
+      this.zooming = false;
+      this.animation = null;
+    }
+
+    on(type, listener) {
+      (this.listeners[type] ||= new Set()).add(listener);
+      return this;
+    }
+
+    off(type, listener) {
+      this.listeners[type]?.delete(listener);
+      return this;
+    }
+
+    once(type, listener) {
+      const wrapped = (event) => {
+        this.off(type, wrapped);
+        listener(event);
+      };
+      return this.on(type, wrapped);
+    }
+
+    fire(type) {
+      for (const listener of [...(this.listeners[type] || [])]) {
+        listener({ type, target: this });
+      }
+    }
+
+    loaded() { return true; }
+    isMoving() { return this.moving; }
+    isZooming() { return this.zooming; }
+    isRotating() { return false; }
+    getCenter() { return { ...this.center }; }
+    getZoom() { return this.zoom; }
+    getBearing() { return 0; }
+    getPitch() { return 0; }
+
+    scale() { return 2 ** this.zoom; }
+
+    centerPx() {
+      const [x, y] = toWorld(this.center);
+      return [x * this.scale(), y * this.scale()];
+    }
+
+    project(lngLat) {
+      const [x, y] = toWorld(lngLat);
+      const [cx, cy] = this.centerPx();
+      return {
+        x: x * this.scale() - cx + this.canvas.clientWidth / 2,
+        y: y * this.scale() - cy + this.canvas.clientHeight / 2,
+      };
+    }
+
+    unproject(point) {
+      const { x, y } = Array.isArray(point) ? { x: point[0], y: point[1] } : point;
+      const [cx, cy] = this.centerPx();
+      return fromWorld([
+        (x - this.canvas.clientWidth / 2 + cx) / this.scale(),
+        (y - this.canvas.clientHeight / 2 + cy) / this.scale(),
+      ]);
+    }
+
+    getBounds() {
+      const w = this.canvas.clientWidth;
+      const h = this.canvas.clientHeight;
+      const nw = this.unproject({ x: 0, y: 0 });
+      const se = this.unproject({ x: w, y: h });
+      return new Bounds({ lng: nw.lng, lat: se.lat }, { lng: se.lng, lat: nw.lat });
+    }
+
+    _changed() {
+      this.fire("move");
+      this.fire("render");
+    }
+
+    _finish() {
+      this.moving = false;
+      this.zooming = false;
+      this.fire("moveend");
+      // give the "tiles" a frame to render before going idle
+      requestAnimationFrame(() => {
+        if (!this.moving) this.fire("idle");
+      });
+    }
+
+    jumpTo({ center, zoom }) {
+      this.fire("movestart");
+      if (center) this.center = toLngLat(center);
+      if (zoom !== undefined) this.zoom = zoom;
+      this._changed();
+      this._finish();
+    }
+
+    panBy([dx, dy]) {
+      const center = this.unproject({
+        x: this.canvas.clientWidth / 2 + dx,
+        y: this.canvas.clientHeight / 2 + dy,
+      });
+      this.center = center;
+      this._changed();
+    }
+
+    flyTo({ center, zoom, duration = 600 }) {
+      const from = { ...this.center, zoom: this.zoom };
+      const to = { ...toLngLat(center ?? this.center), zoom: zoom ?? this.zoom };
+      const start = performance.now();
+
+      if (this.animation) cancelAnimationFrame(this.animation);
+
+      this.moving = true;
+      this.zooming = to.zoom !== from.zoom;
+      this.fire("movestart");
+
+      const step = (now) => {
+        const t = Math.min(1, (now - start) / duration);
+        const ease = t * (2 - t);
+
+        this.center = {
+          lng: from.lng + (to.lng - from.lng) * ease,
+          lat: from.lat + (to.lat - from.lat) * ease,
+        };
+        this.zoom = from.zoom + (to.zoom - from.zoom) * ease;
+        this._changed();
+
+        if (t < 1) {
+          this.animation = requestAnimationFrame(step);
+        } else {
+          this.animation = null;
+          this._finish();
+        }
+      };
+
+      this.animation = requestAnimationFrame(step);
+    }
+
+    easeTo(options) {
+      this.flyTo({ duration: 300, ...options });
+    }
+
+    startInteraction() {
+      this.moving = true;
+      this.fire("movestart");
+    }
+
+    endInteraction() {
+      this._finish();
+    }
+  }
+
+  const makeObject = (name, type, lngLat) => {
+    const [x, y] = toWorld(lngLat);
+    const elements = [...IDENTITY];
+    elements[12] = x;
+    elements[13] = y;
+
+    return {
+      name,
+      type,
+      lngLat: toLngLat(lngLat),
+      matrixWorld: { elements },
+      updateWorldMatrix() {},
+    };
+  };
+
+  const createThreeState = (map) => {
+    const three = {
+      camera: {
+        matrixWorldInverse: { elements: [...IDENTITY] },
+        projectionMatrix: { elements: [...IDENTITY] },
+      },
+      gl: { domElement: map.canvas },
+      internal: { interaction: [] },
+    };
+
+    // ndc = (world * scale - center) / half, with y flipped
+    const update = () => {
+      const halfW = map.canvas.width / 2;
+      const halfH = map.canvas.height / 2;
+      const [cx, cy] = map.centerPx();
+      const e = three.camera.projectionMatrix.elements;
+
+      e[0] = map.scale() / halfW;
+      e[12] = -cx / halfW;
+      e[5] = -map.scale() / halfH;
+      e[13] = cy / halfH;
+    };
+
+    map.on("move", update);
+    update();
+
+    return three;
+  };
+
+  window.StandInMap = { FakeMap, createThreeState, makeObject, toWorld, fromWorld };
+})();
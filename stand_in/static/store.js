@@ -0,0 +1,19 @@
+// Minimal zustand-like vanilla store: getState / setState / subscribe.
+window.createStore = (initial) => {
+  let state = initial;
+  const listeners = new Set();
+
+  return {
+    getState: () => state,
+    setState: (partial) => {
+      const next = typeof partial === "function" ? partial(state) : partial;
+      const previous = state;
+      state = { ...state, ...next };
+      listeners.forEach((listener) => listener(state, previous));
+    },
+    subscribe: (listener) => {
+      listeners.add(listener);
+      return () => listeners.delete(listener);
+    },
+  };
+};
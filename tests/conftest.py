@@ -3,22 +3,46 @@ import os
 
 import pytest
 
-pytest_plugins = ["fixtures.auth", "fixtures.mission", "fixtures.testrail"]
+import data.config as cfg
+
+pytest_plugins = [
+    "fixtures.auth",
+    "fixtures.batch",
+    "fixtures.benchmarks",
+    "fixtures.durations",
+    "fixtures.har",
+    "fixtures.mission",
+    "fixtures.roundtrips",
+    "fixtures.shared_browser",
+    "fixtures.stand_in",
+    "fixtures.testrail",
+    "fixtures.timing",
+]
 
 
 def pytest_addoption(parser: pytest.Parser):
     parser.addoption(
-        "--env", action="store", default="production", choices=["production", "env"]
+        "--env",
+        action="store",
+        default="production",
+        choices=["production", "env", "local"],
     )
 
 
+def pytest_configure(config: pytest.Config):
+    if config.getoption("--env") == "local":
+        cfg.use_local_defaults()
+
+
 @pytest.fixture(scope="session")
 def env_name(request):
     return request.config.getoption("--env")
 
 
 @pytest.fixture(scope="session")
-def base_url(env_name, cloud_org):
+def base_url(request, env_name, cloud_org):
+    if env_name == "local":
+        return request.getfixturevalue("stand_in").base_url(cloud_org)
     if env_name == "env" and (cloud_url := os.environ.get("CLOUD_URL")):
         logging.info("Using `CLOUD_URL` from environment")
         return cloud_url
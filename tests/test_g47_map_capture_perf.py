@@ -0,0 +1,204 @@
+import time
+
+import pytest
+
+from components.frames import FrameRecorder
+from pages.missions_page import MissionEditor
+from utils.benchmarks import BenchmarkHistory, PerfBaseline, scaling_exponent
+from utils.boundaries import METERS_PER_DEGREE, is_simple, star_boundary
+from utils.points import calculate_distance
+
+# every size adds vertices on the previous one's edges through the map, like a
+# user would, so the largest is bounded by how close the edge handles get
+BOUNDARY_SIZES = [4, 8, 16, 32]
+# an edge's midpoint handle is within a vertex's 12px hit radius under this
+MIN_EDGE_PX = 30
+# how far out the vertex timed for an edit is dragged, canvas px
+EDIT_PX = 20
+
+
+def _boundary_in_view(mission: MissionEditor, center: list[float], vertices: int):
+    """A star boundary around `center` (lng, lat) spanning most of the canvas."""
+    lng, lat = center
+    here, north = mission.map.convert_scan_to_px([[lng, lat], [lng, lat + 1e-3]])
+    px_per_meter = abs(here["y"] - north["y"]) / (1e-3 * METERS_PER_DEGREE)
+    height = mission.map.canvas.bounding_box()["height"]
+
+    return star_boundary(
+        (lat, lng), vertices, radius=0.4 * height / px_per_meter, seed=0, jitter=0.3
+    )
+
+
+def _add_vertices(mission: MissionEditor, targets: list[dict], placed: list[int]):
+    """Adds the vertices at `targets` every index of which isn't in `placed`.
+
+    Each goes on the edge between the placed vertices either side of it, so
+    the boundary stays star-shaped while it grows.
+    """
+    frame = mission.map.canvas.bounding_box()
+
+    for index in range(len(targets)):
+        if index in placed:
+            continue
+
+        after = max(i for i in placed if i < index)
+        before = min((i for i in placed if i > index), default=placed[0])
+
+        mission.map.insert_vertex(
+            mission.page.mouse,
+            targets[after],
+            targets[before],
+            targets[index],
+            frame=frame,
+        )
+        placed.append(index)
+        placed.sort()
+
+
+def _time_vertex_edit(mission: MissionEditor, center: dict, vertex: dict) -> dict:
+    """Settle time and frames while `vertex` is dragged away from `center`."""
+    estimates = mission.estimates
+    mouse = mission.page.mouse
+
+    distance = calculate_distance(center, vertex)
+    moved = {
+        axis: vertex[axis] + (vertex[axis] - center[axis]) * EDIT_PX / distance
+        for axis in ("x", "y")
+    }
+
+    before = estimates.wait_for_settled()
+
+    with FrameRecorder(mission.page) as frames:
+        start = time.perf_counter()
+        mission.map.drag_point(mouse, vertex, moved)
+        estimates.wait_for_settled(before, expect_change=True)
+        # settling includes a quiet period after the last change
+        settle = time.perf_counter() - start - estimates.QUIET_MS / 1000
+
+    # back where the next size's edges expect it
+    mission.map.drag_point(mouse, moved, vertex)
+
+    return {"settle_s": round(max(settle, 0), 3), **frames.summary()}
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("dock", [None], ids=["no-dock"], indirect=True)
+def test_boundary_scaling(
+    mission: MissionEditor, benchmarks: BenchmarkHistory, scaling_tolerance: float
+):
+    mission.map.wait_for_idle()
+
+    largest = BOUNDARY_SIZES[-1]
+    center = mission.map.camera()["center"]
+    corners = _boundary_in_view(mission, center, largest)
+    assert is_simple(corners)
+
+    center_px, *targets = mission.map.convert_scan_to_px([center, *corners])
+    shortest = min(
+        calculate_distance(a, b)
+        for a, b in zip(targets, targets[1:] + targets[:1], strict=True)
+    )
+    assert shortest >= MIN_EDGE_PX, f"Boundary edges down to {shortest:.0f}px"
+
+    # the mission's boundary becomes every few corners of the largest one
+    placed = list(range(0, largest, largest // BOUNDARY_SIZES[0]))
+    mission.map.drag_bounds_to_coords(mission.page.mouse, [corners[i] for i in placed])
+
+    results = {}
+
+    for size in BOUNDARY_SIZES:
+        stride = largest // size
+        _add_vertices(mission, targets[::stride], [i // stride for i in placed])
+        placed = list(range(0, largest, stride))
+
+        assert len(mission.map.get_current_map_points()) == size
+
+        results[size] = _time_vertex_edit(mission, center_px, targets[0])
+
+    exponents = {
+        "settle_s": scaling_exponent(
+            BOUNDARY_SIZES, [results[s]["settle_s"] for s in BOUNDARY_SIZES]
+        ),
+        "p95_ms": scaling_exponent(
+            BOUNDARY_SIZES, [results[s]["p95_ms"] for s in BOUNDARY_SIZES]
+        ),
+    }
+
+    previous = benchmarks.previous("boundary_scaling")
+    benchmarks.record("boundary_scaling", {"sizes": results, "exponents": exponents})
+
+    for metric, exponent in exponents.items():
+        if previous:
+            release, result = previous
+            limit = result["exponents"][metric] + scaling_tolerance
+            against = f"release {release}"
+        else:
+            limit = 1 + scaling_tolerance
+            against = "linear"
+
+        assert exponent <= limit, (
+            f"{metric} grows as vertices^{exponent:.2f}, worse than {against} "
+            f"(limit {limit:.2f}): {results}"
+        )
+
+
+def _pan(mission: MissionEditor):
+    for dx in (300, -300, 300, -300):
+        mission.map.pan(dx, 0)
+
+
+def _zoom(mission: MissionEditor):
+    for delta in (-300, 300, -300, 300):
+        mission.map.zoom(delta)
+        mission.map.wait_for_idle()
+
+
+def _drag_boundary(mission: MissionEditor):
+    points = mission.map.get_current_map_points()
+    moved = [{"x": p["x"] + 20, "y": p["y"] + 20} for p in points]
+
+    there = list(zip(points, moved, strict=True))
+    back = [(goal, actual) for actual, goal in there]
+
+    for actual, goal in there + back:
+        mission.map.drag_point(mission.page.mouse, actual, goal, steps=10)
+
+
+MAP_SCENARIOS = {
+    "pan": _pan,
+    "zoom": _zoom,
+    "drag-boundary": _drag_boundary,
+}
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("scenario", list(MAP_SCENARIOS))
+def test_map_rendering(
+    mission: MissionEditor,
+    scenario: str,
+    benchmarks: BenchmarkHistory,
+    perf_baseline: PerfBaseline,
+    perf_thresholds: dict[str, float],
+    update_perf_baseline: bool,
+):
+    if not update_perf_baseline and not perf_baseline.has(scenario):
+        pytest.skip(
+            f"No {scenario!r} baseline in {perf_baseline.path}, record one with "
+            "--update-perf-baseline"
+        )
+
+    mission.map.wait_for_idle()
+
+    with mission.map.record_frames() as frames:
+        MAP_SCENARIOS[scenario](mission)
+        mission.map.wait_for_idle()
+
+    result = frames.summary()
+    benchmarks.record(f"map_{scenario}", result)
+
+    if update_perf_baseline:
+        perf_baseline.update(scenario, result)
+        return
+
+    regressions = perf_baseline.compare(scenario, result, perf_thresholds)
+    assert not regressions, f"{scenario} rendering regressed: {'; '.join(regressions)}"
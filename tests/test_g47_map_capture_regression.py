@@ -27,7 +27,6 @@ def test_map_search(mission: MissionEditor):
 
     with change:
         mission.search_in_map(cfg.ADDRESS_QUERY)
-        mission.map.wait_for_not_zooming()
 
     assert change.bounds_changed
     assert mission.map.contains_location(cfg.ADDRESS_LOCATION)
@@ -47,6 +46,7 @@ def test_add_boundaries(mission: MissionEditor):
         boundary_button.click()
 
     assert change.rendered > 0
+    assert change.scene.vertices > 0
 
 
 @pytest.mark.parametrize("dock", [None], ids=["no dock"], indirect=True)
@@ -129,7 +129,7 @@ def test_site_selection_with_boundary(mission: MissionEditor):
 @pytest.mark.testrail(id=[813400, 813392])
 def test_site_selection_map(mission: MissionEditor):
     mission.map.poll_for_map_ref()
-    change = mission.map.map_change()
+    change = mission.map.map_change(expect_move=True)
 
     with change:
         mission.mission_details.site.select(cfg.SITE_NAME)
@@ -144,7 +144,6 @@ def test_site_selection_map(mission: MissionEditor):
 @pytest.mark.testrail(id=[813399])
 def test_site_proceed_no_site(mission: MissionEditor):
     mission.search_in_map(cfg.ADDRESS_QUERY)
-    mission.map.wait_for_not_zooming()
 
     mission.mission_details.add_boundary.click()
 
@@ -163,9 +162,7 @@ def test_site_proceed_no_site(mission: MissionEditor):
 @pytest.mark.testrail(id=[813000, 812999])
 def test_dock_selection_map(mission: MissionEditor):
     change = mission.map.map_change()
-    poll = mission.map.poll_for_map_change(
-        attempts=60, func=mission.map.get_rendered_object_count
-    )
+    poll = mission.map.poll_for_map_change(timeout=12_000)
 
     with change, poll:
         mission.mission_details.dock.select(re.compile(cfg.DOCK_NAME + ".*"))
@@ -0,0 +1,7 @@
+import pytest
+
+
+# pytest-base-url resolves `base_url` for every test, these never open the app
+@pytest.fixture(scope="session")
+def base_url():
+    return None
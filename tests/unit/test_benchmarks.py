@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from utils.benchmarks import (
+    DEFAULT_THRESHOLD,
+    BenchmarkHistory,
+    PerfBaseline,
+    scaling_exponent,
+)
+
+SIZES = [4, 16, 64, 256]
+
+
+@pytest.mark.parametrize("k", [0, 0.5, 1, 2])
+def test_scaling_exponent(k):
+    values = [3 * size**k for size in SIZES]
+
+    assert scaling_exponent(SIZES, values) == pytest.approx(k)
+
+
+def test_scaling_exponent_of_nothing_measurable():
+    assert scaling_exponent(SIZES, [0, 0, 0, 0]) == pytest.approx(0)
+
+
+def test_history_previous_release(tmp_path):
+    path = tmp_path / "benchmarks.json"
+
+    BenchmarkHistory(path, "2024.10").record("scaling", {"k": 1.0})
+    BenchmarkHistory(path, "2024.11").record("scaling", {"k": 1.1})
+
+    history = BenchmarkHistory(path, "2024.12")
+    assert history.previous("scaling") == ("2024.11", {"k": 1.1})
+    assert history.previous("other") is None
+
+    # the running release is never its own baseline
+    history.record("scaling", {"k": 1.5})
+    assert history.previous("scaling") == ("2024.11", {"k": 1.1})
+
+
+def test_history_rerecording_a_release_makes_it_latest(tmp_path):
+    path = tmp_path / "benchmarks.json"
+
+    BenchmarkHistory(path, "2024.10").record("scaling", {"k": 1.0})
+    BenchmarkHistory(path, "2024.11").record("scaling", {"k": 1.1})
+    BenchmarkHistory(path, "2024.10").record("scaling", {"k": 0.9})
+
+    assert BenchmarkHistory(path, "2024.12").previous("scaling") == (
+        "2024.10",
+        {"k": 0.9},
+    )
+
+
+def test_history_keeps_results_recorded_elsewhere(tmp_path):
+    path = tmp_path / "benchmarks.json"
+    first = BenchmarkHistory(path, "2024.10")
+    second = BenchmarkHistory(path, "2024.10")
+
+    first.record("a", {"k": 1})
+    second.record("b", {"k": 2})
+
+    assert set(json.loads(path.read_text())) == {"a", "b"}
+
+
+def _baseline(tmp_path, scenarios: dict) -> PerfBaseline:
+    path = tmp_path / "perf-baseline.json"
+    path.write_text(json.dumps(scenarios))
+    return PerfBaseline(path)
+
+
+def test_compare_flags_metrics_over_their_ratio(tmp_path):
+    baseline = _baseline(tmp_path, {"pan": {"p95_ms": 20.0, "p50_ms": 10.0}})
+
+    regressions = baseline.compare(
+        "pan", {"p95_ms": 30.0, "p50_ms": 11.0}, {"p95_ms": 1.2, "p50_ms": 1.2}
+    )
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("p95_ms 30.0 vs 20.0")
+
+
+def test_compare_ignores_noise(tmp_path):
+    baseline = _baseline(tmp_path, {"pan": {"p95_ms": 1.0, "jank": 0}})
+
+    # far over the ratio, but within a couple of ms or janky frames
+    assert baseline.compare("pan", {"p95_ms": 2.5, "jank": 2}, {"p95_ms": 1.2}) == []
+    assert baseline.compare("pan", {"jank": 3}, {"jank": 1.5}) != []
+
+
+def test_compare_only_thresholded_metrics(tmp_path):
+    baseline = _baseline(tmp_path, {"pan": {"p95_ms": 20.0, "frames": 100}})
+    result = {"p95_ms": 20.0, "frames": 400, "new_metric": 1000}
+
+    assert baseline.compare("pan", result, {"p95_ms": 1.2}) == []
+    assert len(baseline.compare("pan", result, {DEFAULT_THRESHOLD: 1.2})) == 1
+
+
+def test_compare_without_a_baseline(tmp_path):
+    baseline = PerfBaseline(tmp_path / "missing.json")
+
+    assert not baseline.has("pan")
+    with pytest.raises(KeyError):
+        baseline.compare("pan", {"p95_ms": 20.0}, {"p95_ms": 1.2})
+
+
+def test_update_keeps_other_scenarios(tmp_path):
+    _baseline(tmp_path, {"pan": {"p95_ms": 20.0}})
+    baseline = PerfBaseline(tmp_path / "perf-baseline.json")
+
+    baseline.update("zoom", {"p95_ms": 25.0})
+
+    reloaded = PerfBaseline(tmp_path / "perf-baseline.json")
+    assert reloaded.has("pan") and reloaded.has("zoom")
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+
+from utils.boundaries import METERS_PER_DEGREE, is_simple, star_boundary
+
+CENTER = (37.5345, -122.3315)
+
+
+def _meters(corner, center=CENTER) -> float:
+    lng, lat = corner
+    d_lat = (lat - center[0]) * METERS_PER_DEGREE
+    d_lng = (lng - center[1]) * METERS_PER_DEGREE * math.cos(math.radians(center[0]))
+    return math.hypot(d_lat, d_lng)
+
+
+@pytest.mark.parametrize("vertices", [3, 4, 16, 64, 256])
+def test_star_boundary_is_simple(vertices):
+    for seed in range(5):
+        corners = star_boundary(CENTER, vertices, seed=seed)
+
+        assert len(corners) == vertices
+        assert is_simple(corners)
+
+
+def test_star_boundary_stays_within_radius():
+    corners = star_boundary(CENTER, 64, radius=100, seed=1)
+
+    assert all(50 - 1e-6 <= _meters(c) <= 100 + 1e-6 for c in corners)
+
+
+def test_star_boundary_goes_around_the_center():
+    corners = np.array(star_boundary(CENTER, 32, seed=2))
+    lng, lat = corners[:, 0] - CENTER[1], corners[:, 1] - CENTER[0]
+    angles = np.unwrap(np.arctan2(lat, lng))
+
+    assert (np.diff(angles) > 0).all()
+    assert angles[-1] - angles[0] < 2 * np.pi
+
+
+def test_star_boundary_is_seeded():
+    assert star_boundary(CENTER, 8, seed=3) == star_boundary(CENTER, 8, seed=3)
+    assert star_boundary(CENTER, 8, seed=3) != star_boundary(CENTER, 8, seed=4)
+
+
+def test_star_boundary_needs_three_vertices():
+    with pytest.raises(ValueError):
+        star_boundary(CENTER, 2)
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        [(0, 0), (1, 0), (0, 1)],
+        [(0, 0), (2, 0), (2, 2), (0, 2)],
+        # concave
+        [(0, 0), (2, 0), (2, 2), (1, 1), (0, 2)],
+    ],
+)
+def test_is_simple(polygon):
+    assert is_simple(polygon)
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        # bow tie
+        [(0, 0), (2, 2), (2, 0), (0, 2)],
+        # the third edge crosses the first
+        [(0, 0), (4, 0), (4, 4), (2, -2)],
+    ],
+)
+def test_is_not_simple(polygon):
+    assert not is_simple(polygon)
+
+
+def test_star_boundary_without_jitter_is_evenly_spread():
+    corners = np.array(star_boundary(CENTER, 8, seed=5, jitter=0))
+    lng, lat = corners[:, 0] - CENTER[1], corners[:, 1] - CENTER[0]
+    # undo the longitude squeeze so angles are the ones the corners were placed at
+    lng *= math.cos(math.radians(CENTER[0]))
+    angles = np.unwrap(np.arctan2(lat, lng))
+
+    assert np.diff(angles) == pytest.approx(2 * np.pi / 8)
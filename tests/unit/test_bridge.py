@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from utils.bridge import SyncProxy, async_class, await_, run_sync
+
+
+class AsyncPage:
+    """Stands in for an async playwright page."""
+
+    # the bridge proxies objects by the module of their type
+    __module__ = "playwright.async_api._generated"
+
+    def __init__(self):
+        self.calls = []
+
+    async def evaluate(self, expression, arg=None):
+        self.calls.append(expression)
+        await asyncio.sleep(0)
+
+        if expression == "throw":
+            raise ValueError(arg)
+
+        return arg
+
+
+class Counter:
+    """A sync page object, written against the sync API."""
+
+    def __init__(self, page):
+        self.page = page
+        self.count = 0
+
+    @property
+    def doubled(self):
+        return self.page.evaluate("double", self.count * 2)
+
+    def bump(self, by=1):
+        self.count = self.page.evaluate("bump", self.count + by)
+        return self.count
+
+    def fail(self):
+        return self.page.evaluate("throw", "from the page")
+
+    def recover(self):
+        try:
+            self.fail()
+        except ValueError as e:
+            return f"caught {e}"
+
+    def __enter__(self):
+        self.bump()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.bump(10)
+
+
+def test_await_outside_run_sync():
+    awaitable = asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="outside of run_sync"):
+        await_(awaitable)
+
+    awaitable.close()
+
+
+def test_sync_code_awaits_async_calls():
+    page = AsyncPage()
+
+    def read():
+        return SyncProxy(page).evaluate("read", 42)
+
+    assert asyncio.run(run_sync(read)) == 42
+    assert page.calls == ["read"]
+
+
+def test_async_exceptions_are_raised_in_sync_code():
+    page = AsyncPage()
+
+    assert asyncio.run(run_sync(Counter(SyncProxy(page)).recover)) == (
+        "caught from the page"
+    )
+
+
+def test_exceptions_propagate_out_of_run_sync():
+    def fail():
+        raise KeyError("sync")
+
+    with pytest.raises(KeyError, match="sync"):
+        asyncio.run(run_sync(fail))
+
+    with pytest.raises(ValueError, match="from the page"):
+        asyncio.run(run_sync(Counter(SyncProxy(AsyncPage())).fail))
+
+
+def test_async_class_awaits_methods_properties_and_context_managers():
+    AsyncCounter = async_class(Counter)
+
+    async def drive():
+        counter = await AsyncCounter(AsyncPage())
+
+        assert await counter.bump(2) == 2
+        assert await counter.doubled == 4
+
+        async with counter as entered:
+            assert await entered.bump() == 4
+
+        return counter.count
+
+    assert asyncio.run(drive()) == 14
+
+
+class GatedPage(AsyncPage):
+    """Only answers once two evaluations are in flight at the same time."""
+
+    __module__ = AsyncPage.__module__
+
+    def __init__(self):
+        super().__init__()
+        self.both = asyncio.Event()
+
+    async def evaluate(self, expression, arg=None):
+        self.calls.append(expression)
+
+        if len(self.calls) == 2:
+            self.both.set()
+
+        await self.both.wait()
+        return arg
+
+
+def test_page_objects_run_concurrently():
+    AsyncCounter = async_class(Counter)
+    page = GatedPage()
+
+    async def drive():
+        a, b = await asyncio.gather(AsyncCounter(page), AsyncCounter(page))
+        await asyncio.gather(a.bump(), b.bump(2))
+        return a.count, b.count
+
+    assert asyncio.run(asyncio.wait_for(drive(), timeout=5)) == (1, 2)
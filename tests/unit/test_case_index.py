@@ -0,0 +1,95 @@
+import pytest
+
+import data.test_cases as tc
+from utils.case_index import CaseIndex
+
+
+class FakeTestRail:
+    def __init__(self, cases: list[dict]):
+        self.cases = cases
+        self.calls: list[dict] = []
+
+    def get_cases(self, project_id: int, suite_id: int | None = None, **filters):
+        self.calls.append({"project_id": project_id, "suite_id": suite_id, **filters})
+        after = filters.get("updated_after", -1)
+        return (case for case in self.cases if case["updated_on"] > after)
+
+
+def _case(case_id: int, title: str, updated_on: int) -> dict:
+    return {"id": case_id, "title": title, "suite_id": 1, "updated_on": updated_on}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = CaseIndex(tmp_path / "cases.sqlite")
+    yield index
+    index.close()
+
+
+def test_title_without_an_index_file(tmp_path):
+    index = CaseIndex(tmp_path / "missing.sqlite")
+
+    assert index.title(1) is None
+    assert not (tmp_path / "missing.sqlite").exists()
+
+
+def test_title_formats_like_test_cases(index):
+    index.upsert([_case(42, "  User can\n  add a boundary ", 100)])
+
+    assert index.title(42) == "42 - User can add a boundary"
+    assert index.title(43) is None
+
+
+def test_upsert_replaces_changed_cases(index):
+    index.upsert([_case(1, "Old title", 100)])
+    index.upsert([_case(1, "New title", 200)])
+
+    assert index.title(1) == "1 - New title"
+    assert index.db.execute("SELECT COUNT(*) FROM cases").fetchone()[0] == 1
+
+
+def test_sync_resumes_from_watermark(index):
+    tr = FakeTestRail([_case(1, "First", 100), _case(2, "Second", 200)])
+
+    assert index.sync(tr, project_id=7) == 2
+    assert "updated_after" not in tr.calls[0]
+
+    tr.cases.append(_case(3, "Third", 300))
+
+    # the second sync asks from a second before the newest case seen
+    assert index.sync(tr, project_id=7) == 2
+    assert tr.calls[1]["updated_after"] == 199
+    assert index.title(3) == "3 - Third"
+
+
+def test_sync_watermarks_are_per_suite(index):
+    tr = FakeTestRail([_case(1, "First", 100)])
+
+    index.sync(tr, project_id=7, suite_id=1)
+    index.sync(tr, project_id=7, suite_id=2)
+
+    assert "updated_after" not in tr.calls[1]
+
+
+def test_sync_without_changes_keeps_watermark(index):
+    tr = FakeTestRail([_case(1, "First", 100)])
+    index.sync(tr, project_id=7)
+
+    tr.cases = []
+    assert index.sync(tr, project_id=7) == 0
+    assert index.sync(tr, project_id=7) == 0
+    assert tr.calls[-1]["updated_after"] == 99
+
+
+def test_test_cases_fall_back_to_index(index, monkeypatch):
+    index.upsert([_case(999001, "Indexed case", 100)])
+    monkeypatch.setattr(tc, "_index", index)
+
+    assert tc.TEST_999001 == "999001 - Indexed case"
+    monkeypatch.delattr(tc, "TEST_999001")
+
+    with pytest.raises(AttributeError, match="sync-cases"):
+        _ = tc.TEST_999002
+
+    with pytest.raises(AttributeError):
+        _ = tc.NOT_A_CASE
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+
+from fixtures.durations import (
+    DEFAULT_ESTIMATE,
+    SMOOTHING,
+    DurationHistory,
+    DurationScheduling,
+)
+
+
+class Config:
+    def __init__(self, workers: int):
+        self.options = {"tx": [f"{workers}*popen"], "maxschedchunk": None}
+
+    def getvalue(self, name):
+        return self.options[name]
+
+    getoption = getvalue
+
+
+class Node:
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent: list[int] = []
+
+    def send_runtest_some(self, indices: list[int]):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def _history(tmp_path, durations: dict[str, float]) -> DurationHistory:
+    history = DurationHistory(tmp_path / "durations.json")
+    history.durations = durations
+    return history
+
+
+def _scheduler(tmp_path, durations: dict[str, float], workers: int):
+    collection = sorted(durations)
+    scheduler = DurationScheduling(
+        Config(workers), history=_history(tmp_path, durations)
+    )
+    nodes = [Node(f"gw{i}") for i in range(workers)]
+
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+
+    scheduler.schedule()
+    return scheduler, nodes, collection
+
+
+def test_estimates_fall_back_to_the_median(tmp_path):
+    assert _history(tmp_path, {}).estimate("new") == DEFAULT_ESTIMATE
+
+    history = _history(tmp_path, {"a": 1.0, "b": 5.0, "c": 30.0})
+    assert history.estimate("b") == 5.0
+    assert history.estimate("new") == 5.0
+
+
+def test_history_saves_a_moving_average(tmp_path):
+    history = _history(tmp_path, {"a": 10.0})
+    history.measured.update({"a": 20.0, "b": 4.0})
+    history.save()
+
+    saved = DurationHistory(tmp_path / "durations.json").durations
+    assert saved == {"a": SMOOTHING * 20 + (1 - SMOOTHING) * 10, "b": 4.0}
+
+
+def test_initial_round_spreads_the_longest_tests(tmp_path):
+    durations = {"a": 1, "b": 50, "c": 10, "d": 40, "e": 5, "f": 30}
+    scheduler, (gw0, gw1), collection = _scheduler(tmp_path, durations, 2)
+
+    sent = [[collection[i] for i in node.sent] for node in (gw0, gw1)]
+
+    # b -> gw0, d -> gw1, f -> gw1 (40 < 50), c -> gw0
+    assert sent == [["b", "c"], ["d", "f"]]
+    assert [collection[i] for i in scheduler.pending] == ["e", "a"]
+
+
+def test_a_freed_worker_gets_the_longest_test_left(tmp_path):
+    durations = {"a": 1, "b": 50, "c": 10, "d": 40, "e": 5, "f": 30}
+    scheduler, (gw0, gw1), collection = _scheduler(tmp_path, durations, 2)
+
+    scheduler.mark_test_complete(gw1, gw1.sent[0])
+    assert collection[gw1.sent[-1]] == "e"
+
+    scheduler.mark_test_complete(gw0, gw0.sent[0])
+    assert collection[gw0.sent[-1]] == "a"
+
+    assert not scheduler.pending
+    scheduler.mark_test_complete(gw0, gw0.sent[1])
+    assert gw0.shutting_down
+    assert not gw1.shutting_down
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_every_test_is_scheduled_once(tmp_path, workers):
+    durations = {f"t{i}": float(i % 7) for i in range(20)}
+    scheduler, nodes, collection = _scheduler(tmp_path, durations, workers)
+
+    while any(scheduler.node2pending.values()):
+        for node in nodes:
+            if scheduler.node2pending[node]:
+                scheduler.mark_test_complete(node, scheduler.node2pending[node][0])
+
+    assert sorted(i for node in nodes for i in node.sent) == list(range(20))
+    assert all(node.shutting_down for node in nodes)
@@ -0,0 +1,136 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from utils.points import Points, linear_sum_assignment, pair_by_assignment
+
+
+def _brute_force(cost: np.ndarray) -> float:
+    n, m = cost.shape
+    if n <= m:
+        return min(
+            cost[range(n), cols].sum() for cols in itertools.permutations(range(m), n)
+        )
+
+    return _brute_force(cost.T)
+
+
+def _dicts(xy) -> list[dict]:
+    return Points(xy).to_dicts()
+
+
+def _is_cyclic(order: list[int]) -> bool:
+    n = len(order)
+    steps = {(b - a) % n for a, b in itertools.pairwise(order + order[:1])}
+    return steps in ({1}, {n - 1})
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (4, 4), (5, 5), (3, 5), (5, 3)])
+def test_assignment_is_minimal(shape):
+    rng = np.random.default_rng(sum(shape))
+
+    for _ in range(20):
+        cost = rng.random(shape) * 100
+        rows, cols = linear_sum_assignment(cost)
+
+        assert len(rows) == min(shape)
+        assert len(set(rows)) == len(set(cols)) == min(shape)
+        assert list(rows) == sorted(rows)
+        assert cost[rows, cols].sum() == pytest.approx(_brute_force(cost))
+
+
+def test_assignment_with_ties():
+    rows, cols = linear_sum_assignment(np.ones((3, 3)))
+
+    assert list(rows) == [0, 1, 2]
+    assert sorted(cols) == [0, 1, 2]
+
+
+def test_pairing_follows_a_rotated_boundary():
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    moved = [(x + 500, y + 300) for x, y in square]
+
+    # listed from another corner, and far across the map
+    pairs = pair_by_assignment(_dicts(moved[1:] + moved[:1]), _dicts(square))
+
+    assert pairs == list(zip(_dicts(square), _dicts(moved), strict=True))
+
+
+def test_pairing_follows_a_reflected_boundary():
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    mirrored = square[::-1]
+
+    pairs = pair_by_assignment(_dicts(mirrored), _dicts(square))
+
+    assert all(actual == desired for actual, desired in pairs)
+
+
+def _polygon_order(xy: np.ndarray) -> np.ndarray:
+    return np.argsort(Points(xy).angles(), kind="stable")
+
+
+def test_pairing_with_vertices_out_of_boundary_order():
+    # the last vertex was added on the first edge, the map lists it last
+    actual = [(0, 0), (10, 0), (10, 10), (0, 10), (5, -2)]
+    boundary = [(0, 0), (5, -2), (10, 0), (10, 10), (0, 10)]
+    desired = [(x + 100, y + 50) for x, y in boundary]
+
+    pairs = pair_by_assignment(_dicts(desired), _dicts(actual))
+
+    assert [(a["x"] + 100, a["y"] + 50) for a, _ in pairs] == [
+        (d["x"], d["y"]) for _, d in pairs
+    ]
+
+
+def test_pairing_keeps_the_boundary_order():
+    rng = np.random.default_rng(1)
+    square = np.array([(0, 0), (10, 0), (10, 10), (0, 10)], dtype=float)
+
+    for _ in range(50):
+        actual = rng.permutation(square)
+        desired = rng.random((4, 2)) * 20 - 5
+        pairs = pair_by_assignment(_dicts(desired), _dicts(actual))
+
+        assert [a for a, _ in pairs] == _dicts(actual)
+
+        # desired corner paired with each actual one, going round the boundary
+        paired = [_dicts(desired).index(d) for _, d in pairs]
+        around = list(_polygon_order(desired))
+        assert _is_cyclic([around.index(paired[i]) for i in _polygon_order(actual)])
+
+
+def test_pairing_picks_the_cheapest_rotation():
+    rng = np.random.default_rng(2)
+
+    for n in (3, 5, 8):
+        actual, desired = rng.random((2, n, 2)) * 100
+        pairs = pair_by_assignment(_dicts(desired), _dicts(actual))
+
+        def cost(paired, actual=actual, desired=desired):
+            a = actual - actual.mean(axis=0)
+            d = desired[list(paired)] - desired.mean(axis=0)
+            return np.linalg.norm(a - d, axis=1).sum()
+
+        # every rotation and reflection of the desired corners round the boundary
+        around_actual, around_desired = _polygon_order(actual), _polygon_order(desired)
+        candidates = []
+        for k in range(n):
+            for step in (1, -1):
+                paired = np.empty(n, dtype=int)
+                paired[around_actual] = around_desired[(np.arange(n) * step + k) % n]
+                candidates.append(paired)
+
+        chosen = [_dicts(desired).index(d) for _, d in pairs]
+
+        assert cost(chosen) == pytest.approx(min(map(cost, candidates)))
+
+
+def test_pairing_different_corner_counts():
+    actual = _dicts([(0, 0), (10, 0), (10, 10), (0, 10)])
+    desired = _dicts([(0, 0), (10, 0), (5, 10)])
+
+    pairs = pair_by_assignment(desired, actual)
+
+    assert len(pairs) == 3
+    assert len({tuple(d.values()) for _, d in pairs}) == 3
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from playwright.sync_api import CDPSession, Locator, Page
+from utils.roundtrips import RoundTripProfiler
+
+HERE = Path(__file__).parent
+
+
+def _profiler() -> RoundTripProfiler:
+    profiler = RoundTripProfiler(roots=[f"{HERE}/"])
+    profiler.start_test("test")
+    return profiler
+
+
+def test_calls_are_attributed_to_the_calling_line():
+    profiler = _profiler()
+    click = profiler._wrap("Page.click", lambda: None)
+
+    for _ in range(2):
+        click()
+
+    [(site, stats)] = profiler.sites["test"].items()
+
+    assert site.startswith(f"{HERE.name}/test_roundtrips.py:")
+    assert site.endswith("(test_calls_are_attributed_to_the_calling_line)")
+    assert stats.calls == 2
+    assert stats.methods == {"Page.click": 2}
+
+
+def test_nested_api_calls_count_once():
+    profiler = _profiler()
+    evaluate = profiler._wrap("Page.evaluate", lambda: None)
+    wait = profiler._wrap("Page.wait_for_function", lambda: evaluate())
+
+    wait()
+
+    [stats] = profiler.sites["test"].values()
+    assert stats.methods == {"Page.wait_for_function": 1}
+
+
+def test_calls_outside_the_roots_are_ignored():
+    profiler = RoundTripProfiler(roots=["/nowhere/"])
+    profiler._wrap("Page.click", lambda: None)()
+
+    assert profiler.export() == {}
+
+
+def test_export_merge_and_top():
+    worker = _profiler()
+    slow = worker._wrap("Page.goto", lambda: None)
+    fast = worker._wrap("Page.click", lambda: None)
+    slow()
+    fast()
+
+    sites = worker.sites["test"]
+    slow_site, fast_site = sites
+    sites[slow_site].seconds = 2.0
+    sites[fast_site].seconds = 1.0
+
+    controller = RoundTripProfiler()
+    controller.merge(worker.export())
+    controller.merge(worker.export())
+
+    top = controller.top("test", n=1)
+    assert [(site, stats.calls, stats.seconds) for site, stats in top] == [
+        (slow_site, 2, 4.0)
+    ]
+
+
+def test_install_skips_local_methods_and_uninstall_restores():
+    goto, locator = Page.goto, Page.locator
+    profiler = RoundTripProfiler()
+
+    profiler.install(HERE, ["unit"])
+    try:
+        assert Page.goto is not goto
+        assert Page.locator is locator
+        assert Locator.get_by_text is Locator.__dict__["get_by_text"]
+    finally:
+        profiler.uninstall()
+
+    assert Page.goto is goto
+
+
+def test_install_covers_cdp_sessions():
+    profiler = _profiler()
+    send = CDPSession.send
+
+    profiler.install(HERE.parent, ["unit"])
+    try:
+        assert CDPSession.send is not send
+        assert CDPSession.send.__wrapped__ is send
+    finally:
+        profiler.uninstall()
+
+    assert CDPSession.send is send
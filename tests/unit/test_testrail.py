@@ -0,0 +1,161 @@
+import json
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from utils import testrail
+
+
+def _response(status: int, body=None, headers: dict | None = None):
+    response = requests.Response()
+    response.status_code = status
+    response.url = "https://testrail.test/index.php?/api/v2/endpoint"
+    response.headers.update(headers or {})
+    response._content = b"" if body is None else json.dumps(body).encode()
+    return response
+
+
+def _refused() -> requests.ConnectionError:
+    return requests.ConnectionError(
+        MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+    )
+
+
+def _reset() -> requests.ConnectionError:
+    return requests.ConnectionError(ProtocolError("Connection reset by peer"))
+
+
+class FakeSession:
+    """Answers requests from `replies` in order, raising the exceptions."""
+
+    def __init__(self, replies: list):
+        self.replies = list(replies)
+        self.requests: list[tuple[str, str, dict]] = []
+
+    def request(self, method: str, url: str, **args):
+        self.requests.append((method, url, args))
+        reply = self.replies.pop(0)
+
+        if isinstance(reply, Exception):
+            raise reply
+
+        return reply
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    sleeps = []
+    monkeypatch.setattr(testrail.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def _testrail(replies: list, max_retries: int = 3) -> testrail.TestRail:
+    tr = testrail.TestRail(
+        "https://testrail.test", "me@test", "key", max_retries=max_retries
+    )
+    tr.session = FakeSession(replies)
+    return tr
+
+
+def test_get_retries_server_errors_with_backoff(sleeps):
+    tr = _testrail([_response(502), _response(503), _response(200, {"id": 1})])
+
+    assert tr.get_case(1) == {"id": 1}
+    assert sleeps == [testrail.TestRail.BACKOFF, testrail.TestRail.BACKOFF * 2]
+
+
+def test_retry_after_is_honoured(sleeps):
+    tr = _testrail([_response(429, headers={"Retry-After": "7"}), _response(200)])
+
+    assert tr.get_case(1) is None
+    assert sleeps == [7.0]
+
+
+def test_gives_up_after_max_retries(sleeps):
+    tr = _testrail([_response(504)] * 3, max_retries=2)
+
+    with pytest.raises(requests.HTTPError):
+        tr.get_case(1)
+
+    assert len(tr.session.requests) == 3
+
+
+def test_get_retries_connection_and_read_errors(sleeps):
+    tr = _testrail([_reset(), requests.ReadTimeout(), _response(200, {"id": 1})])
+
+    assert tr.get_case(1) == {"id": 1}
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [_response(502), _response(504), _reset(), requests.ReadTimeout()],
+    ids=["502", "504", "reset", "read-timeout"],
+)
+def test_post_that_may_have_landed_is_not_retried(sleeps, failure):
+    tr = _testrail([failure, _response(200)])
+
+    with pytest.raises(requests.RequestException):
+        tr.add_results_for_cases(1, {"results": []})
+
+    assert len(tr.session.requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [_response(429), _refused(), requests.ConnectTimeout()],
+    ids=["429", "refused", "connect-timeout"],
+)
+def test_post_that_never_landed_is_retried(sleeps, failure):
+    tr = _testrail([failure, _response(200)])
+
+    tr.add_results_for_cases(1, {"results": []})
+
+    assert len(tr.session.requests) == 2
+
+
+def test_requests_have_a_timeout(sleeps):
+    tr = _testrail([_response(200), _response(200)])
+
+    tr.get_case(1)
+    tr.request("GET", "get_case/1", timeout=5)
+
+    assert tr.session.requests[0][2]["timeout"] == testrail.TestRail.TIMEOUT
+    assert tr.session.requests[1][2]["timeout"] == 5
+
+
+def test_paginate_follows_next_links(sleeps):
+    tr = _testrail(
+        [
+            _response(
+                200,
+                {
+                    "cases": [{"id": 1}, {"id": 2}],
+                    "_links": {"next": "/api/v2/get_cases/7&limit=2&offset=2"},
+                },
+            ),
+            _response(200, {"cases": [{"id": 3}], "_links": {"next": None}}),
+        ]
+    )
+
+    cases = tr.get_cases(7, limit=2)
+    assert tr.session.requests == []
+
+    assert [case["id"] for case in cases] == [1, 2, 3]
+
+    urls = [url for _, url, _ in tr.session.requests]
+    assert urls == [
+        "https://testrail.test/index.php?/api/v2/get_cases/7&limit=2",
+        "https://testrail.test/index.php?/api/v2/get_cases/7&limit=2&offset=2",
+    ]
+
+
+def test_paginate_bare_list(sleeps):
+    tr = _testrail([_response(200, [{"id": 1}, {"id": 2}])])
+
+    assert [test["id"] for test in tr.get_tests(3)] == [1, 2]
+    assert tr.session.requests[0][1].endswith(
+        f"get_tests/3&limit={testrail.TestRail.PAGE_SIZE}"
+    )
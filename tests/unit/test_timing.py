@@ -0,0 +1,70 @@
+import pytest
+
+from utils.timing import BUCKETS_MS, ActionTimer, histogram, percentile, summarize
+
+
+@pytest.mark.parametrize(
+    "q, expected", [(0, 1), (10, 1), (50, 5), (90, 9), (95, 10), (100, 10)]
+)
+def test_percentile_nearest_rank(q, expected):
+    assert percentile([7, 3, 10, 1, 5, 2, 9, 4, 8, 6], q) == expected
+
+
+def test_percentile_single_value():
+    assert percentile([4.2], 50) == percentile([4.2], 99) == 4.2
+
+
+def test_histogram_buckets():
+    counts = histogram([0.5, 1, 1.5, 3, 70_000])
+
+    assert len(counts) == len(BUCKETS_MS) + 1
+    # below 1ms, below 2ms (twice), below 4ms and past the last edge
+    assert counts[0] == 1
+    assert counts[1] == 2
+    assert counts[2] == 1
+    assert counts[-1] == 1
+    assert sum(counts) == 5
+
+
+def test_timer_separates_own_time_and_sleeps(monkeypatch):
+    clock = iter([0.0, 1.0, 3.0, 4.0])
+    monkeypatch.setattr("utils.timing.time.perf_counter", lambda: next(clock))
+
+    timer = ActionTimer(test="t")
+    timer.enter("outer")
+    timer.enter("inner")
+    timer.slept(0.5)
+    timer.retried()
+    timer.exit()
+    timer.exit(failed=True)
+
+    inner, outer = timer.records
+
+    assert (inner.action, inner.depth, inner.wall, inner.own) == ("inner", 1, 2, 2)
+    assert (inner.sleep, inner.retries, inner.failed) == (0.5, 1, False)
+    assert (outer.action, outer.depth, outer.wall, outer.own) == ("outer", 0, 4, 2)
+    assert (outer.sleep, outer.retries, outer.failed) == (0.5, 0, True)
+
+
+def test_timed_records_failures():
+    timer = ActionTimer()
+
+    with pytest.raises(ValueError):
+        timer.timed("boom", int, "not a number")
+
+    assert [(r.action, r.failed) for r in timer.records] == [("boom", True)]
+    assert timer.stack == []
+
+
+def test_summarize_groups_by_action_and_test():
+    timer = ActionTimer()
+
+    for test in ("a", "a", "b"):
+        timer.reset(test)
+        timer.timed("Slider.slide", lambda: None)
+
+    summary = summarize(timer.records)
+
+    assert summary["actions"]["Slider.slide"]["calls"] == 3
+    assert summary["tests"]["a"]["Slider.slide"]["calls"] == 2
+    assert summary["tests"]["b"]["Slider.slide"]["calls"] == 1
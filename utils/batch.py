@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+
+from playwright.sync_api import Locator, Page
+
+TEXT_CONTENT = "el => el.textContent"
+BOUNDING_BOX = """el => {
+    const r = el.getBoundingClientRect();
+    return { x: r.x, y: r.y, width: r.width, height: r.height };
+}"""
+
+
+@dataclass
+class BatchStats:
+    queued: int = 0
+    calls: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.queued - self.calls
+
+    def reset(self):
+        self.queued = 0
+        self.calls = 0
+
+
+# round trips for the current test, reset by the `batch_stats` fixture
+STATS = BatchStats()
+
+
+class Batch:
+    """Queue browser reads and send them in as few round trips as possible.
+
+    Page level scripts (optionally bound to a JSHandle, e.g. the mapbox ref)
+    all go out in a single `page.evaluate`. Reads against a locator are
+    grouped per locator, so every distinct locator costs one round trip no
+    matter how many reads are queued against it.
+
+        batch = Batch(page)
+        bounds = batch.evaluate("map => map.getBounds()", mapbox)
+        box = batch.bounding_box(canvas)
+        results = batch.run()
+        results[bounds], results[box]
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.queue: list[tuple[Locator | None, str, object]] = []
+        self.results = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            self.run()
+
+    def __getitem__(self, index: int):
+        if self.results is None:
+            raise RuntimeError("Batch has not been run yet")
+
+        return self.results[index]
+
+    def _add(self, target: Locator | None, script: str, arg=None) -> int:
+        self.queue.append((target, script, arg))
+        return len(self.queue) - 1
+
+    def evaluate(self, script: str, arg=None) -> int:
+        return self._add(None, script, arg)
+
+    def evaluate_on(self, locator: Locator, script: str, arg=None) -> int:
+        return self._add(locator, script, arg)
+
+    def text_content(self, locator: Locator) -> int:
+        return self._add(locator, TEXT_CONTENT)
+
+    def bounding_box(self, locator: Locator) -> int:
+        return self._add(locator, BOUNDING_BOX)
+
+    def run(self) -> list:
+        groups: dict[int, list[int]] = {}
+        targets: dict[int, Locator | None] = {}
+
+        for index, (target, *_) in enumerate(self.queue):
+            groups.setdefault(id(target), []).append(index)
+            targets[id(target)] = target
+
+        results = [None] * len(self.queue)
+
+        for key, indices in groups.items():
+            target = targets[key]
+            scripts = [self.queue[i][1] for i in indices]
+            args = [self.queue[i][2] for i in indices]
+
+            if target is None:
+                calls = ", ".join(f"({s})(args[{n}])" for n, s in enumerate(scripts))
+                values = self.page.evaluate(f"args => Promise.all([{calls}])", args)
+            else:
+                calls = ", ".join(
+                    f"({s})(el, args[{n}])" for n, s in enumerate(scripts)
+                )
+                values = target.evaluate(f"(el, args) => Promise.all([{calls}])", args)
+
+            for i, value in zip(indices, values, strict=True):
+                results[i] = value
+
+        STATS.queued += len(self.queue)
+        STATS.calls += len(groups)
+
+        self.queue = []
+        self.results = results
+
+        return results
@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+def scaling_exponent(sizes: list[float], values: list[float]) -> float:
+    """`k` in `value ~ size**k`, fitted on a log-log scale.
+
+    1 is linear growth, above that the cost grows faster than the input.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    # nothing measurable counts as a millisecond, the log needs positive values
+    values = np.maximum(np.asarray(values, dtype=float), 1e-3)
+
+    slope, _ = np.polyfit(np.log(sizes), np.log(values), 1)
+    return float(slope)
+
+
+class BenchmarkHistory:
+    """Benchmark results per app release, kept between runs.
+
+    {"boundary_scaling": {"2024.10": {...}, "2024.11": {...}}}
+    """
+
+    def __init__(self, path: Path, release: str):
+        self.path = path
+        self.release = release
+        self.results: dict[str, dict[str, dict]] = {}
+
+        if path.exists():
+            self.results = json.loads(path.read_text())
+
+    def previous(self, name: str) -> tuple[str, dict] | None:
+        """The latest result of `name` recorded for another release."""
+        others = [
+            (release, result)
+            for release, result in self.results.get(name, {}).items()
+            if release != self.release
+        ]
+
+        return others[-1] if others else None
+
+    def record(self, name: str, result: dict):
+        # other workers may have recorded since this was loaded
+        if self.path.exists():
+            self.results = json.loads(self.path.read_text())
+
+        runs = self.results.setdefault(name, {})
+        # re-recording a release moves it to the end, it's the latest again
+        runs.pop(self.release, None)
+        runs[self.release] = result
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.results, indent=2))
+
+
+# differences below these are noise, whatever the ratio
+MIN_REGRESSION = {"jank": 2, "long_tasks": 1}
+MIN_REGRESSION_DEFAULT = 2.0
+
+DEFAULT_THRESHOLD = "default"
+
+# allowed ratio over the baseline per metric, see `--perf-threshold`
+PERF_THRESHOLDS = {
+    "p50_ms": 1.2,
+    "p95_ms": 1.2,
+    "p99_ms": 1.3,
+    "jank": 1.5,
+    "long_task_ms": 1.5,
+    "TaskDuration_ms": 1.3,
+}
+
+
+class PerfBaseline:
+    """Per scenario metrics to hold later runs against.
+
+    {"pan": {"p95_ms": 17.1, "long_task_ms": 0, ...}}
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.scenarios: dict[str, dict] = {}
+
+        if path.exists():
+            self.scenarios = json.loads(path.read_text())
+
+    def has(self, scenario: str) -> bool:
+        return scenario in self.scenarios
+
+    def compare(
+        self, scenario: str, result: dict, thresholds: dict[str, float]
+    ) -> list[str]:
+        """Metrics of `result` more than their threshold ratio above the baseline.
+
+        Only metrics named in `thresholds` (or all of them with a
+        `DEFAULT_THRESHOLD`) are compared. Raises `KeyError` when there is no
+        baseline for `scenario`.
+        """
+        baseline = self.scenarios[scenario]
+        regressions = []
+
+        for metric, value in result.items():
+            ratio = thresholds.get(metric, thresholds.get(DEFAULT_THRESHOLD))
+            if ratio is None or metric not in baseline:
+                continue
+
+            base = baseline[metric]
+            noise = MIN_REGRESSION.get(metric, MIN_REGRESSION_DEFAULT)
+
+            if value > base * ratio and value - base > noise:
+                regressions.append(
+                    f"{metric} {value} vs {base} (x{value / base if base else 0:.2f}, "
+                    f"allowed x{ratio})"
+                )
+
+        return regressions
+
+    def update(self, scenario: str, result: dict):
+        if self.path.exists():
+            self.scenarios = json.loads(self.path.read_text())
+
+        self.scenarios[scenario] = result
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.scenarios, indent=2, sort_keys=True))
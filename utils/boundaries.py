@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+
+METERS_PER_DEGREE = 111_320
+
+
+def star_boundary(
+    center: tuple[float, float],
+    vertices: int,
+    radius: float = 60.0,
+    seed: int | None = None,
+    jitter: float = 0.8,
+) -> list[list[float]]:
+    """A random simple polygon of `vertices` corners around `center` (lat, lng).
+
+    Corners go around the center at increasing angles, each at its own
+    distance between half and all of `radius` meters, so the polygon is
+    star-shaped and never crosses itself. Each corner's angle is pushed up to
+    `jitter` of the even spacing further round. Corners are `[lng, lat]` like
+    `cfg.SCAN_CORNERS`.
+    """
+    if vertices < 3:
+        raise ValueError("A boundary needs at least 3 vertices")
+
+    rng = np.random.default_rng(seed)
+    lat, lng = center
+
+    # evenly spread angles with some jitter keep sliver triangles out
+    step = 2 * np.pi / vertices
+    angles = np.arange(vertices) * step + rng.uniform(0, jitter * step, vertices)
+    distances = rng.uniform(0.5, 1.0, vertices) * radius
+
+    d_lat = distances * np.sin(angles) / METERS_PER_DEGREE
+    d_lng = (
+        distances * np.cos(angles) / (METERS_PER_DEGREE * math.cos(math.radians(lat)))
+    )
+
+    return np.stack([lng + d_lng, lat + d_lat], axis=1).tolist()
+
+
+def is_simple(polygon) -> bool:
+    """Whether no two non-adjacent edges of the closed `polygon` intersect."""
+    points = np.asarray(polygon, dtype=float)
+    a, b = points, np.roll(points, -1, axis=0)
+    n = len(points)
+
+    def orientation(p, q, r):
+        return np.sign(
+            (q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1])
+            - (q[..., 1] - p[..., 1]) * (r[..., 0] - p[..., 0])
+        )
+
+    # every edge i against every edge j
+    a1, b1 = a[:, None], b[:, None]
+    a2, b2 = a[None], b[None]
+    crossing = (orientation(a1, b1, a2) != orientation(a1, b1, b2)) & (
+        orientation(a2, b2, a1) != orientation(a2, b2, b1)
+    )
+
+    i, j = np.triu_indices(n, k=2)
+    # the first and last edge share a corner too
+    adjacent = (i == 0) & (j == n - 1)
+
+    return not crossing[i[~adjacent], j[~adjacent]].any()
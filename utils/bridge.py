@@ -0,0 +1,219 @@
+"""Run the sync page objects against `playwright.async_api`.
+
+The page objects are written once, against the sync API. To drive an async
+page, each call runs the sync method in its own greenlet and hands it proxies
+of the async objects; whenever a proxied call returns an awaitable, the
+greenlet switches back to the event loop, which awaits it and switches back in
+with the result. Several editors can be driven concurrently from one loop.
+
+    from pages.async_api import MissionEditor
+
+    editor = await MissionEditor(page)
+    await editor.mission_details.site.select("Site")
+    async with editor.param_change() as change:
+        await editor.scan_settings.height.slide(0.5)
+"""
+
+import inspect
+import sys
+from functools import wraps
+
+import greenlet
+
+from playwright.async_api import expect as async_expect
+from playwright.sync_api import expect as sync_expect
+
+FACADE_MODULES = ("pages.", "components.", "utils.")
+
+
+class _SyncContext(greenlet.greenlet):
+    def __init__(self, fn, driver):
+        super().__init__(fn, driver)
+        self.driver = driver
+
+
+def await_(awaitable):
+    """Await from sync code running inside `run_sync`."""
+    current = greenlet.getcurrent()
+
+    if not isinstance(current, _SyncContext):
+        raise RuntimeError("async playwright object used outside of run_sync")
+
+    return current.driver.switch(awaitable)
+
+
+async def run_sync(fn, *args, **kwargs):
+    context = _SyncContext(fn, greenlet.getcurrent())
+    result = context.switch(*args, **kwargs)
+
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+
+    return result
+
+
+def _is_async_api(value) -> bool:
+    return type(value).__module__.startswith("playwright.async_api")
+
+
+def _map(value, fn):
+    if isinstance(value, list):
+        return [fn(v) for v in value]
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*(fn(v) for v in value))
+    if isinstance(value, tuple):
+        return tuple(fn(v) for v in value)
+    if isinstance(value, dict):
+        return {k: fn(v) for k, v in value.items()}
+    return value
+
+
+def _to_proxy(value):
+    if _is_async_api(value):
+        return SyncProxy(value)
+    if isinstance(value, AsyncFacade):
+        return value._obj
+    return _map(value, _to_proxy)
+
+
+def _from_proxy(value):
+    if isinstance(value, SyncProxy):
+        return value._target
+    return _map(value, _from_proxy)
+
+
+class SyncProxy:
+    """Looks like a sync API object to the page objects, backed by an async one."""
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target):
+        object.__setattr__(self, "_target", target)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+
+        if not inspect.ismethod(value):
+            return _to_proxy(value)
+
+        @wraps(value)
+        def call(*args, **kwargs):
+            result = value(*_from_proxy(args), **_from_proxy(kwargs))
+
+            if inspect.isawaitable(result):
+                result = await_(result)
+
+            return _to_proxy(result)
+
+        return call
+
+    def __eq__(self, other):
+        return self._target == _from_proxy(other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __repr__(self):
+        return f"SyncProxy({self._target!r})"
+
+
+def expect(actual, message: str | None = None):
+    """`expect` for page objects, works with both sync and proxied objects."""
+    if isinstance(actual, SyncProxy):
+        return SyncProxy(async_expect(actual._target, message))
+
+    return sync_expect(actual, message)
+
+
+def _to_async(value):
+    if isinstance(value, SyncProxy):
+        return value._target
+
+    module = type(value).__module__
+    if module.startswith(FACADE_MODULES) or hasattr(value, "__exit__"):
+        return AsyncFacade(value)
+
+    return _map(value, _to_async)
+
+
+class AsyncCall:
+    """A pending sync call: `await` it, or use it directly with `async with`."""
+
+    def __init__(self, fn, *args, **kwargs):
+        self.fn = fn
+        self.args = _to_proxy(args)
+        self.kwargs = _to_proxy(kwargs)
+        self.entered = None
+
+    def __await__(self):
+        return self._run().__await__()
+
+    async def _run(self):
+        return _to_async(await run_sync(self.fn, *self.args, **self.kwargs))
+
+    async def __aenter__(self):
+        self.entered = await self
+        return await self.entered.__aenter__()
+
+    async def __aexit__(self, *exc_info):
+        return await self.entered.__aexit__(*exc_info)
+
+
+class AsyncFacade:
+    """Async view of a sync page object.
+
+    Methods and properties become awaitable (properties may do IO, e.g. opening
+    a tab), plain attributes are returned as their async counterparts and sync
+    context managers become async ones.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        object.__setattr__(self, "_obj", obj)
+
+    def __getattr__(self, name):
+        if isinstance(inspect.getattr_static(type(self._obj), name, None), property):
+            return AsyncCall(getattr, self._obj, name)
+
+        value = getattr(self._obj, name)
+
+        if inspect.ismethod(value) or inspect.isfunction(value):
+            return wraps(value)(
+                lambda *args, **kwargs: AsyncCall(value, *args, **kwargs)
+            )
+
+        return _to_async(value)
+
+    def __getitem__(self, index):
+        return _to_async(self._obj[index])
+
+    def __len__(self):
+        return len(self._obj)
+
+    def __iter__(self):
+        return (_to_async(v) for v in self._obj)
+
+    async def __aenter__(self):
+        return _to_async(await run_sync(self._obj.__enter__))
+
+    async def __aexit__(self, *exc_info):
+        return await run_sync(self._obj.__exit__, *exc_info)
+
+    def __repr__(self):
+        return f"AsyncFacade({self._obj!r})"
+
+
+def async_class(cls):
+    """Awaitable constructor for the async version of a sync page object."""
+
+    @wraps(cls, updated=())
+    def create(*args, **kwargs) -> AsyncCall:
+        return AsyncCall(cls, *args, **kwargs)
+
+    return create
@@ -0,0 +1,92 @@
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from .testrail import TestRail
+
+INDEX_PATH = Path(__file__).parent.parent / "data" / "test_cases.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    suite_id INTEGER,
+    section_id INTEGER,
+    updated_on INTEGER
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class CaseIndex:
+    """Local index of TestRail cases, looked up one case at a time."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = path
+        self._db = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.path)
+            self._db.executescript(SCHEMA)
+
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def title(self, case_id: int) -> str | None:
+        if self._db is None and not self.path.exists():
+            return None
+
+        row = self.db.execute(
+            "SELECT title FROM cases WHERE id = ?", (case_id,)
+        ).fetchone()
+
+        return row and f"{case_id} - {row[0]}"
+
+    def _meta(self, key: str) -> str | None:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row and row[0]
+
+    def upsert(self, cases: Iterable[dict], watermark: str = "updated_on") -> int:
+        count = 0
+        latest = int(self._meta(watermark) or 0)
+
+        with self.db:
+            for case in cases:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?, ?)",
+                    (
+                        case["id"],
+                        " ".join(case["title"].split()),
+                        case.get("suite_id"),
+                        case.get("section_id"),
+                        case.get("updated_on"),
+                    ),
+                )
+                latest = max(latest, case.get("updated_on") or 0)
+                count += 1
+
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (watermark, str(latest))
+            )
+
+        return count
+
+    def sync(self, tr: TestRail, project_id: int, suite_id: int | None = None) -> int:
+        """Pull cases changed since the last sync, returns how many changed."""
+        watermark = f"updated_on:{project_id}:{suite_id or ''}"
+        filters = {}
+
+        # cases updated in the same second as the last sync are fetched again
+        if updated_on := self._meta(watermark):
+            filters["updated_after"] = int(updated_on) - 1
+
+        return self.upsert(tr.get_cases(project_id, suite_id, **filters), watermark)
@@ -0,0 +1,272 @@
+import base64
+import contextlib
+import json
+import re
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from playwright.sync_api import APIResponse, Request, Route
+
+# Query parameters and JSON body keys that change between runs (timestamps,
+# cache busters, request ids) and are ignored when matching
+VOLATILE_KEYS = re.compile(
+    r"^(_|t|ts|timestamp|nonce|cache_?bust(er)?|request_?id"
+    r"|(created|updated|modified)_?at)$",
+    re.IGNORECASE,
+)
+UUID = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+# Values stamped with the time they were made, e.g. the default mission name
+# "Map Mission 04/01/2025 10:21:07", match whatever time they were recorded at
+TIMESTAMP = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?"
+    r"|\d{2}/\d{2}/\d{4} \d{2}:\d{2}(:\d{2})?"
+)
+
+# recorded bodies are stored decoded, these would no longer be true on replay
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def _normalize(value: str) -> str:
+    return TIMESTAMP.sub("{time}", UUID.sub("{uuid}", value))
+
+
+def _strip_volatile(value):
+    if isinstance(value, str):
+        return _normalize(value)
+
+    if isinstance(value, dict):
+        return {
+            k: _strip_volatile(v)
+            for k, v in sorted(value.items())
+            if not VOLATILE_KEYS.search(k)
+        }
+
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+
+    return value
+
+
+def request_key(method: str, url: str, post_data: str | None = None) -> str:
+    parts = urlsplit(url)
+    query = sorted(
+        (k, _normalize(v))
+        for k, v in parse_qsl(parts.query)
+        if not VOLATILE_KEYS.search(k)
+    )
+    path = UUID.sub("{uuid}", parts.path)
+    url = urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ""))
+
+    body = ""
+    if post_data:
+        try:
+            body = json.dumps(_strip_volatile(json.loads(post_data)))
+        except ValueError:
+            body = post_data
+
+    return f"{method} {url} {body}"
+
+
+def _cookie(set_cookie: str) -> dict:
+    pair, *attributes = (part.strip() for part in set_cookie.split(";"))
+    name, _, value = pair.partition("=")
+    cookie = {"name": name, "value": value}
+
+    for attribute in attributes:
+        key, _, value = attribute.partition("=")
+        key = key.lower()
+
+        if key in ("path", "domain"):
+            cookie[key] = value
+        elif key == "expires":
+            with contextlib.suppress(TypeError, ValueError):
+                cookie[key] = parsedate_to_datetime(value).isoformat()
+        elif key == "httponly":
+            cookie["httpOnly"] = True
+        elif key == "secure":
+            cookie["secure"] = True
+
+    return cookie
+
+
+class HarArchive:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: list[dict] = []
+        self._index: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        self.missed: list[str] = []
+
+    @classmethod
+    def load(cls, path: Path):
+        archive = cls(path)
+
+        for entry in json.loads(archive.path.read_text())["log"]["entries"]:
+            archive._add(entry)
+
+        return archive
+
+    def _add(self, entry: dict):
+        request = entry["request"]
+        key = request_key(
+            request["method"], request["url"], request.get("postData", {}).get("text")
+        )
+
+        self.entries.append(entry)
+        self._index[key].append(entry)
+
+    def record(
+        self,
+        request: Request,
+        response: APIResponse,
+        body: bytes,
+        started: datetime,
+        wait_ms: float,
+    ):
+        try:
+            content = {"text": body.decode(), "size": len(body)}
+        except UnicodeDecodeError:
+            content = {
+                "text": base64.b64encode(body).decode(),
+                "encoding": "base64",
+                "size": len(body),
+            }
+
+        headers = response.headers_array
+        content["mimeType"] = response.headers.get("content-type", "")
+
+        # the fields HAR 1.2 requires, with -1 for what a routed fetch can't see
+        entry = {
+            "startedDateTime": started.isoformat(),
+            "time": wait_ms,
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "httpVersion": "HTTP/1.1",
+                "cookies": [],
+                "headers": [],
+                "queryString": [
+                    {"name": k, "value": v}
+                    for k, v in parse_qsl(urlsplit(request.url).query)
+                ],
+                "headersSize": -1,
+                "bodySize": len(request.post_data_buffer or b""),
+            },
+            "response": {
+                "status": response.status,
+                "statusText": response.status_text,
+                "httpVersion": "HTTP/1.1",
+                "cookies": [
+                    _cookie(h["value"])
+                    for h in headers
+                    if h["name"].lower() == "set-cookie"
+                ],
+                "headers": headers,
+                "content": content,
+                "redirectURL": response.headers.get("location", ""),
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": wait_ms, "receive": 0},
+        }
+
+        if request.post_data is not None:
+            entry["request"]["postData"] = {
+                "mimeType": request.headers.get("content-type", ""),
+                "text": request.post_data,
+            }
+
+        self._add(entry)
+
+    def match(self, request: Request) -> dict | None:
+        key = request_key(request.method, request.url, request.post_data)
+        entries = self._index.get(key)
+
+        if not entries:
+            self.missed.append(key)
+            return None
+
+        # repeated identical requests are answered in recorded order, the last
+        # recorded answer is reused once they run out
+        served = self._served[key]
+        self._served[key] += 1
+
+        return entries[min(served, len(entries) - 1)]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "im-automated-testing", "version": "0.1.0"},
+                "entries": self.entries,
+            }
+        }
+
+        self.path.write_text(json.dumps(har))
+
+
+class HarRecorder:
+    def __init__(self, archive: HarArchive):
+        self.archive = archive
+
+    def __call__(self, route: Route):
+        started = datetime.now(UTC)
+        start = time.perf_counter()
+
+        # the browser follows redirects itself, so every hop (and the cookies it
+        # sets) is routed and recorded on its own
+        response = route.fetch(max_redirects=0)
+        body = response.body()
+        wait_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        self.archive.record(route.request, response, body, started, wait_ms)
+        route.fulfill(response=response, body=body)
+
+
+class HarReplayer:
+    def __init__(self, archive: HarArchive, fallback: bool = False):
+        self.archive = archive
+        self.fallback = fallback
+
+    def __call__(self, route: Route):
+        entry = self.archive.match(route.request)
+
+        if entry is None:
+            if self.fallback:
+                route.fallback()
+            else:
+                route.abort("internetdisconnected")
+            return
+
+        response = entry["response"]
+        content = response["content"]
+
+        if content.get("encoding") == "base64":
+            body = base64.b64decode(content["text"])
+        else:
+            body = content.get("text", "").encode()
+
+        headers = {}
+        for header in response["headers"]:
+            name = header["name"].lower()
+
+            if name in DROPPED_HEADERS:
+                continue
+
+            # playwright splits set-cookie on newlines, other repeats on commas
+            separator = "\n" if name == "set-cookie" else ", "
+            headers[name] = (
+                f"{headers[name]}{separator}{header['value']}"
+                if name in headers
+                else header["value"]
+            )
+
+        route.fulfill(status=response["status"], headers=headers, body=body)
@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 def calculate_distance(p1, p2):
     return math.sqrt((p2["x"] - p1["x"]) ** 2 + (p2["y"] - p1["y"]) ** 2)
@@ -52,3 +54,152 @@ def find_perpendicular_point(p1, p2):
     )
 
     return {"x": mx + perp_dx, "y": my + perp_dy}
+
+
+class Points:
+    """An (n, 2) array of `{"x", "y"}` points, for working on whole polygons."""
+
+    def __init__(self, xy):
+        self.xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+
+    @classmethod
+    def from_dicts(cls, points) -> "Points":
+        return cls([(p["x"], p["y"]) for p in points])
+
+    def to_dicts(self) -> list[dict]:
+        return [{"x": x, "y": y} for x, y in self.xy.tolist()]
+
+    def __len__(self):
+        return len(self.xy)
+
+    def __getitem__(self, index) -> "Points":
+        return Points(self.xy[index])
+
+    def __repr__(self):
+        return f"Points({self.xy.tolist()})"
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.xy[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.xy[:, 1]
+
+    def centroid(self) -> np.ndarray:
+        return self.xy.mean(axis=0)
+
+    def distances(self, other: "Points") -> np.ndarray:
+        """(n, m) distances from each of these points to each of `other`."""
+        return np.linalg.norm(self.xy[:, None] - other.xy[None], axis=-1)
+
+    def angles(self, center=None) -> np.ndarray:
+        center = self.centroid() if center is None else np.asarray(center)
+        d = self.xy - center
+        return np.arctan2(d[:, 1], d[:, 0])
+
+    def sort_by_angle(self, center=None) -> "Points":
+        return self[np.argsort(self.angles(center), kind="stable")]
+
+    def midpoints(self, other: "Points") -> "Points":
+        return Points((self.xy + other.xy) / 2)
+
+    def perpendiculars(self, other: "Points") -> "Points":
+        """`find_perpendicular_point` for each pair of points."""
+        d = other.xy - self.xy
+        # rotated a quarter turn clockwise, half as long as the segment
+        return Points(self.midpoints(other).xy + np.stack([d[:, 1], -d[:, 0]], 1) / 2)
+
+
+def linear_sum_assignment(cost) -> tuple[np.ndarray, np.ndarray]:
+    """Minimum cost assignment of rows to columns (Hungarian method).
+
+    Returns `(rows, cols)` like scipy's: row `rows[k]` goes to column `cols[k]`,
+    every row is assigned when there are at least as many columns.
+    """
+    cost = np.asarray(cost, dtype=float)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+
+    n, m = cost.shape
+    # 1-based like the textbook version, column 0 is the virtual start
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    row_of = np.zeros(m + 1, dtype=int)
+    way = np.zeros(m + 1, dtype=int)
+
+    for i in range(1, n + 1):
+        row_of[0] = i
+        col = 0
+        min_reduced = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        while row_of[col]:
+            used[col] = True
+            row = row_of[col]
+
+            reduced = cost[row - 1] - u[row] - v[1:]
+            better = ~used[1:] & (reduced < min_reduced[1:])
+            min_reduced[1:][better] = reduced[better]
+            way[1:][better] = col
+
+            candidates = np.where(used[1:], np.inf, min_reduced[1:])
+            col = int(np.argmin(candidates)) + 1
+            delta = candidates[col - 1]
+
+            u[row_of[used]] += delta
+            v[used] -= delta
+            min_reduced[~used] -= delta
+
+        while col:
+            previous = way[col]
+            row_of[col] = row_of[previous]
+            col = previous
+
+    cols = np.flatnonzero(row_of[1:]) + 1
+    rows = row_of[cols] - 1
+    cols = cols - 1
+
+    if transposed:
+        rows, cols = cols, rows
+
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+def pair_by_assignment(desired_corners, actual_corners):
+    """Pairs each actual corner with a desired one, moving them the least.
+
+    Both polygons are centered on their own centroid first, so a boundary that
+    has to travel across the map still pairs corner to matching corner. Corners
+    are put in polygon order by their angle around the centroid (the map hands
+    out vertices in the order they were added, not around the boundary), and
+    only pairings keeping that order (its rotations and reflections) are
+    considered, any other would drag the boundary into a self-intersecting
+    shape. With different corner counts there is no such pairing, each actual
+    corner goes to the nearest free desired one.
+    """
+    desired = Points.from_dicts(desired_corners)
+    actual = Points.from_dicts(actual_corners)
+
+    desired_order = np.argsort(desired.angles(), kind="stable")
+    actual_order = np.argsort(actual.angles(), kind="stable")
+    desired, actual = desired[desired_order], actual[actual_order]
+
+    cost = Points(actual.xy - actual.centroid()).distances(
+        Points(desired.xy - desired.centroid())
+    )
+
+    if len(actual) != len(desired):
+        rows, cols = linear_sum_assignment(cost)
+    else:
+        rows = np.arange(len(actual))
+        # rotations[k, i] == (i + k) % n, reversed for the reflections
+        rotations = (rows[None] + rows[:, None]) % len(rows)
+        candidates = np.concatenate([rotations, rotations[:, ::-1]])
+        cols = candidates[np.argmin(cost[rows, candidates].sum(axis=1))]
+
+    pairs = sorted(zip(actual_order[rows], desired_order[cols], strict=True))
+
+    return [(actual_corners[r], desired_corners[c]) for r, c in pairs]
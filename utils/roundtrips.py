@@ -0,0 +1,161 @@
+import inspect
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+
+from playwright.sync_api import (
+    BrowserContext,
+    CDPSession,
+    ElementHandle,
+    Frame,
+    JSHandle,
+    Keyboard,
+    Locator,
+    Mouse,
+    Page,
+)
+
+PROFILED_CLASSES = [
+    Page,
+    Frame,
+    Locator,
+    ElementHandle,
+    JSHandle,
+    Mouse,
+    Keyboard,
+    BrowserContext,
+    # Map drags and frame recording talk to the browser over CDP
+    CDPSession,
+]
+
+# methods that only build locators or register listeners, no round trip
+LOCAL_METHODS = {
+    "and_",
+    "describe",
+    "filter",
+    "frame_locator",
+    "locator",
+    "nth",
+    "on",
+    "once",
+    "or_",
+    "remove_listener",
+}
+LOCAL_PREFIXES = ("get_by_", "expect_", "set_default_")
+
+
+@dataclass
+class CallSite:
+    calls: int = 0
+    seconds: float = 0.0
+    methods: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def add(self, method: str, seconds: float):
+        self.calls += 1
+        self.seconds += seconds
+        self.methods[method] += 1
+
+    def merge(self, other: dict):
+        self.calls += other["calls"]
+        self.seconds += other["seconds"]
+        for method, count in other["methods"].items():
+            self.methods[method] += count
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "methods": dict(self.methods),
+        }
+
+
+@dataclass
+class RoundTripProfiler:
+    roots: list[str] = field(default_factory=list)
+    test: str = ""
+    # test -> "file:line (function)" -> call site
+    sites: dict[str, dict[str, CallSite]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(CallSite))
+    )
+    patched: list[tuple[object, str, object]] = field(default_factory=list)
+    active: bool = False
+
+    def _call_site(self) -> str | None:
+        frame = sys._getframe(2)
+
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            for root in self.roots:
+                if filename.startswith(root):
+                    relative = Path(filename).relative_to(Path(root).parent)
+                    return f"{relative}:{frame.f_lineno} ({frame.f_code.co_qualname})"
+            frame = frame.f_back
+
+        return None
+
+    def _wrap(self, method: str, func):
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            # a sync call that calls back into the API counts once
+            if self.active:
+                return func(*args, **kwargs)
+
+            site = self._call_site()
+            if site is None:
+                return func(*args, **kwargs)
+
+            self.active = True
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.sites[self.test][site].add(method, time.perf_counter() - start)
+                self.active = False
+
+        return profiled
+
+    def install(self, rootdir: Path, packages: list[str]):
+        self.roots = [f"{rootdir / package}/" for package in packages]
+
+        for cls in PROFILED_CLASSES:
+            for name, attr in list(vars(cls).items()):
+                if (
+                    name.startswith("_")
+                    or name in LOCAL_METHODS
+                    or name.startswith(LOCAL_PREFIXES)
+                    or not inspect.isfunction(attr)
+                ):
+                    continue
+
+                self.patched.append((cls, name, attr))
+                setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", attr))
+
+    def uninstall(self):
+        while self.patched:
+            cls, name, original = self.patched.pop()
+            setattr(cls, name, original)
+
+    def start_test(self, nodeid: str):
+        self.test = nodeid
+        self.active = False
+
+    def export(self) -> dict:
+        return {
+            test: {site: stats.to_dict() for site, stats in sites.items()}
+            for test, sites in self.sites.items()
+        }
+
+    def merge(self, exported: dict):
+        for test, sites in exported.items():
+            for site, stats in sites.items():
+                self.sites[test][site].merge(stats)
+
+    def top(self, test: str, n: int = 5) -> list[tuple[str, CallSite]]:
+        sites = self.sites.get(test, {})
+        return sorted(sites.items(), key=lambda item: -item[1].seconds)[:n]
+
+
+PROFILER = RoundTripProfiler()
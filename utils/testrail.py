@@ -1,22 +1,105 @@
+import time
+from collections.abc import Iterator
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+
 import requests
 from requests.auth import HTTPBasicAuth
+from urllib3.exceptions import ConnectTimeoutError
+
+RETRY_STATUSES = {429, 502, 503, 504}
+# a POST (e.g. `add_result`) may have been applied even though its response was
+# lost, it's only retried when the server certainly didn't act on it
+NON_IDEMPOTENT_RETRY_STATUSES = {429}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """Whether the request failed before a connection was made."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+
+    # urllib3's MaxRetryError, with a NewConnectionError or the like as reason
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, ConnectTimeoutError)
 
 
 class TestRail:
-    def __init__(self, host: str, email: str, api_key: str):
-        self.auth = HTTPBasicAuth(email, api_key)
+    MAX_RETRIES = 5
+    BACKOFF = 1.0
+    MAX_BACKOFF = 60.0
+    PAGE_SIZE = 250
+    # (connect, read) seconds, a stalled call is failed (and maybe retried)
+    TIMEOUT = (10, 60)
+
+    def __init__(
+        self,
+        host: str,
+        email: str,
+        api_key: str,
+        max_retries: int = MAX_RETRIES,
+        timeout: tuple[float, float] = TIMEOUT,
+    ):
         self.host = host
-        self.headers = {"Content-Type": "application/json"}
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+        # keeps connections alive between calls
+        self.session = requests.Session()
+        self.session.auth = HTTPBasicAuth(email, api_key)
+        self.session.headers["Content-Type"] = "application/json"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _retry_delay(self, response: requests.Response | None, attempt: int) -> float:
+        backoff = min(self.BACKOFF * 2**attempt, self.MAX_BACKOFF)
+
+        if response is None or not (retry_after := response.headers.get("Retry-After")):
+            return backoff
+
+        # either delta-seconds or an HTTP date
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+        try:
+            return max(
+                0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()
+            )
+        except (TypeError, ValueError):
+            return backoff
 
     def request(self, method: str, endpoint: str, **args):
         url = f"{self.host}/index.php?/api/v2/{endpoint}"
-        response = requests.request(
-            method, url, auth=self.auth, headers=self.headers, **args
-        )
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else NON_IDEMPOTENT_RETRY_STATUSES
+        args.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            response = None
 
-        response.raise_for_status()
+            try:
+                response = self.session.request(method, url, **args)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries or not (idempotent or _never_sent(e)):
+                    raise
+            else:
+                if (
+                    response.status_code not in retry_statuses
+                    or attempt == self.max_retries
+                ):
+                    response.raise_for_status()
+                    return response.json() if response.content else None
 
-        return response.json()
+            time.sleep(self._retry_delay(response, attempt))
 
     def get(self, endpoint: str, **args):
         return self.request("GET", endpoint, **args)
@@ -24,6 +107,26 @@ class TestRail:
     def post(self, endpoint: str, **args):
         return self.request("POST", endpoint, **args)
 
+    def paginate(self, endpoint: str, key: str, **filters) -> Iterator[dict]:
+        """Lazily walk a paginated endpoint, one page in memory at a time.
+
+        Also handles instances that still return a bare list.
+        """
+        filters.setdefault("limit", self.PAGE_SIZE)
+        endpoint = f"{endpoint}&{urlencode(filters)}"
+
+        while endpoint:
+            page = self.get(endpoint)
+
+            if isinstance(page, list):
+                yield from page
+                return
+
+            yield from page[key]
+
+            next_page = (page.get("_links") or {}).get("next")
+            endpoint = next_page.removeprefix("/api/v2/") if next_page else None
+
     def get_test_results_for_case(self, run_id: int, case_id: int):
         r = self.get(f"get_results_for_case/{run_id}/{case_id}")
 
@@ -32,6 +135,20 @@ class TestRail:
     def get_case(self, case_id: int):
         return self.get(f"get_case/{case_id}")
 
+    def get_cases(
+        self, project_id: int, suite_id: int | None = None, **filters
+    ) -> Iterator[dict]:
+        if suite_id is not None:
+            filters["suite_id"] = suite_id
+
+        return self.paginate(f"get_cases/{project_id}", "cases", **filters)
+
+    def get_results_for_run(self, run_id: int, **filters) -> Iterator[dict]:
+        return self.paginate(f"get_results_for_run/{run_id}", "results", **filters)
+
+    def get_tests(self, run_id: int, **filters) -> Iterator[dict]:
+        return self.paginate(f"get_tests/{run_id}", "tests", **filters)
+
     def add_results(self, test_id, test_results: dict):
         self.post(f"add_result/{test_id}", json=test_results)
 
@@ -0,0 +1,307 @@
+import html
+import importlib
+import inspect
+import json
+import math
+import pkgutil
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from pathlib import Path
+
+from playwright.sync_api import Page
+
+INSTRUMENTED_PACKAGES = ["pages", "components"]
+
+# log2 buckets from 1ms to ~65s, plus underflow/overflow
+BUCKETS_MS = [2**i for i in range(17)]
+
+
+@dataclass
+class ActionTiming:
+    test: str
+    action: str
+    depth: int
+    wall: float
+    own: float
+    sleep: float
+    retries: int
+    failed: bool
+
+
+@dataclass
+class _Frame:
+    action: str
+    start: float
+    children: float = 0.0
+    sleep: float = 0.0
+    retries: int = 0
+
+
+@dataclass
+class ActionTimer:
+    test: str = ""
+    records: list[ActionTiming] = field(default_factory=list)
+    stack: list[_Frame] = field(default_factory=list)
+    patched: list[tuple[object, str, object]] = field(default_factory=list)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.patched)
+
+    def enter(self, action: str):
+        self.stack.append(_Frame(action, time.perf_counter()))
+
+    def exit(self, failed: bool = False):
+        frame = self.stack.pop()
+        wall = time.perf_counter() - frame.start
+
+        if self.stack:
+            self.stack[-1].children += wall
+
+        self.records.append(
+            ActionTiming(
+                test=self.test,
+                action=frame.action,
+                depth=len(self.stack),
+                wall=wall,
+                own=wall - frame.children,
+                sleep=frame.sleep,
+                retries=frame.retries,
+                failed=failed,
+            )
+        )
+
+    def slept(self, seconds: float):
+        # a fixed sleep is spent in every action that's waiting on it
+        for frame in self.stack:
+            frame.sleep += seconds
+
+    def retried(self):
+        if self.stack:
+            self.stack[-1].retries += 1
+
+    def timed(self, action: str, func, *args, **kwargs):
+        self.enter(action)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            self.exit(failed=True)
+            raise
+        self.exit()
+        return result
+
+    def _wrap(self, action: str, func):
+        # context managers are timed on the way in and on the way out, the
+        # body of the `with` belongs to the caller
+        if inspect.isgeneratorfunction(inspect.unwrap(func)):
+
+            @wraps(func)
+            def timed_context(*args, **kwargs):
+                return _TimedContext(self, action, func(*args, **kwargs))
+
+            return timed_context
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            return self.timed(action, func, *args, **kwargs)
+
+        return timed
+
+    def _patch(self, owner, name: str, replacement):
+        self.patched.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, replacement)
+
+    def instrument(self, packages: list[str] = INSTRUMENTED_PACKAGES):
+        """Wrap every method defined on the page object and component classes.
+
+        Private helpers are included so waits like `_wait_for_loading` show up
+        on their own; dunders, static/class methods and properties are not.
+        """
+        for package in packages:
+            path = importlib.import_module(package).__path__
+
+            for info in pkgutil.iter_modules(path):
+                module = importlib.import_module(f"{package}.{info.name}")
+
+                for cls in vars(module).values():
+                    if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                        continue
+
+                    for name, attr in list(vars(cls).items()):
+                        if name.startswith("__") or not inspect.isfunction(attr):
+                            continue
+
+                        self._patch(
+                            cls, name, self._wrap(f"{cls.__name__}.{name}", attr)
+                        )
+
+        wait_for_timeout = Page.wait_for_timeout
+
+        @wraps(wait_for_timeout)
+        def timed_wait(page, timeout: float):
+            start = time.perf_counter()
+            try:
+                return wait_for_timeout(page, timeout)
+            finally:
+                self.slept(time.perf_counter() - start)
+
+        self._patch(Page, "wait_for_timeout", timed_wait)
+
+    def restore(self):
+        while self.patched:
+            owner, name, original = self.patched.pop()
+            setattr(owner, name, original)
+
+    def reset(self, test: str = ""):
+        self.test = test
+        self.stack.clear()
+
+
+class _TimedContext:
+    def __init__(self, timer: ActionTimer, action: str, context):
+        self.timer = timer
+        self.action = action
+        self.context = context
+
+    def __enter__(self):
+        return self.timer.timed(self.action, self.context.__enter__)
+
+    def __exit__(self, *exc_info):
+        return self.timer.timed(
+            f"{self.action}.__exit__", self.context.__exit__, *exc_info
+        )
+
+
+TIMER = ActionTimer()
+
+
+def record_retry():
+    """Count a retry against the innermost timed action (no-op when off)."""
+    TIMER.retried()
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    rank = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def histogram(values_ms: list[float]) -> list[int]:
+    counts = [0] * (len(BUCKETS_MS) + 1)
+
+    for value in values_ms:
+        index = next(
+            (i for i, edge in enumerate(BUCKETS_MS) if value < edge), len(BUCKETS_MS)
+        )
+        counts[index] += 1
+
+    return counts
+
+
+def summarize(records: list[ActionTiming]) -> dict:
+    def stats(group: list[ActionTiming]) -> dict:
+        wall = [r.wall * 1000 for r in group]
+
+        return {
+            "calls": len(group),
+            "failed": sum(r.failed for r in group),
+            "retries": sum(r.retries for r in group),
+            "total_ms": round(sum(wall), 1),
+            "own_ms": round(sum(r.own for r in group) * 1000, 1),
+            "sleep_ms": round(sum(r.sleep for r in group) * 1000, 1),
+            "p50_ms": round(percentile(wall, 50), 1),
+            "p95_ms": round(percentile(wall, 95), 1),
+            "max_ms": round(max(wall), 1),
+            "histogram": histogram(wall),
+        }
+
+    by_action = defaultdict(list)
+    by_test = defaultdict(lambda: defaultdict(list))
+
+    for record in records:
+        by_action[record.action].append(record)
+        by_test[record.test][record.action].append(record)
+
+    return {
+        "buckets_ms": BUCKETS_MS,
+        "actions": {action: stats(group) for action, group in by_action.items()},
+        "tests": {
+            test: {action: stats(group) for action, group in actions.items()}
+            for test, actions in by_test.items()
+        },
+    }
+
+
+def _table(actions: dict) -> str:
+    rows = []
+    ordered = sorted(actions.items(), key=lambda item: -item[1]["own_ms"])
+
+    for action, s in ordered:
+        peak = max(s["histogram"]) or 1
+        bars = "".join(
+            f'<span style="height:{round(20 * c / peak)}px" title="{c}"></span>'
+            for c in s["histogram"]
+        )
+        rows.append(
+            f"<tr><td>{html.escape(action)}</td><td>{s['calls']}</td>"
+            f"<td>{s['retries']}</td><td>{s['failed']}</td>"
+            f"<td>{s['total_ms']}</td><td>{s['own_ms']}</td><td>{s['sleep_ms']}</td>"
+            f"<td>{s['p50_ms']}</td><td>{s['p95_ms']}</td><td>{s['max_ms']}</td>"
+            f'<td class="hist">{bars}</td></tr>'
+        )
+
+    header = "".join(
+        f"<th>{h}</th>"
+        for h in [
+            "action", "calls", "retries", "failed", "total ms", "own ms",
+            "sleep ms", "p50 ms", "p95 ms", "max ms", "histogram",
+        ]
+    )  # fmt: skip
+
+    return f"<table><tr>{header}</tr>{''.join(rows)}</table>"
+
+
+def render_html(summary: dict) -> str:
+    edges = ", ".join(f"&lt;{b}" for b in summary["buckets_ms"])
+    sections = [
+        "<h1>Action timing</h1>",
+        f"<p>Histogram buckets (ms): {edges}, &ge;{summary['buckets_ms'][-1]}</p>",
+        "<h2>All tests</h2>",
+        _table(summary["actions"]),
+    ]
+
+    for test, actions in sorted(summary["tests"].items()):
+        sections.append(f"<h2>{html.escape(test or '(outside tests)')}</h2>")
+        sections.append(_table(actions))
+
+    style = (
+        "body{font:13px sans-serif}table{border-collapse:collapse;margin-bottom:24px}"
+        "td,th{border:1px solid #ddd;padding:2px 6px;text-align:right}"
+        "td:first-child{text-align:left}.hist{vertical-align:bottom;white-space:nowrap}"
+        ".hist span{display:inline-block;width:4px;margin-right:1px;background:#1677ff}"
+    )
+
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><style>{style}</style>"
+        f"</head><body>{''.join(sections)}</body></html>"
+    )
+
+
+def write_report(records: list[ActionTiming], directory: Path) -> dict:
+    summary = summarize(records)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "action-timing.json").write_text(json.dumps(summary, indent=2))
+    (directory / "action-timing.html").write_text(render_html(summary))
+
+    return summary
+
+
+def to_dicts(records: list[ActionTiming]) -> list[dict]:
+    return [asdict(record) for record in records]
+
+
+def from_dicts(records: list[dict]) -> list[ActionTiming]:
+    return [ActionTiming(**record) for record in records]